@@ -0,0 +1,196 @@
+"""
+Template commentary for FIFA Python 2019.
+
+The script printed its commentary inline, with an if statement per skill
+for each of the 25 sides of the skill roll, and built every line whether or
+not anyone read it. `Commentary` is a listener for the `fifa_events` stream
+that turns each event into text from a table of templates, keyed by the
+event's kind and its detail. Nothing is formatted until an event reaches a
+subscribed `Commentary`, so a simulation that subscribes none formats
+nothing, and a log of events kept with `list.append` can be put into words
+later with `Commentary.render`.
+
+Templates are `str.format` strings that may use these fields:
+    player, shirt, team: The player who acted, their number and team.
+    receiver, receiver_shirt, receiver_team: The player on the ball
+        afterwards, their number and team.
+    marker, marker_shirt: The opponent marking the player who acted.
+    skill: The name of the skill done.
+    barcelona, psg: The score afterwards.
+    minute: The minute of the match.
+
+Classes:
+    Commentary: Turns match events into lines of commentary.
+
+Functions:
+    main: The command-line entry point.
+
+Usage:
+    To read the commentary of a seeded headless match:
+    $ python fifa_commentary.py --seed 7
+"""
+import argparse
+import random
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from fifa_engine import BARCELONA, CROSS, PASS, PSG, SQUAD_SIZE, TEAM_NAMES, THROUGH_BALL, FifaEngine, attacking_action
+from fifa_events import DRAW, FROM_PENALTY, FROM_PLAY, MatchEvent
+
+# The name of the skill for each roll that keeps the ball, from 1 up.
+SKILL_MOVES = ('Akka', 'Around The World', 'Elastico', 'Neymar Rocket', 'Rainbow', 'Hocus Pocus', 'Matrix',
+               'Juggling', 'D-Trec', 'No Look Pass', 'Roulette Panna', 'Tornado Twist', 'Nutmeg', 'Stepovers',
+               'Whiplash', 'Scissor Move', 'Lizard', 'Heel Flick', 'Pro-Mora', 'Fake Shot')
+
+_DONE = 'done by {player} ( {shirt} ) !!!'
+_LOST = 'Skill Failed !! {} by {{receiver}} ( {{receiver_shirt}} ) of {{receiver_team}} !!'
+_SAVE = ('Commentatory: {receiver} saves it',)
+_GOAL = ('Commentatory: {player} scores!!! Goooooal!! Awesome!!! BARCELONA {barcelona} and PSG {psg}\n'
+         'Commentatory: Now {receiver} starts...',)
+
+# The line for each side of the skill roll, from 1 to SKILL_SIDES.
+SKILL_TEMPLATES = (
+    'Commentatory: What a beautiful {skill} ' + _DONE,
+    'Commentatory: Look at that {skill} ' + _DONE,
+    'Commentatory:OMG!! {skill} ' + _DONE,
+    'Commentatory: What a beautiful {skill} ' + _DONE,
+    'Commentatory: {skill} ' + _DONE,
+    'Commentatory:The astounding {skill} by {player} ( {shirt} ) !!!',
+    'Commentatory: What a beautiful {skill} ' + _DONE,
+    'Commentatory: Look at that {skill} ' + _DONE,
+    'Commentatory:OMG!! {skill} ' + _DONE,
+    'Commentatory: Unbelievable {skill} ' + _DONE,
+    'Commentatory: Remarkable {skill} ' + _DONE,
+    'Commentatory:The astounding {skill} by {player} ( {shirt} ) !!!',
+    'Commentatory: Ha Ha Ha !!! What a beautiful {skill} done by {player} ( {shirt} ) under {marker} '
+    '( {marker_shirt} ) !!!',
+    'Commentatory: Look at that {skill} ' + _DONE,
+    'Commentatory:OMG!! {skill} ' + _DONE,
+    'Commentatory: What a beautiful {skill} ' + _DONE,
+    'Commentatory: {skill} ' + _DONE,
+    'Commentatory:The astounding {skill} by {player} ( {shirt} ) !!!',
+    'Commentatory: What a beautiful {skill} ' + _DONE,
+    'Commentatory: Look at that {skill} ' + _DONE,
+    'Commentatory: Ha Ha Ha !!! ' + _LOST.format('Ball intercepted'),
+    'Commentatory: OH MY GOD!!! ' + _LOST.format('Ball intercepted'),
+    'Commentatory: Ha Ha Ha !!! ' + _LOST.format('Nice Interception'),
+    'Commentatory:What a Joke !!! ' + _LOST.format('Ball intercepted'),
+    'Commentatory: LOOK !!! ' + _LOST.format('Ball intercepted'),
+)
+
+# The lines each kind of event may be told with, by the event's detail. One
+# of a tuple's lines is picked at random.
+TEMPLATES: Dict[str, Dict[int, Tuple[str, ...]]] = {
+    'possession': {0: ('Commentatory: Ball intercepted by player {receiver} of {receiver_team}',)},
+    'pass': {
+        PASS: ('Commentatory: Pass to player {receiver} succesful !! Nice Pass man!!',
+               'Commentatory: Pass to player {receiver} succesful !!'),
+        CROSS: ('Commentatory: Cross to player {receiver} succesful !! WOW! What a trap!!',
+                'Commentatory: Cross to player {receiver} succesful !!'),
+        THROUGH_BALL: ('Commentatory: Through ball to player {receiver} succesful !! what ball man !! WOW!!',
+                       'Commentatory: Through ball to player {receiver} succesful !!'),
+    },
+    'shot': {FROM_PLAY: _SAVE, FROM_PENALTY: _SAVE},
+    'goal': {FROM_PLAY: _GOAL, FROM_PENALTY: _GOAL},
+    'foul': {0: ('Foul!! Penalty awarded to {receiver_team} !\n{receiver} is taking the penalty',)},
+    'skill': {roll: (template,) for roll, template in enumerate(SKILL_TEMPLATES, 1)},
+    'substitution': {0: ('Commentatory: {team} bring fresh legs on for {player} ( {shirt} )',)},
+    'full_time': {
+        BARCELONA: ('Commentatory: FULL TIME !! Barcelona wins {barcelona} to PSG {psg}',),
+        PSG: ('Commentatory: FULL TIME !! PSG wins {psg} to Barcelona {barcelona}',),
+        DRAW: ('Commentatory: FULL TIME !! Barcelona {barcelona} - {psg} PSG',),
+    },
+}
+
+
+class Commentary:
+    """
+    Turns match events into lines of commentary, from `TEMPLATES`.
+
+    Subscribe it to an `EventStream` to have every event told as it
+    happens.
+
+    Attributes:
+        rosters (Optional[Sequence[Roster]]): The `fifa_roster.Roster` of
+            each team, for the players' names. Without them, players are
+            called by their team and shirt number.
+        output (Callable[[str], None]): Receives each line told.
+        rng: The source of randomness for picking between templates.
+        templates (Dict[str, Dict[int, Tuple[str, ...]]]): The templates.
+    """
+
+    def __init__(self, rosters: Optional[Sequence] = None, output: Callable[[str], None] = print, rng=None,
+                 templates: Optional[Dict[str, Dict[int, Tuple[str, ...]]]] = None):
+        """
+        Initializes the commentary.
+
+        Args:
+            rosters (Optional[Sequence[Roster]]): The rosters, in team order.
+            output (Callable[[str], None]): Receives each line told.
+                Defaults to `print`.
+            rng: A `random.Random` or the `random` module. Defaults to the
+                `random` module.
+            templates (Optional[Dict[str, Dict[int, Tuple[str, ...]]]]):
+                Templates to use instead of `TEMPLATES`.
+        """
+        self.rosters = rosters
+        self.output = output
+        self.rng = random if rng is None else rng
+        self.templates = TEMPLATES if templates is None else templates
+
+    def name(self, team: int, shirt: int) -> str:
+        """Returns the name of whoever wears a shirt number for a team."""
+        if self.rosters is None:
+            return '{} {}'.format(TEAM_NAMES[team], shirt)
+        return self.rosters[team].name(shirt)
+
+    def render(self, event: MatchEvent) -> Optional[str]:
+        """
+        Tells an event in words.
+
+        Args:
+            event (MatchEvent): The event.
+
+        Returns:
+            Optional[str]: The commentary, which may run over several lines,
+            or None if there is no template for the event.
+        """
+        choices = self.templates.get(event.kind, {}).get(event.detail)
+        if not choices:
+            return None
+        template = choices[0] if len(choices) == 1 else self.rng.choice(choices)
+        marker_team = 1 - event.team
+        marker_shirt = SQUAD_SIZE + 1 - event.shirt
+        skill = SKILL_MOVES[event.detail - 1] if event.kind == 'skill' and event.detail <= len(SKILL_MOVES) else ''
+        return template.format(
+            player=self.name(event.team, event.shirt), shirt=event.shirt, team=TEAM_NAMES[event.team],
+            receiver=self.name(event.receiver_team, event.receiver), receiver_shirt=event.receiver,
+            receiver_team=TEAM_NAMES[event.receiver_team], marker=self.name(marker_team, marker_shirt),
+            marker_shirt=marker_shirt, skill=skill, barcelona=event.score[0], psg=event.score[1],
+            minute=event.minute)
+
+    def __call__(self, event: MatchEvent) -> None:
+        """Tells an event to the output, as a listener of an `EventStream`."""
+        text = self.render(event)
+        if text is not None:
+            self.output(text)
+
+
+def main() -> None:
+    """Parses the command line and prints the commentary of a headless match."""
+    parser = argparse.ArgumentParser(description='Print the commentary of a headless FIFA Python 2019 match.')
+    parser.add_argument('--seed', type=int, default=None, help='seed for the match')
+    args = parser.parse_args()
+
+    from fifa_roster import load_squads
+
+    squads = load_squads()
+    rng = random.Random(args.seed)
+    engine = FifaEngine(rng)
+    engine.events.subscribe(Commentary([squads[team] for team in TEAM_NAMES], rng=random.Random(args.seed)))
+    state = engine.state
+    while not state.is_over():
+        engine.step(attacking_action(engine))
+
+
+if __name__ == '__main__':
+    main()
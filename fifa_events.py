@@ -0,0 +1,120 @@
+"""
+The event stream of a FIFA Python 2019 match.
+
+The script reported the match by printing commentary in the middle of its
+rules. The engine reports it as a stream of small `MatchEvent` records
+instead, one for every action applied, which any number of listeners can
+subscribe to: the commentary in `fifa_commentary`, a list collecting a log,
+or a statistics counter. Nothing is built when nobody is subscribed, so a
+simulation that runs without listeners pays only for checking that the list
+of them is empty.
+
+Each event has one of these kinds:
+    possession: A pass was cut out and the other team has the ball.
+    pass: A pass reached a teammate. The detail is the pass action from
+        `fifa_engine`: PASS, CROSS or THROUGH_BALL.
+    shot: A shot or penalty was saved and the goalkeeper has the ball.
+    goal: A shot or penalty went in and the other captain kicks off.
+    foul: A foul was committed and the other captain takes a penalty.
+    skill: A skill was done. The detail is the skill roll, from 1 to
+        SKILL_SIDES in `fifa_engine`, which decides whether the ball is
+        kept, carried on or lost.
+    substitution: A fresh player came on for the shirt number.
+    full_time: The last minute was played. It follows the event of the
+        action that ended the match.
+
+For shot and goal events the detail is FROM_PENALTY for a penalty and
+FROM_PLAY otherwise. For full_time events it is the team that won, or DRAW.
+
+Classes:
+    MatchEvent: One thing that happened in a match.
+    EventStream: Sends events to the listeners subscribed to it.
+"""
+from typing import Callable, List, Tuple
+
+EVENT_KINDS = ('possession', 'pass', 'shot', 'goal', 'foul', 'skill', 'substitution', 'full_time')
+
+# The details of shot and goal events.
+FROM_PLAY = 0
+FROM_PENALTY = 1
+# The detail of a full_time event when neither team won; otherwise it is the
+# winning team.
+DRAW = 2
+
+
+class MatchEvent:
+    """
+    One thing that happened in a match, with who did it and who has the
+    ball afterwards.
+
+    Attributes:
+        kind (str): What happened, one of `EVENT_KINDS`.
+        minute (int): The minute of the match after the event.
+        team (int): The team that acted.
+        shirt (int): The shirt number of the player who acted.
+        receiver_team (int): The team on the ball afterwards.
+        receiver (int): The shirt number of the player on the ball
+            afterwards.
+        detail (int): More about the event, depending on its kind.
+        score (Tuple[int, int]): The goals of each team afterwards.
+    """
+
+    __slots__ = ('kind', 'minute', 'team', 'shirt', 'receiver_team', 'receiver', 'detail', 'score')
+
+    def __init__(self, kind: str, minute: int, team: int, shirt: int, receiver_team: int, receiver: int,
+                 detail: int = 0, score: Tuple[int, int] = (0, 0)):
+        """
+        Initializes an event.
+
+        Args:
+            kind (str): What happened.
+            minute (int): The minute after the event.
+            team (int): The team that acted.
+            shirt (int): The shirt number of the player who acted.
+            receiver_team (int): The team on the ball afterwards.
+            receiver (int): The player on the ball afterwards.
+            detail (int): More about the event.
+            score (Tuple[int, int]): The goals of each team afterwards.
+        """
+        self.kind = kind
+        self.minute = minute
+        self.team = team
+        self.shirt = shirt
+        self.receiver_team = receiver_team
+        self.receiver = receiver
+        self.detail = detail
+        self.score = score
+
+    def __repr__(self) -> str:
+        return ('MatchEvent({!r}, minute={}, team={}, shirt={}, receiver_team={}, receiver={}, detail={}, '
+                'score={})').format(self.kind, self.minute, self.team, self.shirt, self.receiver_team, self.receiver,
+                                    self.detail, self.score)
+
+
+class EventStream:
+    """
+    Sends each event to every listener, in the order they subscribed.
+
+    Producers should check `listeners` before building an event, so that
+    no event is made when nobody is listening.
+
+    Attributes:
+        listeners (List[Callable[[MatchEvent], None]]): The subscribers.
+    """
+
+    def __init__(self):
+        """Initializes a stream with no listeners."""
+        self.listeners: List[Callable[[MatchEvent], None]] = []
+
+    def subscribe(self, listener: Callable[[MatchEvent], None]) -> None:
+        """Adds a listener, which is called with every event from now on."""
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[MatchEvent], None]) -> None:
+        """Removes a listener."""
+        self.listeners.remove(listener)
+
+    def emit(self, event: MatchEvent) -> None:
+        """Sends an event to every listener."""
+        for listener in self.listeners:
+            listener(event)
@@ -0,0 +1,297 @@
+"""
+Stamina and fatigue for FIFA Python 2019.
+
+The script kept every player's stamina in a variable of its own, `hb1` to
+`hb11` for Barcelona and `hp1` to `hp11` for PSG, took points off them one if
+statement at a time and tested each against the tired and injured thresholds
+with ten more. `fifa_engine` and `fifa_season` then each kept a copy of the
+same rule over their own arrays. A `FatigueModel` is the one place it lives
+now: it keeps the stamina of any number of squads in one NumPy array of
+shape (squads, players), so a tick of a whole tournament is one array
+subtraction, and the tired and injured players are found with a single
+comparison of that array against the thresholds of every player. The engine
+keeps a model of its two squads, and a season batch one of two squads per
+match.
+
+A player is tired below TIRED of their full stamina and injured below
+INJURED of it. Players who cannot be substituted, such as the captains, can
+be made exempt, and are then never reported as either, since the warnings
+only exist to ask for a substitution.
+
+Classes:
+    FatigueEvents: The players who became tired or injured in an update.
+    FatigueModel: The stamina of many squads, updated a tick at a time.
+"""
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+# Every player's full stamina, unless a squad file gives their own.
+STAMINA = 10
+# The fractions of full stamina below which a player is tired or injured.
+TIRED = 0.3
+INJURED = 0.2
+
+# The index of each threshold along the first axis of `FatigueModel.limits`.
+_TIRED = 0
+_INJURED = 1
+
+
+class FatigueEvents:
+    """
+    The players who crossed a threshold in one update.
+
+    Attributes:
+        tired (np.ndarray): (squad, shirt number) rows of the players who
+            became tired.
+        injured (np.ndarray): (squad, shirt number) rows of the players who
+            became injured.
+    """
+
+    __slots__ = ('tired', 'injured')
+
+    def __init__(self, tired: np.ndarray, injured: np.ndarray):
+        """
+        Initializes the events.
+
+        Args:
+            tired (np.ndarray): The newly tired players, of shape (n, 2).
+            injured (np.ndarray): The newly injured players, of shape (n, 2).
+        """
+        self.tired = tired
+        self.injured = injured
+
+    def __bool__(self) -> bool:
+        """Returns whether any player crossed a threshold."""
+        return len(self.tired) > 0 or len(self.injured) > 0
+
+
+class FatigueModel:
+    """
+    The stamina of many squads, with their tired and injured thresholds.
+
+    Attributes:
+        capacity (np.ndarray): Each player's full stamina, of shape
+            (squads, players), by shirt number minus one.
+        stamina (np.ndarray): Each player's stamina now, of the same shape.
+        limits (np.ndarray): The tired and injured thresholds of every
+            player, of shape (2, squads, players). Exempt players have
+            thresholds of minus infinity, so they never cross them.
+        exempt (np.ndarray): A mask of the shirt numbers that are never
+            reported, of shape (players,).
+    """
+
+    def __init__(self, capacity, tired: float = TIRED, injured: float = INJURED, exempt: Iterable[int] = ()):
+        """
+        Initializes a model with every player at full stamina.
+
+        Args:
+            capacity: Each player's full stamina, as an array of shape
+                (squads, players).
+            tired (float): The fraction of full stamina below which a player
+                is tired.
+            injured (float): The fraction below which a player is injured.
+            exempt (Iterable[int]): The shirt numbers that are never reported.
+
+        Raises:
+            ValueError: If the capacity is not a row of stamina per squad.
+        """
+        capacity = np.array(capacity, dtype=np.float64, ndmin=2)
+        if capacity.ndim != 2:
+            raise ValueError('Stamina needs a row per squad and a column per shirt number')
+        self.capacity = capacity
+        self.stamina = capacity.copy()
+        self.exempt = np.zeros(capacity.shape[1], dtype=bool)
+        self.exempt[[shirt - 1 for shirt in exempt]] = True
+        self.limits = np.array([tired, injured])[:, None, None] * capacity
+        self.limits[:, :, self.exempt] = -np.inf
+        self._levels = self._compare()
+
+    @classmethod
+    def for_rosters(cls, rosters: Sequence, **thresholds) -> 'FatigueModel':
+        """
+        Creates a model with a squad for each roster, at its players' stamina.
+
+        Args:
+            rosters (Sequence[Roster]): The `fifa_roster.Roster` of each squad,
+                in squad order.
+            **thresholds: The tired, injured and exempt arguments.
+
+        Returns:
+            FatigueModel: The new model.
+        """
+        return cls([roster.stamina() for roster in rosters], **thresholds)
+
+    @classmethod
+    def uniform(cls, squads: int, players: int, stamina: float = STAMINA, **thresholds) -> 'FatigueModel':
+        """
+        Creates a model of squads whose players all have the same stamina.
+
+        Args:
+            squads (int): The number of squads.
+            players (int): The number of players in each squad.
+            stamina (float): Every player's full stamina.
+            **thresholds: The tired, injured and exempt arguments.
+
+        Returns:
+            FatigueModel: The new model.
+        """
+        return cls(np.full((squads, players), stamina), **thresholds)
+
+    @property
+    def squads(self) -> int:
+        """Returns the number of squads."""
+        return self.stamina.shape[0]
+
+    def copy(self) -> 'FatigueModel':
+        """Returns an independent copy of the model."""
+        other = FatigueModel.__new__(FatigueModel)
+        # The full stamina and the thresholds never change, so copies share them.
+        other.capacity = self.capacity
+        other.limits = self.limits
+        other.exempt = self.exempt
+        other.stamina = self.stamina.copy()
+        other._levels = self._levels.copy()
+        return other
+
+    def _compare(self) -> np.ndarray:
+        """
+        Finds how far below the thresholds every player is, with one comparison.
+
+        Returns:
+            np.ndarray: A boolean array of shape (2, squads, players) holding
+            whether each player is below the tired and the injured threshold.
+        """
+        return self.stamina < self.limits
+
+    def _flat(self, squads, shirts) -> np.ndarray:
+        """Turns squads and shirt numbers into indexes of the flattened stamina."""
+        squads, shirts = np.broadcast_arrays(np.atleast_1d(squads), np.atleast_1d(shirts))
+        return squads.astype(np.intp) * self.stamina.shape[1] + shirts - 1
+
+    def _players(self, flat: np.ndarray) -> np.ndarray:
+        """Turns indexes of the flattened stamina into (squad, shirt number) rows."""
+        squads, columns = np.divmod(flat, self.stamina.shape[1])
+        return np.stack([squads, columns + 1], axis=-1)
+
+    def tick(self, spent) -> FatigueEvents:
+        """
+        Takes a tick's stamina off every player at once.
+
+        Args:
+            spent: The stamina each player spent, as an array of shape
+                (squads, players) or anything that broadcasts to it.
+
+        Returns:
+            FatigueEvents: The players who became tired or injured.
+        """
+        self.stamina -= spent
+        before = self._levels
+        self._levels = self._compare()
+        crossed = self._levels & ~before
+        tired = np.argwhere(crossed[_TIRED])
+        injured = np.argwhere(crossed[_INJURED])
+        tired[:, 1] += 1
+        injured[:, 1] += 1
+        return FatigueEvents(tired, injured)
+
+    def spend(self, squads, shirts, amount: float = 1, distinct: bool = False) -> FatigueEvents:
+        """
+        Takes stamina off particular players, such as those who got the ball.
+        A player listed more than once spends the amount each time.
+
+        Args:
+            squads: The squad of each player, as an int or an array.
+            shirts: The shirt number of each player, the same shape.
+            amount (float): The stamina each of them spends, or an array of
+                amounts of the same shape.
+            distinct (bool): Whether no player is listed twice, as when each
+                squad lists at most one, which saves merging the repeats.
+
+        Returns:
+            FatigueEvents: The players who became tired or injured, each
+            reported once.
+        """
+        flat = self._flat(squads, shirts)
+        stamina = self.stamina.reshape(-1)
+        if distinct:
+            stamina[flat] -= amount
+            return self._update(flat)
+        np.subtract.at(stamina, flat, amount)
+        return self._update(np.unique(flat))
+
+    def spend_player(self, squad: int, shirt: int, amount: float = 1) -> bool:
+        """
+        Takes stamina off one player, without building any arrays.
+
+        This is `spend` for a single player, for callers such as
+        `fifa_engine` that update one player at a time.
+
+        Args:
+            squad (int): The player's squad.
+            shirt (int): The player's shirt number.
+            amount (float): The stamina spent.
+
+        Returns:
+            bool: Whether the player is now injured.
+        """
+        column = shirt - 1
+        stamina = self.stamina[squad, column] - amount
+        self.stamina[squad, column] = stamina
+        levels = self._levels
+        limits = self.limits
+        levels[_TIRED, squad, column] = stamina < limits[_TIRED, squad, column]
+        injured = stamina < limits[_INJURED, squad, column]
+        levels[_INJURED, squad, column] = injured
+        return bool(injured)
+
+    def restore(self, squads, shirts) -> None:
+        """
+        Puts players back to full stamina, as when they are substituted.
+
+        Args:
+            squads: The squad of each player, as an int or an array.
+            shirts: The shirt number of each player, the same shape.
+        """
+        flat = self._flat(squads, shirts)
+        self.stamina.reshape(-1)[flat] = self.capacity.reshape(-1).take(flat)
+        self._update(flat)
+
+    def _update(self, flat: np.ndarray) -> FatigueEvents:
+        """
+        Compares changed players against their thresholds and records their new state.
+
+        Only the changed players are compared, one threshold at a time
+        through flat indexes, which gathers far less than indexing the whole
+        arrays by squad and column.
+        """
+        stamina = self.stamina.reshape(-1).take(flat)
+        crossed = []
+        for levels, limits in zip(self._levels.reshape(2, -1), self.limits.reshape(2, -1)):
+            after = stamina < limits.take(flat)
+            crossed.append(self._players(flat[after & ~levels.take(flat)]))
+            levels[flat] = after
+        return FatigueEvents(*crossed)
+
+    def tired(self, squad: int) -> List[int]:
+        """Returns the shirt numbers in a squad below the tired threshold."""
+        return [int(column) + 1 for column in np.flatnonzero(self._levels[_TIRED, squad])]
+
+    def injured(self, squad: int) -> List[int]:
+        """Returns the shirt numbers in a squad below the injured threshold."""
+        return [int(column) + 1 for column in np.flatnonzero(self._levels[_INJURED, squad])]
+
+    def injured_mask(self, squads: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Returns which players are injured.
+
+        Args:
+            squads (Optional[np.ndarray]): The squads to look at. Defaults to
+                all of them.
+
+        Returns:
+            np.ndarray: A mask of shape (len(squads), players).
+        """
+        if squads is None:
+            return self._levels[_INJURED].copy()
+        return self._levels[_INJURED].take(squads, axis=0)
@@ -0,0 +1,168 @@
+"""
+Player positions on the FIFA Python 2019 pitch.
+
+The script placed all 22 players for every frame it drew with a separate
+`random.randint(h*a, h*b)` call per coordinate, from lists of ranges it
+picked between. The ranges only ever form three layouts: open play, and the
+lines the players take up for a penalty to either team. A `Formation` holds
+one of them as NumPy arrays of the lowest and highest
+coordinate of every player, so placing the 22 players for a frame is one
+vectorized draw, and thousands of frames for a simulation or a heatmap are
+one draw more.
+
+Positions are arrays of shape (2, SQUAD_SIZE, 2), indexed by the team as in
+`fifa_engine`, the shirt number minus one, and x or y. They are in the
+script's pitch units, already multiplied by its scale `h`, with PSG's goal on
+the left at x = 0 and Barcelona's on the right.
+
+Classes:
+    Formation: The ranges each player is placed in for one kind of frame.
+
+Functions:
+    formation_for: Returns the formation for a state of the match.
+    heatmap: Counts how often players stood in each cell of the pitch.
+"""
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from fifa_engine import BARCELONA, PSG, SQUAD_SIZE, MatchState
+
+# The script's `h`, which every pitch coordinate is multiplied by.
+SCALE = 2
+
+# The lowest and highest x and y of the pitch drawing, with the goal areas.
+PITCH_X = (-10 * SCALE, 110 * SCALE)
+PITCH_Y = (-5 * SCALE, 105 * SCALE)
+
+# The y range of each shirt number, which both teams keep to in every
+# formation.
+LANES = ((40, 60), (0, 15), (30, 45), (55, 70), (85, 100), (0, 20), (40, 60), (80, 100), (15, 30),
+         (45, 55), (70, 85))
+
+Box = Tuple[Tuple[int, int], Tuple[int, int]]
+
+
+def _boxes(xs: Sequence[Tuple[int, int]], ys: Sequence[Tuple[int, int]] = LANES) -> Tuple[Box, ...]:
+    """Pairs the x and y ranges of a team's shirt numbers into boxes."""
+    return tuple(zip(xs, ys))
+
+
+class Formation:
+    """
+    The box each player is placed in for one kind of frame.
+
+    Attributes:
+        name (str): The name the formation is registered under.
+        low (np.ndarray): The lowest coordinates, of shape (2, SQUAD_SIZE, 2).
+        high (np.ndarray): The highest coordinates, of the same shape.
+    """
+
+    def __init__(self, name: str, barcelona: Sequence[Box], psg: Sequence[Box]):
+        """
+        Initializes a formation from boxes in the script's unscaled units.
+
+        Args:
+            name (str): The name of the formation.
+            barcelona (Sequence[Box]): The ((x low, x high), (y low, y high))
+                box of each Barcelona shirt number, in order.
+            psg (Sequence[Box]): The same for PSG.
+
+        Raises:
+            ValueError: If a team does not have a box for every player, or a
+                box is empty.
+        """
+        if len(barcelona) != SQUAD_SIZE or len(psg) != SQUAD_SIZE:
+            raise ValueError('A formation needs a box for each of the {} players'.format(SQUAD_SIZE))
+        boxes = np.zeros((2, SQUAD_SIZE, 2, 2), dtype=np.int64)
+        boxes[BARCELONA] = barcelona
+        boxes[PSG] = psg
+        boxes *= SCALE
+        if (boxes[..., 0] > boxes[..., 1]).any():
+            raise ValueError('Formation {} has a box whose low end is above its high end'.format(name))
+        self.name = name
+        self.low = boxes[..., 0]
+        self.high = boxes[..., 1]
+
+    def sample(self, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Places all 22 players for one frame.
+
+        Args:
+            rng (Optional[np.random.Generator]): The source of randomness.
+                Defaults to a new generator.
+
+        Returns:
+            np.ndarray: Integer positions of shape (2, SQUAD_SIZE, 2).
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        return rng.integers(self.low, self.high, endpoint=True)
+
+    def sample_frames(self, count: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Places all 22 players for many frames at once.
+
+        Args:
+            count (int): The number of frames.
+            rng (Optional[np.random.Generator]): The source of randomness.
+                Defaults to a new generator.
+
+        Returns:
+            np.ndarray: Integer positions of shape (count, 2, SQUAD_SIZE, 2).
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        return rng.integers(self.low, self.high, size=(count,) + self.low.shape, endpoint=True)
+
+    def centres(self) -> np.ndarray:
+        """Returns the middle of every player's box, of shape (2, SQUAD_SIZE, 2)."""
+        return (self.low + self.high) / 2
+
+
+OPEN_PLAY = Formation(
+    'open_play',
+    _boxes(((95, 95),) + ((70, 90),) * 4 + ((45, 65),) * 3 + ((15, 40), (10, 35), (15, 40))),
+    _boxes(((5, 5),) + ((10, 30),) * 4 + ((35, 55),) * 3 + ((60, 85), (65, 90), (60, 85))),
+)
+# Everyone lines up between the taker and the goal being shot at, with
+# Barcelona's captain standing apart.
+PENALTY_PSG = Formation(
+    'penalty_psg',
+    _boxes(((95, 95),) + ((50, 60),) * 8 + ((80, 80), (50, 60)), LANES[:9] + ((50, 50), LANES[10])),
+    _boxes(((5, 5),) + ((50, 60),) * 10),
+)
+PENALTY_BARCELONA = Formation(
+    'penalty_barcelona',
+    _boxes(((95, 95),) + ((40, 50),) * 8 + ((20, 20), (40, 50)), LANES[:9] + ((50, 50), LANES[10])),
+    _boxes(((5, 5),) + ((40, 50),) * 10),
+)
+
+FORMATIONS = {formation.name: formation for formation in (OPEN_PLAY, PENALTY_PSG, PENALTY_BARCELONA)}
+
+
+def formation_for(state: MatchState) -> Formation:
+    """Returns the formation the players take up in a state of the match."""
+    if not state.penalty:
+        return OPEN_PLAY
+    return PENALTY_BARCELONA if state.possession == BARCELONA else PENALTY_PSG
+
+
+def heatmap(frames: np.ndarray, team: int, shirt: Optional[int] = None,
+            bins: Tuple[int, int] = (24, 22)) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Counts how often a team's players stood in each cell of the pitch.
+
+    Args:
+        frames (np.ndarray): Positions from `Formation.sample_frames`, of
+            shape (count, 2, SQUAD_SIZE, 2).
+        team (int): The team to count.
+        shirt (Optional[int]): Counts only this shirt number. Defaults to
+            the whole team.
+        bins (Tuple[int, int]): The number of cells along x and y.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The counts, of shape
+        bins, and the cell edges along x and y.
+    """
+    players = frames[:, team] if shirt is None else frames[:, team, shirt - 1:shirt]
+    points = players.reshape(-1, 2)
+    return np.histogram2d(points[:, 0], points[:, 1], bins=bins, range=(PITCH_X, PITCH_Y))
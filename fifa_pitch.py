@@ -0,0 +1,228 @@
+"""
+A reusable matplotlib pitch for FIFA Python 2019.
+
+The script used to build a new figure for every frame: a fresh
+`pl.subplots()`, a new `LineCollection` for the pitch lines, five scatter
+calls and a blocking `plt.show()`. None of the figures were ever closed.
+A `PitchRenderer` builds the figure, the pitch and one scatter per group of
+players once, and every frame after that only moves the players with
+`set_offsets`. The pitch is rendered once and kept as a background, so a
+frame restores it and redraws just the players.
+
+Modes:
+    window: Shows the pitch in a window that is updated in place, without
+        blocking the game.
+    offscreen: Renders into an Agg buffer only, for saving frames or running
+        without a display. `frame` returns the pixels.
+    off: Draws nothing at all.
+
+`PitchRenderer.from_environment` reads the mode from the FIFA_PITCH
+environment variable. Window mode falls back to offscreen when matplotlib
+is using a backend that cannot show windows.
+
+Classes:
+    PitchRenderer: Draws frames of player positions on one persistent pitch.
+
+Usage:
+    To play the script without any pitch windows:
+    $ FIFA_PITCH=off python "FIFA Python 2019 (Version-5.1.19).py"
+"""
+import os
+from typing import List, Optional
+
+import numpy as np
+
+from fifa_engine import BARCELONA, PSG
+from fifa_formation import PITCH_X, PITCH_Y, SCALE
+
+MODES = ('window', 'offscreen', 'off')
+DEFAULT_MODE = 'window'
+MODE_VARIABLE = 'FIFA_PITCH'
+
+# Backends that can only render to files or buffers.
+NON_INTERACTIVE_BACKENDS = ('agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template')
+
+# The pitch outline, halfway line and goals, in the script's unscaled units.
+PITCH_LINES = (
+    ((0, 35), (0, 65)), ((100, 35), (100, 65)), ((50, 105), (50, -5)), ((-10, 105), (110, 105)),
+    ((-10, -5), (110, -5)), ((-10, 105), (-10, -5)), ((110, 105), (110, -5)), ((0, 35), (-10, 35)),
+    ((0, 65), (-10, 65)), ((100, 35), (110, 35)), ((100, 65), (110, 65)),
+)
+# The fraction of the pitch's size left around it, as `ax.margins(0.1)` did.
+MARGIN = 0.1
+
+# The marker, goalkeeper color and outfield color of each team.
+TEAM_STYLES = {
+    BARCELONA: ('o', 'violet', 'red'),
+    PSG: ('*', 'purple', 'blue'),
+}
+
+TITLE = 'FIFA PYTHON 18\nPSG(BLUE) VS BARCELONA(RED)'
+X_LABEL = 'Neymar! Neymar! Neymar! Neymar! Neymar! Neymar! Neymar! Neymar! '
+Y_LABEL = 'Messi! Messi! Messi! Messi! Messi! Messi!'
+
+_EMPTY = np.empty((0, 2))
+
+
+class PitchRenderer:
+    """
+    Draws frames of player positions on a pitch that is built only once.
+
+    Attributes:
+        mode (str): How frames are drawn, one of `MODES`.
+        figure: The matplotlib figure, or None in off mode.
+        frames (int): The number of frames drawn.
+        recorders (List): The replay writers each frame is written to.
+    """
+
+    def __init__(self, mode: str = DEFAULT_MODE, dpi: float = 100):
+        """
+        Initializes a renderer and builds the pitch.
+
+        Args:
+            mode (str): The name of the mode.
+            dpi (float): The resolution of the figure.
+
+        Raises:
+            ValueError: If the mode is not one of `MODES`.
+        """
+        if mode not in MODES:
+            raise ValueError('Unknown pitch mode: {} (expected one of {})'.format(mode, ', '.join(MODES)))
+        self.frames = 0
+        self.figure = None
+        self.recorders: List = []
+        self._background = None
+        if mode == 'off':
+            self.mode = mode
+            return
+
+        from matplotlib import collections
+
+        if mode == 'window':
+            import matplotlib.pyplot as plt
+
+            if plt.get_backend().lower() in NON_INTERACTIVE_BACKENDS:
+                mode = 'offscreen'
+            else:
+                self._pyplot = plt
+                self.figure = plt.figure(dpi=dpi)
+        if mode == 'offscreen':
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            self.figure = Figure(dpi=dpi)
+            FigureCanvasAgg(self.figure)
+        self.mode = mode
+
+        axes = self.figure.add_subplot()
+        self.axes = axes
+        axes.set_facecolor((0.8, 1, 0.5))
+        lines = np.array(PITCH_LINES) * SCALE
+        axes.add_collection(collections.LineCollection(lines, colors=(1, 0, 0, 1), linewidths=1))
+        x_margin = (PITCH_X[1] - PITCH_X[0]) * MARGIN
+        y_margin = (PITCH_Y[1] - PITCH_Y[0]) * MARGIN
+        axes.set_xlim(PITCH_X[0] - x_margin, PITCH_X[1] + x_margin)
+        axes.set_ylim(PITCH_Y[0] - y_margin, PITCH_Y[1] + y_margin)
+        axes.set_xlabel(X_LABEL)
+        axes.set_ylabel(Y_LABEL)
+        axes.set_title(TITLE)
+
+        self._keepers = {}
+        self._outfield = {}
+        self._carriers = {}
+        for team, (marker, keeper_color, outfield_color) in TEAM_STYLES.items():
+            self._keepers[team] = axes.scatter([], [], color=keeper_color, marker=marker, s=100, animated=True)
+            self._outfield[team] = axes.scatter([], [], color=outfield_color, marker=marker, s=80, animated=True)
+            self._carriers[team] = axes.scatter([], [], color='black', marker=marker, s=110, animated=True)
+        self._artists = list(self._keepers.values()) + list(self._outfield.values()) + list(self._carriers.values())
+        self.figure.canvas.mpl_connect('draw_event', self._on_draw)
+
+    @classmethod
+    def from_environment(cls, default: str = DEFAULT_MODE) -> 'PitchRenderer':
+        """
+        Creates a renderer in the mode named by the FIFA_PITCH environment variable.
+
+        Args:
+            default (str): The mode to use when the variable is not set.
+
+        Returns:
+            PitchRenderer: The new renderer.
+        """
+        return cls(os.environ.get(MODE_VARIABLE, default).strip().lower())
+
+    def record(self, writer) -> None:
+        """
+        Writes every frame drawn from now on into a replay.
+
+        Args:
+            writer: A `fifa_replay` writer, or anything with a `write` method
+                that takes the RGBA pixels of a frame.
+
+        Raises:
+            ValueError: If the pitch is off, so there are no frames.
+        """
+        if self.figure is None:
+            raise ValueError('A pitch in off mode has no frames to record')
+        self.recorders.append(writer)
+
+    def _on_draw(self, event) -> None:
+        """Keeps the freshly rendered pitch as the background, and puts the players back on it."""
+        canvas = self.figure.canvas
+        self._background = canvas.copy_from_bbox(self.figure.bbox)
+        for artist in self._artists:
+            self.axes.draw_artist(artist)
+
+    def draw(self, positions: np.ndarray, team: Optional[int] = None, shirt: Optional[int] = None) -> None:
+        """
+        Moves the players to a frame's positions and highlights the player on the ball.
+
+        Args:
+            positions (np.ndarray): Positions from `Formation.sample`, of shape
+                (2, SQUAD_SIZE, 2).
+            team (Optional[int]): The team on the ball, or None for no
+                highlight.
+            shirt (Optional[int]): The shirt number of the player on the ball.
+        """
+        if self.figure is None:
+            return
+        for side in TEAM_STYLES:
+            self._keepers[side].set_offsets(positions[side, :1])
+            self._outfield[side].set_offsets(positions[side, 1:])
+            self._carriers[side].set_offsets(positions[side, shirt - 1:shirt] if side == team else _EMPTY)
+
+        canvas = self.figure.canvas
+        if self._background is None:
+            if self.mode == 'window':
+                self._pyplot.show(block=False)
+            canvas.draw()
+        else:
+            canvas.restore_region(self._background)
+            for artist in self._artists:
+                self.axes.draw_artist(artist)
+        if self.mode == 'window':
+            canvas.blit(self.figure.bbox)
+            canvas.flush_events()
+        self.frames += 1
+        if self.recorders:
+            pixels = np.asarray(canvas.buffer_rgba())
+            for writer in self.recorders:
+                writer.write(pixels)
+
+    def frame(self) -> Optional[np.ndarray]:
+        """
+        Returns the pixels of the last frame drawn.
+
+        Returns:
+            Optional[np.ndarray]: An RGBA array of shape (height, width, 4),
+            or None in off mode.
+        """
+        if self.figure is None:
+            return None
+        return np.array(self.figure.canvas.buffer_rgba())
+
+    def close(self) -> None:
+        """Closes the figure, after which nothing more is drawn or recorded. The replays are left open."""
+        if self.figure is not None and self.mode == 'window':
+            self._pyplot.close(self.figure)
+        self.figure = None
+        self._background = None
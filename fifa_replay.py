@@ -0,0 +1,300 @@
+"""
+GIF and MP4 replays of FIFA Python 2019 matches.
+
+A replay writer takes the RGBA pixels of each pitch frame, as returned by
+`PitchRenderer.frame`, and encodes them into the file straight away, so only
+the frame being written and the one before it are ever held in memory,
+however long the match.
+
+    GifWriter: Maps every frame onto the palette of the first one and writes
+        only the rectangle that changed since the frame before, which on a
+        pitch that never moves is little more than the players.
+    Mp4Writer: Pipes the raw frames to ffmpeg, which encodes them as H.264.
+        It needs the ffmpeg program that matplotlib's animations use.
+
+A `PitchRenderer` records every frame it draws into the writers passed to
+`PitchRenderer.record`. `record_match` plays a headless match on the engine
+and draws each turn's formation on an offscreen pitch, so a whole match is
+encoded in a few seconds. The script saves a replay of the match being
+played when the FIFA_REPLAY environment variable names a file, drawing the
+pitch offscreen if FIFA_PITCH turned it off. A replay closed before any
+frame was written leaves no file behind.
+
+Classes:
+    GifWriter: Streams frames into an animated GIF.
+    Mp4Writer: Streams frames into an MP4 video through ffmpeg.
+
+Functions:
+    open_replay: Opens the writer for a replay file, by its extension.
+    replay_from_environment: Opens the file named by FIFA_REPLAY, if any.
+    record_match: Plays a headless match and records it to a replay.
+    main: The command-line entry point.
+
+Usage:
+    To save a replay of a seeded match, or of the match you play:
+    $ python fifa_replay.py match.gif --seed 7
+    $ FIFA_REPLAY=match.gif python "FIFA Python 2019 (Version-5.1.19).py"
+"""
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import time
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from fifa_engine import MATCH_MINUTES, TEAM_NAMES, FifaEngine, MatchState, attacking_action
+from fifa_formation import formation_for
+
+REPLAY_VARIABLE = 'FIFA_REPLAY'
+DEFAULT_FPS = 4
+# The most colors a GIF palette can hold.
+GIF_COLORS = 256
+
+
+class GifWriter:
+    """
+    Streams frames into an animated GIF that loops forever.
+
+    Attributes:
+        path (str): The file being written.
+        fps (float): The frames shown per second.
+        frames (int): The number of frames written.
+    """
+
+    def __init__(self, path: str, fps: float = DEFAULT_FPS):
+        """
+        Initializes a writer and creates the file.
+
+        Args:
+            path (str): The .gif file to write.
+            fps (float): The frames shown per second.
+        """
+        from PIL import GifImagePlugin, Image
+
+        self._gif = GifImagePlugin
+        self._image = Image
+        self.path = path
+        self.fps = fps
+        self.frames = 0
+        self._duration = int(round(1000 / fps))
+        self._file = open(path, 'wb')
+        self._palette = None
+        self._previous: Optional[np.ndarray] = None
+
+    def write(self, frame: np.ndarray) -> None:
+        """
+        Adds a frame to the end of the GIF.
+
+        Args:
+            frame (np.ndarray): RGBA or RGB pixels of shape (height, width,
+                channels), all frames the same size.
+
+        Raises:
+            ValueError: If the frame is not the size of the first one.
+        """
+        image = self._image.fromarray(np.ascontiguousarray(frame[..., :3]))
+        if self._palette is None:
+            self._palette = image.quantize(colors=GIF_COLORS)
+        image = image.quantize(palette=self._palette, dither=self._image.Dither.NONE)
+        indices = np.asarray(image)
+        if self._previous is None:
+            header, _ = self._gif.getheader(image, None, {'loop': 0, 'optimize': False})
+            self._file.write(b''.join(header))
+            box = (0, 0, image.width, image.height)
+        elif indices.shape != self._previous.shape:
+            raise ValueError('Frame {} is {}x{}, not {}x{} like the first'.format(
+                self.frames, indices.shape[1], indices.shape[0], self._previous.shape[1], self._previous.shape[0]))
+        else:
+            changed = indices != self._previous
+            rows = np.flatnonzero(changed.any(axis=1))
+            columns = np.flatnonzero(changed.any(axis=0))
+            if len(rows):
+                box = (int(columns[0]), int(rows[0]), int(columns[-1]) + 1, int(rows[-1]) + 1)
+            else:
+                box = (0, 0, 1, 1)
+        # Each frame is drawn over the last one, so only the changed box is stored.
+        data = self._gif.getdata(image.crop(box), box[:2], duration=self._duration, disposal=1, optimize=False)
+        self._file.write(b''.join(data))
+        self._previous = indices
+        self.frames += 1
+
+    def close(self) -> None:
+        """Ends the GIF and closes the file, or removes the file if no frame was written."""
+        if self._file.closed:
+            return
+        if not self.frames:
+            self._file.close()
+            os.remove(self.path)
+            return
+        self._file.write(b';')
+        self._file.close()
+
+
+class Mp4Writer:
+    """
+    Streams frames into an H.264 MP4 video through ffmpeg.
+
+    Attributes:
+        path (str): The file being written.
+        fps (float): The frames shown per second.
+        frames (int): The number of frames written.
+    """
+
+    def __init__(self, path: str, fps: float = DEFAULT_FPS):
+        """
+        Initializes a writer. ffmpeg is started with the first frame, once
+        the size of the video is known.
+
+        Args:
+            path (str): The .mp4 file to write.
+            fps (float): The frames shown per second.
+
+        Raises:
+            RuntimeError: If ffmpeg cannot be found.
+        """
+        from matplotlib import rcParams
+
+        self.ffmpeg = shutil.which(rcParams['animation.ffmpeg_path'])
+        if self.ffmpeg is None:
+            raise RuntimeError('MP4 replays need ffmpeg, which was not found; save a .gif instead')
+        self.path = path
+        self.fps = fps
+        self.frames = 0
+        self._process: Optional[subprocess.Popen] = None
+        self._shape = None
+
+    def write(self, frame: np.ndarray) -> None:
+        """
+        Adds a frame to the end of the video.
+
+        Args:
+            frame (np.ndarray): RGBA pixels of shape (height, width, 4), all
+                frames the same size.
+
+        Raises:
+            ValueError: If the frame is not the size of the first one.
+        """
+        if self._process is None:
+            self._shape = frame.shape
+            height, width = frame.shape[:2]
+            self._process = subprocess.Popen(
+                [self.ffmpeg, '-loglevel', 'error', '-y', '-f', 'rawvideo', '-pix_fmt', 'rgba',
+                 '-s', '{}x{}'.format(width, height), '-r', str(self.fps), '-i', '-',
+                 # H.264 needs an even width and height.
+                 '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-vcodec', 'libx264', '-pix_fmt', 'yuv420p', self.path],
+                stdin=subprocess.PIPE)
+        elif frame.shape != self._shape:
+            raise ValueError('Frame {} is shaped {}, not {} like the first'.format(self.frames, frame.shape, self._shape))
+        self._process.stdin.write(np.ascontiguousarray(frame, dtype=np.uint8).tobytes())
+        self.frames += 1
+
+    def close(self) -> None:
+        """
+        Finishes the video and waits for ffmpeg to write it. With no frames
+        written ffmpeg was never started, so there is no file.
+
+        Raises:
+            RuntimeError: If ffmpeg failed.
+        """
+        process, self._process = self._process, None
+        if process is None:
+            return
+        process.stdin.close()
+        if process.wait() != 0:
+            raise RuntimeError('ffmpeg could not write {}'.format(self.path))
+
+
+Writer = Union[GifWriter, Mp4Writer]
+WRITERS = {'.gif': GifWriter, '.mp4': Mp4Writer}
+
+
+def open_replay(path: str, fps: float = DEFAULT_FPS) -> Writer:
+    """
+    Opens the writer for a replay file, chosen by the file's extension.
+
+    Args:
+        path (str): A .gif or .mp4 file.
+        fps (float): The frames shown per second.
+
+    Returns:
+        Writer: The new writer.
+
+    Raises:
+        ValueError: If the extension is not one of `WRITERS`.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError('Replays must be saved as {}, not {}'.format(' or '.join(WRITERS), path))
+    return WRITERS[extension](path, fps)
+
+
+def replay_from_environment() -> Optional[Writer]:
+    """Opens the replay file named by the FIFA_REPLAY environment variable, or returns None."""
+    path = os.environ.get(REPLAY_VARIABLE, '').strip()
+    return open_replay(path) if path else None
+
+
+def record_match(writer: Writer, rng=None, policy: Optional[Callable[[FifaEngine], int]] = None,
+                 formation_rng: Optional[np.random.Generator] = None, dpi: float = 100) -> MatchState:
+    """
+    Plays a headless match and records a frame of every turn.
+
+    Args:
+        writer (Writer): The replay to record into. It is not closed.
+        rng: A `random.Random` or the `random` module, for the match.
+        policy (Optional[Callable[[FifaEngine], int]]): Picks each action
+            from the engine. Defaults to `attacking_action`.
+        formation_rng (Optional[np.random.Generator]): The source of the
+            player positions. Defaults to a new generator.
+        dpi (float): The resolution of the frames.
+
+    Returns:
+        MatchState: The state at full time.
+    """
+    from fifa_pitch import PitchRenderer
+
+    engine = FifaEngine(rng)
+    policy = attacking_action if policy is None else policy
+    formation_rng = np.random.default_rng() if formation_rng is None else formation_rng
+    pitch = PitchRenderer('offscreen', dpi)
+    pitch.record(writer)
+    state = engine.state
+    while True:
+        pitch.draw(formation_for(state).sample(formation_rng), state.possession, state.carrier)
+        if state.minute >= MATCH_MINUTES:
+            break
+        engine.step(policy(engine))
+    pitch.close()
+    return state
+
+
+def main() -> None:
+    """Parses the command line and records a replay of a headless match."""
+    parser = argparse.ArgumentParser(description='Save a GIF or MP4 replay of a FIFA Python 2019 match.')
+    parser.add_argument('path', help='the .gif or .mp4 file to write')
+    parser.add_argument('--fps', type=float, default=DEFAULT_FPS, help='frames shown per second')
+    parser.add_argument('--dpi', type=float, default=100, help='resolution of the frames')
+    parser.add_argument('--seed', type=int, default=None, help='seed for the match')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        writer = open_replay(args.path, args.fps)
+    except (ValueError, RuntimeError) as error:
+        parser.error(str(error))
+    try:
+        state = record_match(writer, random.Random(args.seed), formation_rng=np.random.default_rng(args.seed),
+                             dpi=args.dpi)
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - start
+    print('{} {} - {} {}'.format(TEAM_NAMES[0], state.score[0], state.score[1], TEAM_NAMES[1]))
+    print('{} frames written to {} in {:.2f}s ({:.1f} KiB)'.format(
+        writer.frames, args.path, elapsed, os.path.getsize(args.path) / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+"""
+Team rosters for FIFA Python 2019, loaded from a squad file.
+
+The script kept its players' names in lists written into it, with dicts
+beside them of the other names a substitution could be typed as, so a new
+squad meant editing the code. A `Roster` holds a team's players in a list
+indexed by shirt number, with the name currently wearing each shirt kept
+alongside, so looking a player up is a list index.
+The squads are read from `fifa_squads.json` next to this module, or from any
+JSON or CSV file in the same layout, so new squads need no code changes. The
+script reads the file named by the FIFA_SQUADS environment variable, which
+must have a Barcelona and a PSG team.
+
+JSON squad files hold a list of teams, each with a name and its players:
+    {"teams": [{"name": "Barcelona", "players": [
+        {"shirt": 1, "name": "Ter Stegnen", "position": "GK", "stamina": 10,
+         "aliases": ["ter", "stegnen"]}, ...]}]}
+
+CSV squad files have one player per row, with the columns team, shirt,
+name, position, stamina and aliases, the aliases separated by semicolons.
+
+A player's aliases are the extra names, besides their full name, that find
+them when a substitution is typed in. Stamina and aliases may be left out,
+in which case the player has the engine's full stamina and no aliases.
+
+Classes:
+    SquadPlayer: One player of a squad.
+    Roster: A team's players by shirt number, with their substitutes.
+
+Functions:
+    load_squads: Reads the rosters of every team in a squad file.
+    squads_from_environment: Reads the squad file named by FIFA_SQUADS.
+"""
+import csv
+import json
+import os
+from typing import Dict, Iterable, List, Optional
+
+from fifa_engine import CAPTAIN, SQUAD_SIZE
+from fifa_fatigue import STAMINA
+
+SQUADS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fifa_squads.json')
+SQUADS_VARIABLE = 'FIFA_SQUADS'
+
+
+class SquadPlayer:
+    """
+    One player of a squad, as listed in the squad file.
+
+    Attributes:
+        shirt (int): The shirt number, from 1 to SQUAD_SIZE.
+        name (str): The player's name.
+        position (str): The position, such as 'GK' or 'FW'.
+        stamina (int): The stamina the player starts the match with.
+        aliases (List[str]): Other names that find the player.
+    """
+
+    __slots__ = ('shirt', 'name', 'position', 'stamina', 'aliases')
+
+    def __init__(self, shirt: int, name: str, position: str = '', stamina: int = STAMINA,
+                 aliases: Iterable[str] = ()):
+        """
+        Initializes a player.
+
+        Args:
+            shirt (int): The shirt number.
+            name (str): The player's name.
+            position (str): The position.
+            stamina (int): The starting stamina.
+            aliases (Iterable[str]): Other names that find the player.
+        """
+        self.shirt = shirt
+        self.name = name
+        self.position = position
+        self.stamina = stamina
+        self.aliases = list(aliases)
+
+
+class Roster:
+    """
+    A team's players by shirt number, and who has come on for them.
+
+    Attributes:
+        team (str): The team's name.
+        players (List[SquadPlayer]): The starting players, indexed by shirt
+            number minus one.
+        substitutes (List[Optional[str]]): The name of whoever came on for
+            each shirt number, or None while the starter plays.
+    """
+
+    def __init__(self, team: str, players: Iterable[SquadPlayer]):
+        """
+        Initializes a roster.
+
+        Args:
+            team (str): The team's name.
+            players (Iterable[SquadPlayer]): One player per shirt number, in
+                any order.
+
+        Raises:
+            ValueError: If a shirt number is missing, repeated or out of
+                range, or two players share a name or alias.
+        """
+        by_shirt: List[Optional[SquadPlayer]] = [None] * SQUAD_SIZE
+        for player in players:
+            if not 1 <= player.shirt <= SQUAD_SIZE:
+                raise ValueError('{}: shirt number {} is not between 1 and {}'.format(team, player.shirt, SQUAD_SIZE))
+            if by_shirt[player.shirt - 1] is not None:
+                raise ValueError('{}: shirt number {} is listed twice'.format(team, player.shirt))
+            by_shirt[player.shirt - 1] = player
+        missing = [shirt for shirt in range(1, SQUAD_SIZE + 1) if by_shirt[shirt - 1] is None]
+        if missing:
+            raise ValueError('{}: no player for shirt numbers {}'.format(team, ', '.join(map(str, missing))))
+
+        self.team = team
+        self.players: List[SquadPlayer] = by_shirt
+        self.substitutes: List[Optional[str]] = [None] * SQUAD_SIZE
+        self._names = [player.name for player in self.players]
+        self._shirts: Dict[str, int] = {}
+        for player in self.players:
+            for alias in [player.name] + player.aliases:
+                key = alias.strip().lower()
+                if self._shirts.get(key, player.shirt) != player.shirt:
+                    raise ValueError('{}: the name {} is used for two players'.format(team, alias))
+                self._shirts[key] = player.shirt
+
+    def name(self, shirt: int) -> str:
+        """Returns the name of whoever is wearing a shirt number now."""
+        return self._names[shirt - 1]
+
+    def player(self, shirt: int) -> SquadPlayer:
+        """Returns the starting player with a shirt number."""
+        return self.players[shirt - 1]
+
+    def is_substituted(self, shirt: int) -> bool:
+        """Returns whether the starter with a shirt number has gone off."""
+        return self.substitutes[shirt - 1] is not None
+
+    def find(self, name: str) -> Optional[int]:
+        """
+        Looks up the shirt number of a player by any of their names.
+
+        Names are matched without regard to case or surrounding spaces, and
+        a substitute is found by the name they came on with.
+
+        Args:
+            name (str): The name typed in.
+
+        Returns:
+            Optional[int]: The shirt number, or None if nobody has the name.
+        """
+        key = name.strip().lower()
+        shirt = self._shirts.get(key)
+        if shirt is not None:
+            return shirt
+        for index, substitute in enumerate(self.substitutes):
+            if substitute is not None and substitute.strip().lower() == key:
+                return index + 1
+        return None
+
+    def substitute(self, shirt: int, name: str) -> None:
+        """
+        Brings a player on in place of whoever wears a shirt number.
+
+        Args:
+            shirt (int): The shirt number.
+            name (str): The name of the player coming on.
+
+        Raises:
+            ValueError: If the shirt number is the captain's.
+        """
+        if shirt == CAPTAIN:
+            raise ValueError('The captain of {} cannot be substituted'.format(self.team))
+        self.substitutes[shirt - 1] = name
+        self._names[shirt - 1] = name
+
+    def stamina(self) -> List[int]:
+        """Returns the starting stamina of every shirt number, in order."""
+        return [player.stamina for player in self.players]
+
+
+def _player(record: Dict[str, object]) -> SquadPlayer:
+    """Builds a player from a record of a squad file."""
+    aliases = record.get('aliases') or []
+    if isinstance(aliases, str):
+        aliases = [alias for alias in aliases.split(';') if alias.strip()]
+    stamina = record.get('stamina')
+    return SquadPlayer(int(record['shirt']), str(record['name']).strip(), str(record.get('position') or ''),
+                       STAMINA if stamina in (None, '') else int(stamina), aliases)
+
+
+def load_squads(path: str = SQUADS_FILE) -> Dict[str, Roster]:
+    """
+    Reads the rosters of every team in a squad file.
+
+    Args:
+        path (str): A .json or .csv squad file. Defaults to the bundled
+            `fifa_squads.json`.
+
+    Returns:
+        Dict[str, Roster]: The rosters by team name, in the file's order.
+
+    Raises:
+        ValueError: If the file is not JSON or CSV, or a squad is invalid.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    teams: Dict[str, List[SquadPlayer]] = {}
+    if extension == '.json':
+        with open(path, encoding='utf-8') as squads:
+            data = json.load(squads)
+        for team in data['teams']:
+            teams[team['name']] = [_player(record) for record in team['players']]
+    elif extension == '.csv':
+        with open(path, newline='', encoding='utf-8') as squads:
+            for record in csv.DictReader(squads):
+                teams.setdefault(record['team'].strip(), []).append(_player(record))
+    else:
+        raise ValueError('Squad files must be .json or .csv, not {}'.format(path))
+    return {team: Roster(team, players) for team, players in teams.items()}
+
+
+def squads_from_environment() -> Dict[str, Roster]:
+    """Reads the squad file named by the FIFA_SQUADS environment variable, or the bundled one."""
+    path = os.environ.get(SQUADS_VARIABLE, '').strip()
+    return load_squads(path or SQUADS_FILE)
@@ -1,8 +1,11 @@
 import os
+import re
 import sys
 import random
 import math
+import struct
 import time
+from collections import deque
 
 class BadInputError(Exception):
     """Custom exception for bad user input."""
@@ -61,30 +64,28 @@ class Player():
         self.wildCards = []
         self.valueChangeCards = []
         self.zeroCards = []
-        plusFours = []
-        for card in self.hand:
-            if card.isWild():
-                if card.getValue() == '+4':
-                    plusFours.append(card)
-                else:
-                    self.wildCards.append(card)
-            elif zeroChange and card.isZero():
-                self.canZero = True
-                self.zeroCards.append(card)
-            elif card.getColor() == color or card.getValue() == value:
-                if card.getColor() != color:
-                    self.canValueChange = True
+        hand = self.hand
+        if zeroChange:
+            self.zeroCards += hand.cardsByValue('0')
+            if self.zeroCards:
+                self.canZeroChange = True
+        self.wildCards += hand.cardsByValue('W')
+        if color != 'wild':
+            for card in hand.cardsByColor(color):
+                if not (zeroChange and card.isZero()):
+                    self.legalCards.append(card)
+        if value not in ('W', '+4'):
+            for card in hand.cardsByValue(value):
+                if card.getColor() != color and not (zeroChange and card.isZero()):
                     self.valueChangeCards.append(card)
-                if card.getValue() == "+2":
-                    self.canDrawTwo = True
-                elif card.getValue() == 'R':
-                    self.canReverse = True
-                elif card.getValue() == 'X':
-                    self.canSkip = True
-                self.legalCards.append(card)
-        if len(self.legalCards) == 0 and len(plusFours) > 0:
+            self.legalCards += self.valueChangeCards
+            self.canValueChange = len(self.valueChangeCards) > 0
+        for flag, special in (('canDrawTwo', '+2'), ('canReverse', 'R'), ('canSkip', 'X')):
+            if hand.countCards(color, special) > 0 or (value == special and self.canValueChange):
+                setattr(self, flag, True)
+        if len(self.legalCards) == 0 and hand.countCards('wild', '+4') > 0:
             self.canDrawFour = True
-            self.wildCards += plusFours
+            self.wildCards += hand.cardsByValue('+4')
                 
     def getValidCards(self):
         """Returns a list of legally playable cards."""
@@ -158,6 +159,13 @@ class Player():
     def discardHand(self):
         """Discards all cards from the player's hand."""
         self.hand.discard()
+
+    def takeHand(self, cards):
+        """Replaces the player's hand with the given cards."""
+        self.discardHand()
+        for card in cards:
+            self.hand.addCard(card)
+        self.maxScroll = math.ceil((self.getCardNum() / 10)-1)
     
     def __str__(self):
         """Returns the player's name."""
@@ -170,9 +178,14 @@ class Player():
 class Hand():
     """Represents a player's hand of cards."""
 
+    indexBars = tuple('\033[97m|-(<)--'+''.join('({})--'.format(k) for k in range(num))+'-----'*(10-num)+'(>)--|\033[0m\n' for num in range(11))
+
     def __init__(self, deck=None,numberOfCards=0):
         """Initializes a Hand object."""
         self.hand = []
+        self.colorIndex = {}
+        self.valueIndex = {}
+        self.cardCounts = {}
         if deck != None:
             self.draw(deck,numberOfCards)
 
@@ -192,57 +205,62 @@ class Hand():
             return ''
 
     def addCard(self, card):
-        """Adds a card to the hand."""
+        """Adds a card to the hand and its color and value indexes."""
         self.hand.append(card) 
+        color = card.getColor()
+        value = card.getValue()
+        self.colorIndex.setdefault(color, {})[card] = None
+        self.valueIndex.setdefault(value, {})[card] = None
+        self.cardCounts[(color, value)] = self.cardCounts.get((color, value), 0) + 1
         
     def removeCard(self, index):
         """Removes a card from the hand by its index."""
         index = int(index)
         if (0 <= index < len(self)):
-            return self.hand.pop(index)      
+            card = self.hand.pop(index)
+            color = card.getColor()
+            value = card.getValue()
+            del self.colorIndex[color][card]
+            del self.valueIndex[value][card]
+            self.cardCounts[(color, value)] -= 1
+            return card
 
     def discard(self):
         """Discards all cards from the hand."""
         self.hand = []
+        self.colorIndex = {}
+        self.valueIndex = {}
+        self.cardCounts = {}
+
+    def cardsByColor(self, color):
+        """Returns the cards of a given color, in the order they were added."""
+        return self.colorIndex.get(color, {}).keys()
+
+    def cardsByValue(self, value):
+        """Returns the cards of a given value, in the order they were added."""
+        return self.valueIndex.get(value, {}).keys()
+
+    def countCards(self, color, value):
+        """Returns how many cards of a given color and value are in the hand."""
+        return self.cardCounts.get((color, value), 0)
 
     def show(self, scrollNum=0, hide=False):
         """Returns a string representation of the hand."""
         if scrollNum == -1:
             scrollNum = 0
-        output = ''
-        num = 0
-        header, footer, upper, lower = '', '', '', ''
-        header +=   ('\033[97m\u2666--\u2666\033[0m ')
-        upper +=    ('\033[97m|<-|\033[0m ')
-        lower +=    ('\033[97m|<-|\033[0m ')
-        footer +=   ('\033[97m\u2666--\u2666\033[0m ')
-        for i in range(10):
-            indexNum = i+(10*scrollNum)
-            if indexNum < len(self):
-                header += (self[indexNum].getRow(0,hide)+' ')
-                upper += (self[indexNum].getRow(1,hide)+' ')
-                lower += (self[indexNum].getRow(2,hide)+' ')
-                footer += (self[indexNum].getRow(3,hide)+' ')
-                num += 1
-        for j in range(10-num):
-            j #unused
-            header += ('     ')
-            footer += ('     ')
-            upper += ('     ')
-            lower += ('     ')
-        header +=   ('\033[97m\u2666--\u2666\033[0m ')
-        upper +=    ('\033[97m|->|\033[0m ')
-        lower +=    ('\033[97m|->|\033[0m ')
-        footer +=   ('\033[97m\u2666--\u2666\033[0m ')
-        output += ('  '+header+'\n  '+upper+'\n  '+lower+'\n  '+footer+'\n\033[97m|-(<)--')
-        for k in range(num):
-            output += '({})'.format(k)
-            output += '--'
-        for l in range(10-num):
-            l #unused
-            output += '-----'
-        output += '(>)--|\033[0m\n'
-        return output
+        rows = [card.getRows(hide) for card in self.hand[10*scrollNum:10*scrollNum+10]]
+        num = len(rows)
+        padding = '     '*(10-num)
+        header = ''.join([row[0]+' ' for row in rows])
+        upper = ''.join([row[1]+' ' for row in rows])
+        lower = ''.join([row[2]+' ' for row in rows])
+        footer = ''.join([row[3]+' ' for row in rows])
+        return ''.join((
+            '  \033[97m\u2666--\u2666\033[0m ', header, padding, '\033[97m\u2666--\u2666\033[0m \n',
+            '  \033[97m|<-|\033[0m ', upper, padding, '\033[97m|->|\033[0m \n',
+            '  \033[97m|<-|\033[0m ', lower, padding, '\033[97m|->|\033[0m \n',
+            '  \033[97m\u2666--\u2666\033[0m ', footer, padding, '\033[97m\u2666--\u2666\033[0m \n',
+            self.indexBars[num]))
 
     def getCard(self, index):
         """Returns the card at the given index."""
@@ -255,8 +273,9 @@ class Hand():
 class GameSettings():
     """Manages the game settings."""
     
-    playerIdentities = ('play1','play2','play3','play4')
-    computerNames = ('Watson','SkyNet','Hal','Metal Gear')
+    playerIdentities = tuple('play{}'.format(seat) for seat in range(1, 11))
+    computerNames = ('Watson','SkyNet','Hal','Metal Gear','Deep Blue','Colossus','Joshua','Marvin','Bender','Jarvis')
+    maxPlayers = 4
     
     def __init__(self):
         """Initializes a GameSettings object."""
@@ -270,10 +289,11 @@ class GameSettings():
         self.computerSimulation = False
         self.mainMenuError = ''
         self.computerSpeed = 'normal'
+        self.numDecks = 1
         
     def canAddPlayer(self):
-        """Returns whether a player can be added."""
-        return (self.numPlayers < 4)
+        """Returns whether a player can be added from the menu, which shows four seats."""
+        return (self.numPlayers < self.maxPlayers)
     
     def canRemovePlayer(self):
         """Returns whether a player can be removed."""
@@ -392,27 +412,29 @@ class Deck():
     colors =     ('red','yellow','green','blue')
     values =     ('0','1','2','3','4','5','6','7','8','9','X','R','+2')
     
-    def __init__(self, populate):
-        """Initializes a Deck object."""
-        self.deck = []
+    def __init__(self, populate, rng=None, numDecks=1):
+        """Initializes a Deck object of numDecks combined decks, shuffling with rng or the random module."""
+        self.rng = random if rng is None else rng
+        self.deck = deque()
         if populate:
-            self.populate(True)
+            self.populate(True, numDecks)
             
     def __getitem__(self, index):
         """Returns the card at the given index."""
         return self.deck[index]
             
-    def populate(self, shuffle=True):
-        """Populates the deck with a standard set of Uno cards."""
-        for color in self.colors:
-            for value in self.values:
-                self.deck.append(Card(color, value))
-                if value != '0':
+    def populate(self, shuffle=True, numDecks=1):
+        """Populates the deck with numDecks standard sets of Uno cards."""
+        for _ in range(numDecks):
+            for color in self.colors:
+                for value in self.values:
                     self.deck.append(Card(color, value))
-        for i in range(4):
-            i #unused
-            self.deck.append(Card('wild', '+4'))
-            self.deck.append(Card('wild', 'W'))
+                    if value != '0':
+                        self.deck.append(Card(color, value))
+            for i in range(4):
+                i #unused
+                self.deck.append(Card('wild', '+4'))
+                self.deck.append(Card('wild', 'W'))
         if shuffle:
             self.shuffle()
 
@@ -434,19 +456,120 @@ class Deck():
     
     def insert(self, card):
         """Inserts a card at the top of the deck."""
-        self.deck.insert(0, card)
+        self.deck.appendleft(card)
 
     def shuffle(self):
         """Shuffles the deck."""
-        random.shuffle(self.deck)
+        cards = list(self.deck)
+        self.rng.shuffle(cards)
+        self.deck = deque(cards)
+
+    def refill(self, pile):
+        """Shuffles all but the top card of a discard pile into the deck."""
+        top = pile.deck.popleft()
+        for card in pile.deck:
+            if card.isWild():
+                card.changeColor('wild')
+        self.deck.extend(pile.deck)
+        pile.deck = deque((top,))
+        self.shuffle()
+
+class Strategy():
+    """
+    Base class for pluggable computer player strategies.
+
+    A ComputerPlayer with a strategy asks it for every decision, passing a
+    read-only MatchView. Returning None from either method falls back to the
+    computer player's built-in heuristic for that decision.
+    """
+
+    def chooseCard(self, view):
+        """Returns a hand index as a string, 'd' to draw, or None."""
+        return None
+
+    def chooseColor(self, view):
+        """Returns 'red', 'blue', 'green' or 'yellow' for a wild card, or None."""
+        return None
+
+class MatchView():
+    """A read-only view of a match from one computer player's seat."""
+
+    def __init__(self, match, player):
+        """Initializes a MatchView object."""
+        self._match = match
+        self._player = player
+
+    def getPlayerID(self):
+        """Returns the ID of the player the view belongs to."""
+        return self._player.getID()
+
+    def getCurrentColor(self):
+        """Returns the color that must be matched."""
+        return self._match.currentColor
+
+    def getCurrentValue(self):
+        """Returns the value that must be matched."""
+        return self._match.currentValue
+
+    def getZeroChange(self):
+        """Returns whether the zero change rule is in play."""
+        return self._match.zeroChange
+
+    def isReversed(self):
+        """Returns whether the turn order is reversed."""
+        return self._match.reverse
+
+    def getHand(self):
+        """Returns the player's cards as a tuple."""
+        return tuple(self._player.hand)
+
+    def getLegalIndexes(self):
+        """Returns the hand indexes of every card that may be played."""
+        player = self._player
+        player.getLegalCards(self._match.currentColor, self._match.currentValue, self._match.zeroChange)
+        legal = set(map(id, player.getAllValidCards()))
+        return [index for index, card in enumerate(player.hand) if id(card) in legal]
+
+    def canDraw(self):
+        """Returns whether there are cards left to draw."""
+        return len(self._match.deck) > 0
+
+    def getDeckSize(self):
+        """Returns the number of cards in the draw deck."""
+        return len(self._match.deck)
+
+    def getPile(self):
+        """Returns the discard pile as a tuple, top card first."""
+        return tuple(self._match.pile)
+
+    def getNumDecks(self):
+        """Returns how many standard decks were combined for the match."""
+        return self._match.numDecks
+
+    def getTurnOrder(self):
+        """Returns the player IDs in seating order."""
+        return tuple(self._match.turnList)
+
+    def getCardCounts(self):
+        """Returns the number of cards held by each player, by ID."""
+        return {identity: self._match.players[identity].getCardNum() for identity in self._match.turnList}
+
+    def getNextPlayerID(self):
+        """Returns the ID of the player who moves next."""
+        return self._match.getNextTurn()
+
+    def getPreviousPlayerDrew(self):
+        """Returns whether the previous player drew a card on their turn."""
+        return self._match.getPlayer(self._match.getNextTurn(True)).didDraw()
 
 class ComputerPlayer(Player):
     """Represents a computer player."""
     
-    def __init__(self, name):
-        """Initializes a ComputerPlayer object."""
+    def __init__(self, name, strategy=None):
+        """Initializes a ComputerPlayer object, optionally driven by a Strategy."""
         super().__init__(name)
         self.type = 'Computer'
+        self.strategy = strategy
         self.begun = False
         self.colorsInHand = {'red':0, 'blue':0, 'green':0, 'yellow':0, 'wild':0}
         self.colorsOutHand = {}
@@ -457,20 +580,35 @@ class ComputerPlayer(Player):
         Player.addCard(self, card)
         color = card.getColor()
         self.colorsInHand[color] += 1
-        
+
+    def discardHand(self):
+        """Discards the computer's hand and resets its color counts."""
+        Player.discardHand(self)
+        self.colorsInHand = {'red':0, 'blue':0, 'green':0, 'yellow':0, 'wild':0}
+
+    def takeHand(self, cards):
+        """Replaces the computer's hand and recounts its colors."""
+        Player.takeHand(self, cards)
+        for card in self.hand:
+            self.colorsInHand[card.getColor()] += 1
+
     def indexCard(self, cardColor, cardValue):
         """Returns the index of a given card in the hand."""
-        for card in self.hand:
-            if card.getValue() == cardValue:
-                if cardValue in ('+4', 'W'):
-                    return self.hand.indexCard(card)
-                else:
-                    if card.getColor() == cardColor:
-                        return self.hand.indexCard(card)
+        if cardValue in ('+4', 'W'):
+            cardColor = 'wild'
+        code = Card.colorCodeIndex[cardColor] + Card.valueCodeIndex[cardValue]
+        for index, card in enumerate(self.hand):
+            if card.code == code:
+                return index
         raise ValueError("Card Cannot Be Found")
         
     def think(self, match):
         """The AI logic for the computer player."""
+        if self.strategy is not None:
+            choice = self.strategy.chooseCard(MatchView(match, self))
+            if choice is not None:
+                return self.playChoice(match, choice)
+        rng = match.rng
         card = None
         self.currentColor = match.currentColor
         currentValue = match.currentValue
@@ -488,7 +626,7 @@ class ComputerPlayer(Player):
         
         self.getLegalCards(self.currentColor, currentValue, zeroChangeRule)
 
-        if len(self.legalCards) == 0 and len(self.wildCards) == 0:
+        if len(self.legalCards) == 0 and len(self.wildCards) == 0 and not self.canZeroChange:
             return "d"
         
         else:
@@ -500,7 +638,7 @@ class ComputerPlayer(Player):
                     if self.canDrawFour:
                         card = self.getCardByValue(self.wildCards, "+4")
                     else:
-                        card = random.choice(self.wildCards)
+                        card = rng.choice(self.wildCards)
             else:
                 if twoPlayers and self.canSkip:
                     card = self.getCardByValue(self.legalCards,"R", "X")
@@ -515,17 +653,32 @@ class ComputerPlayer(Player):
                     if self.colorsInHand[bestValueChangeColor] > currentColorNum or len(self.valueChangeCards) == len(self.legalCards):
                         card = self.getCardByColor(self.valueChangeCards, bestValueChangeColor)
                 if card == None:
-                    card = random.choice(list(set(self.legalCards) - set(self.valueChangeCards)))
+                    card = rng.choice([legal for legal in self.legalCards if legal not in self.valueChangeCards])
             
         color = card.getColor()
         self.colorsInHand[color] -= 1
         return str(self.indexCard(card.getColor(), card.getValue()))
     
-    def getWildColor(self):
+    def playChoice(self, match, choice):
+        """Checks a strategy's choice and returns it in the form think returns."""
+        if choice == 'd':
+            return choice
+        self.getLegalCards(match.currentColor, match.currentValue, match.zeroChange)
+        card = self.hand[int(choice)]
+        if not any(card is legal for legal in self.getAllValidCards()):
+            raise BadInputError('Strategy chose an illegal card: {}'.format(choice))
+        self.colorsInHand[card.getColor()] -= 1
+        return str(int(choice))
+
+    def getWildColor(self, rng=random, match=None):
         """Determines the best color to choose for a wild card."""
+        if self.strategy is not None and match is not None:
+            color = self.strategy.chooseColor(MatchView(match, self))
+            if color is not None:
+                return color
         maxKey = max(self.colorsInHand, key=self.colorsInHand.get)
         if maxKey == 'wild':
-            return random.choice(('r','g','b','y'))
+            return rng.choice(('r','g','b','y'))
         else:
             return maxKey
         
@@ -604,6 +757,11 @@ class Card():
         "R1" : ["  Y88b   ","   Y88b  ","    Y88b ","     Y88b","     d88P","    d88P ","   d88P  ","  d88P   "],
         "R0" : [" Y88b    ","  Y88b   ","   Y88b  ","    Y88b ","    d88P ","   d88P  ","  d88P   "," d88P    "],
     }
+
+    codeColors = ('red','yellow','green','blue','wild')
+    codeValues = ('0','1','2','3','4','5','6','7','8','9','X','R','+2','W','+4')
+    colorCodeIndex = {color: index*16 for index, color in enumerate(codeColors)}
+    valueCodeIndex = {value: index for index, value in enumerate(codeValues)}
         
 
     def __init__(self, color, value):
@@ -614,6 +772,7 @@ class Card():
         self.setColor(color)
         self.setValue(value)
         self.setPoints(value)
+        self.code = self.colorCodeIndex[self.color] + self.valueCodeIndex[self.value]
 
 
     def __repr__(self):
@@ -621,7 +780,17 @@ class Card():
         return "{},{}".format(self.color, self.value)
 
     def getBigNum(self, reverse, reverseSeed=0):
-        """Returns a list of strings to draw the card's value on the pile."""
+        """Returns the precomputed rows that draw the card's value on the pile."""
+        value = self.value
+        if value == 'R':
+            if not reverse:
+                value += str(reverseSeed)
+            else:
+                value += str(9-reverseSeed)
+        return self.bigNumGlyphs[(self.code, value)]
+
+    def formatBigNum(self, reverse, reverseSeed=0):
+        """Formats the rows that draw the card's value on the pile."""
         bigNums = []
         colorCode = self.colorCode
         colorCodeDark = self.colorCodeDark
@@ -653,7 +822,17 @@ class Card():
         return self.points
     
     def getRow(self,rowNum,hide=False):
-        """Returns a string for a row of the card's visual representation."""
+        """Returns a precomputed row of the card's visual representation."""
+        return self.getRows(hide)[rowNum]
+
+    def getRows(self, hide=False):
+        """Returns the four precomputed rows of the card's visual representation."""
+        if hide:
+            return self.hiddenRows
+        return self.rowGlyphs[self.code]
+
+    def formatRow(self,rowNum,hide=False):
+        """Formats a row of the card's visual representation."""
         value = self.value
         displaySpace = self.displaySpace
         if hide:
@@ -715,6 +894,11 @@ class Card():
     def changeColor(self, color):
         """Changes the color of a wild card."""
         self.setColor(color)
+        self.code = self.colorCodeIndex[self.color] + self.valueCodeIndex[self.value]
+
+    def getCode(self):
+        """Returns the card's compact integer code (color*16 + value)."""
+        return self.code
 
     def isWild(self):
         """Returns whether the card is a wild card."""
@@ -723,7 +907,74 @@ class Card():
     def isZero(self):
         """Returns whether the card is a zero card."""
         return self.zero
+
+    @classmethod
+    def fromCode(cls, code):
+        """Returns a new card for a code, copied from its prototype."""
+        card = cls.__new__(cls)
+        card.__dict__ = cls.prototypes[code].__dict__.copy()
+        return card
+
+    @classmethod
+    def buildGlyphs(cls):
+        """Precomputes the rows, pile numbers and prototype card of every card code, and the codes in use."""
+        cls.rowGlyphs = [None] * (len(cls.codeColors) * 16)
+        cls.prototypes = [None] * (len(cls.codeColors) * 16)
+        cls.bigNumGlyphs = {}
+        for color in cls.codeColors:
+            for value in cls.codeValues:
+                if value in ('W', '+4'):
+                    card = cls('wild', value)
+                    if color != 'wild':
+                        card.changeColor(color)
+                elif color != 'wild':
+                    card = cls(color, value)
+                else:
+                    continue
+                cls.prototypes[card.code] = card
+                cls.rowGlyphs[card.code] = tuple(card.formatRow(rowNum) for rowNum in range(4))
+                if value == 'R':
+                    for reverseSeed in range(10):
+                        cls.bigNumGlyphs[(card.code, 'R{}'.format(reverseSeed))] = tuple(card.formatBigNum(False, reverseSeed))
+                else:
+                    cls.bigNumGlyphs[(card.code, value)] = tuple(card.formatBigNum(False))
+        cls.hiddenRows = tuple(card.formatRow(rowNum, True) for rowNum in range(4))
+        cls.validCodes = bytes(code for code, card in enumerate(cls.prototypes) if card is not None)
+
+Card.buildGlyphs()
     
+class ScreenRenderer():
+    """Paints frames to the terminal, redrawing only the lines that changed."""
+
+    sgrPattern = re.compile('\033\\[[0-9;]*m')
+
+    def __init__(self):
+        """Initializes a ScreenRenderer object."""
+        self.previous = None
+
+    def invalidate(self):
+        """Forgets the last frame so the next paint redraws everything."""
+        self.previous = None
+
+    def paint(self, frame):
+        """Writes a frame, moving the cursor to changed lines instead of clearing."""
+        lines = frame.split('\n')
+        previous = self.previous
+        output = []
+        if previous is None:
+            output.append('\033[H\033[2J')
+        color = '\033[0m'
+        for row, line in enumerate(lines):
+            if previous is None or row >= len(previous) or previous[row] != line:
+                output.append('\033[{};1H\033[2K{}{}'.format(row + 1, color, line))
+            codes = self.sgrPattern.findall(line)
+            if codes:
+                color = codes[-1]
+        output.append('\033[{};1H\033[J{}'.format(len(lines) + 1, color))
+        sys.stdout.write(''.join(output))
+        sys.stdout.flush()
+        self.previous = lines
+
 class Match():
     """Represents a match of Uno."""
 
@@ -740,15 +991,33 @@ class Match():
         }
     
     speeds = {'slow':2,'normal':1,'fast':0}
+
+    # Snapshots start with the header, then each seat's forced draws, drew
+    # flag and hand size, then the deck, pile and hand card codes.
+    snapshotMagic = b'UNOS'
+    snapshotVersion = 1
+    snapshotHeader = struct.Struct('<4sBBBBBBBBHB')
+    snapshotSeat = struct.Struct('<HBH')
+    snapshotEvents = ('', 'wild', 'skip', 'reverse')
+    saveFile = 'uno.sav'
+
+    screenHeader = ('\t\t\033[94m      || ||\033[92m ||\ ||  \033[91m// \\\\\n\033[0m'
+                    '\t\t\033[94m      || ||\033[92m ||\\\|| \033[91m((   ))\n\033[0m'
+                    '\t\t\033[94m      \\\ //\033[92m || \|| \033[91m \\\ //\n\033[0m'
+                    '\033[97m===============================================================\n')
         
 
-    def __init__(self, gs):
-        """Initializes a Match object."""
-        self.deck = Deck(True)
-        self.pile = Deck(False)
+    def __init__(self, gs, rng=None, recorder=None):
+        """Initializes a Match object, drawing all randomness from rng if given and logging events to recorder."""
+        self.rng = random if rng is None else rng
+        self.recorder = recorder
+        self.numDecks = gs.numDecks
+        self.deck = Deck(True, self.rng, self.numDecks)
+        self.pile = Deck(False, self.rng)
         self.players = gs.players
         self.turnList = []
-        self.handTitles =  {'play1':'','play2':'','play3':'','play4':''}
+        self.seatIndex = {}
+        self.handTitles = {}
         self.displayEffects = gs.displayEffects
         self.hideComputerHands = gs.hideComputerHands
         self.zeroChange = gs.zeroChange
@@ -770,30 +1039,31 @@ class Match():
         self.matchAbort = False
         self.forcedWild = False
         self.elements = dict(self.elementsInit)
+        self.screen = ScreenRenderer()
         
         keyStringName = 'P{}Name'
         keyStringCards = 'P{}Cards'
         
         for i in self.players:
-            self.elements[keyStringName.format(i[-1])] = self.players[i].getName()+(' '*(11-len(self.players[i].getName())))
-            self.elements[keyStringCards.format(i[-1])] = '  '+(' '*(3-len(str(self.players[i].getCardNum()))))+str(self.players[i].getCardNum())+' Cards'
+            self.elements[keyStringName.format(i[4:])] = self.players[i].getName()+(' '*(11-len(self.players[i].getName())))
+            self.elements[keyStringCards.format(i[4:])] = '  '+(' '*(3-len(str(self.players[i].getCardNum()))))+str(self.players[i].getCardNum())+' Cards'
             
         self.elements['DNum'] = len(self.deck)
         
         if len(str(len(self.deck))) < 2:
             self.elements['PostDNum'] = '\t'
             
+        self.elements['Deck'] = [' ',' ',' ',' ',' ',' ',' ',' ', ' ']
         j = 8
-        for i in range(int(math.ceil(len(self.deck)/12))):
+        for i in range(min(9, int(math.ceil(len(self.deck)/12)))):
             self.elements['Deck'][j] = '='
             j -= 1
                     
         for key in GameSettings.playerIdentities:
-            try:
+            if key in self.players:
                 self.buildHandString(key)
+                self.seatIndex[key] = len(self.turnList)
                 self.turnList += [key]
-            except KeyError:
-                pass
             
         self.passMax = len(self.turnList)
             
@@ -804,15 +1074,16 @@ class Match():
     def begin(self):
         """Starts the match."""
         self.elements['Console'] = 'Beginning Game, Press Enter.'
-        print(self.drawScreen())
+        self.printScreen()
         self.enterBreak()
+        self.record('begin')
         self.eventDealCards()
-        self.turn = random.choice(self.turnList)
+        self.turn = self.rng.choice(self.turnList)
         self.elements['Console'] = 'First turn will be {}. Press Enter.'.format(self.players[self.turn].getName())
-        print(self.drawScreen(True))
+        self.printScreen(True)
         self.enterBreak()
         self.placeCard()
-        self.elements['P{}Turn'.format(self.turn[-1])] = '\033[93m'
+        self.elements['P{}Turn'.format(self.turn[4:])] = '\033[93m'
         if self.event == 'wild':
             self.eventWildCard()
         elif self.event == 'reverse':
@@ -822,38 +1093,42 @@ class Match():
         """Ends the match and returns the updated game settings."""
         if not self.matchAbort:
             points = 0
-            self.elements['P{}Turn'.format(self.turn[-1])] = ''
+            self.elements['P{}Turn'.format(self.turn[4:])] = ''
             self.elements['Console'] = '{} Wins! Press Enter to Begin Point Tally'.format(self.players[self.winnerID].getName())
-            print(self.drawScreen())
+            self.printScreen()
             self.enterBreak()
             
             for identity in self.turnList:
                 if identity != self.winnerID:
                     self.turn = identity
                     self.elements['HName'] = self.handTitles[self.turn]
-                    self.elements['P{}Turn'.format(self.turn[-1])] = '\033[93m'
+                    self.elements['P{}Turn'.format(self.turn[4:])] = '\033[93m'
                     while self.players[identity].getCardNum() > 0:
                         card = self.players[identity].removeCard(0)
                         points += card.getPoints()
                         self.elements['Console'] = '{} Won {} Points!'.format(self.players[self.winnerID].getName(),points)
                         
                         keyStringCards = 'P{}Cards'
-                        self.elements[keyStringCards.format(identity[-1])] = '  '+(' '*(3-len(str(self.players[identity].getCardNum()))))+str(self.players[identity].getCardNum())+' Cards'
+                        self.elements[keyStringCards.format(identity[4:])] = '  '+(' '*(3-len(str(self.players[identity].getCardNum()))))+str(self.players[identity].getCardNum())+' Cards'
                         self.players[identity].maxScroll = math.ceil((self.players[identity].getCardNum() / 10)-1)
                         if self.handPosition > self.players[identity].maxScroll:
                             self.handPosition -= 1
                         self.buildHandVisual(identity)
                         
                         if self.displayEffects and not self.simulation:
-                            print(self.drawScreen())
+                            self.printScreen()
                             time.sleep(.1)
-                    self.elements['P{}Turn'.format(self.turn[-1])] = ''
+                    self.elements['P{}Turn'.format(self.turn[4:])] = ''
                         
             self.players[self.winnerID].addPoints(points)
             self.elements['Console'] = '{} Won {} Points! Press Enter'.format(self.players[self.winnerID].getName(),points)
-            print(self.drawScreen())
+            self.printScreen()
             self.enterBreak()
         
+        if self.matchAbort:
+            self.record('end', None, 0)
+        else:
+            self.record('end', self.winnerID, points)
         gs.clearStaging()
         for identity in self.turnList:
             self.players[identity].discardHand()
@@ -862,8 +1137,10 @@ class Match():
         
     def adjustCardAmount(self, playerID):
         """Adjusts the card amount display for a player."""
+        if self.simulation:
+            return
         keyStringCards = 'P{}Cards'
-        self.elements[keyStringCards.format(playerID[-1])] = '  '+(' '*(3-len(str(self.players[playerID].getCardNum()))))+str(self.players[playerID].getCardNum())+' Cards'
+        self.elements[keyStringCards.format(playerID[4:])] = '  '+(' '*(3-len(str(self.players[playerID].getCardNum()))))+str(self.players[playerID].getCardNum())+' Cards'
         self.players[playerID].maxScroll = math.ceil((self.players[playerID].getCardNum() / 10)-1)
         if self.handPosition > self.players[playerID].maxScroll:
             self.handPosition -= 1
@@ -879,6 +1156,8 @@ class Match():
 
     def buildHandVisual(self, playerID):
         """Builds the hand scroll visual for a player."""
+        if self.simulation:
+            return
         string = '['
         for i in range(self.players[playerID].maxScroll+1):
             if i == self.handPosition:
@@ -925,13 +1204,13 @@ class Match():
         """Deals cards to all players."""
         if self.displayEffects and not self.simulation:
             self.elements['Console'] = 'Dealing Cards...'
-        for i in ('play1','play2','play3','play4'):
+        for i in self.turnList:
             if i in self.players:
                 for j in range(7):
                     j #unused
                     self.dealCard(i)
                     if self.displayEffects and not self.simulation:
-                        print(self.drawScreen(True))
+                        self.printScreen(True)
                         time.sleep(.1)
 
     def eventReverse(self):
@@ -941,16 +1220,17 @@ class Match():
             if self.players[self.turn].getType() == "Computer":
                 hide = self.hideComputerHands
             self.elements['Console'] = "Reverse Card Played! Reversing Turn Order.".format(self.players[self.turn].getName())
-            print(self.drawScreen(hide))
+            self.printScreen(hide)
             time.sleep(1)
             for i in range(10):
                 cardBigNums = self.pile[0].getBigNum(self.reverse,i)
                 self.elements['oMiddle'] = cardBigNums
-                print(self.drawScreen(hide))
+                self.printScreen(hide)
                 if self.displayEffects and not self.simulation:
                     time.sleep(.1)
-        cardBigNums = self.pile[0].getBigNum(self.reverse,9)
-        self.elements['oMiddle'] = cardBigNums
+        if not self.simulation:
+            cardBigNums = self.pile[0].getBigNum(self.reverse,9)
+            self.elements['oMiddle'] = cardBigNums
         self.reverse = not self.reverse
         self.event = ''
             
@@ -961,15 +1241,15 @@ class Match():
             if self.players[self.turn].getType() == "Computer":
                 hide = self.hideComputerHands
             self.elements['Console'] = "Skip Card Placed! Skipping {}'s Turn.".format(self.players[self.turn].getName())
-            print(self.drawScreen(hide))
+            self.printScreen(hide)
             time.sleep(1)
             for i in range(2):
                 i #unused
-                self.elements['P{}Turn'.format(self.turn[-1])] = '\033[91m'
-                print(self.drawScreen(hide))
+                self.elements['P{}Turn'.format(self.turn[4:])] = '\033[91m'
+                self.printScreen(hide)
                 time.sleep(.3)
-                self.elements['P{}Turn'.format(self.turn[-1])] = ''
-                print(self.drawScreen(hide))
+                self.elements['P{}Turn'.format(self.turn[4:])] = ''
+                self.printScreen(hide)
                 time.sleep(.3)
         self.turnComplete = True
         self.event = ''
@@ -981,7 +1261,7 @@ class Match():
             if self.players[self.turn].getType() == 'Human':
                 self.elements['Console'] = 'Wild Card! Specifiy a Color: (B)lue, (R)ed, (G)reen, (Y)ellow'
                 self.elements['Error'] = 'Specifiy A Color'
-                print(self.drawScreen())
+                self.printScreen()
                 playerInput = str(input("Color Change: "))
                 checked = self.checkColorInput(playerInput)
                 while not checked['valid']:
@@ -995,17 +1275,18 @@ class Match():
                         if self.handPosition > self.players[self.turn].maxScroll:
                             self.handPosition = 0
                         self.buildHandVisual(self.turn)
-                    print(self.drawScreen())
+                    self.printScreen()
                     playerInput = str(input("Color Change: "))
                     checked = self.checkColorInput(playerInput)
             else:
                 hide = self.hideComputerHands
-                checked = self.checkColorInput(self.players[self.turn].getWildColor())
+                checked = self.checkColorInput(self.players[self.turn].getWildColor(self.rng, self))
             self.wildColorChange = checked['entry']
         else:
-            self.wildColorChange = self.checkColorInput(random.choice(('r','b','g','y')))['entry']
+            self.wildColorChange = self.checkColorInput(self.rng.choice(('r','b','g','y')))['entry']
             self.forcedWild = False
         self.currentColor = self.wildColorChange
+        self.record('color', self.turn, self.wildColorChange)
         self.elements['Error'] = ""
         if self.displayEffects and not self.simulation:
             self.elements['Console'] = 'Wild Card! Changing Color.'
@@ -1014,14 +1295,15 @@ class Match():
                 i #unused
                 if seed > 4:
                     seed = 1
-                print(self.drawScreen(hide,wildSeed=seed))
+                self.printScreen(hide,wildSeed=seed)
                 time.sleep(.1)
                 seed += 1
         self.pile[0].changeColor(self.wildColorChange)
         self.wildColorChange = ''
-        cardBigNums = self.pile[0].getBigNum(self.reverse)
-        self.elements['oHeader'] = '{}\u2666\u2666\u2666=========\u2666\u2666\u2666\033[0m\t'.format(self.pile[0].getColorCode())
-        self.elements['oMiddle'] = cardBigNums
+        if not self.simulation:
+            cardBigNums = self.pile[0].getBigNum(self.reverse)
+            self.elements['oHeader'] = '{}\u2666\u2666\u2666=========\u2666\u2666\u2666\033[0m\t'.format(self.pile[0].getColorCode())
+            self.elements['oMiddle'] = cardBigNums
         self.event = ''
         
     def eventDraw(self):
@@ -1035,20 +1317,31 @@ class Match():
         
         card = self.deck.draw()
         self.players[playerID].addCard(card)
+        self.record('deal', playerID, card)
+        if len(self.deck) == 0 and len(self.pile) > 1:
+            self.deck.refill(self.pile)
+            self.record('reshuffle')
+        if self.simulation:
+            return
         
         self.players[playerID].maxScroll = math.ceil((self.players[playerID].getCardNum() / 10)-1)
         self.handPosition = self.players[playerID].maxScroll
         self.buildHandVisual(playerID)
         
         keyStringCards = 'P{}Cards'
-        self.elements[keyStringCards.format(playerID[-1])] = '  '+(' '*(3-len(str(self.players[playerID].getCardNum()))))+str(self.players[playerID].getCardNum())+' Cards'
-        
+        self.elements[keyStringCards.format(playerID[4:])] = '  '+(' '*(3-len(str(self.players[playerID].getCardNum()))))+str(self.players[playerID].getCardNum())+' Cards'
+        self.buildDeckVisual()
+
+    def buildDeckVisual(self):
+        """Builds the deck count and height visual."""
         self.elements['DNum'] = len(self.deck)
         if len(str(len(self.deck))) < 2:
             self.elements['PostDNum'] = '\t'
+        else:
+            self.elements['PostDNum'] = ''
         j = 8
         self.elements['Deck'] = [' ',' ',' ',' ',' ',' ',' ',' ', ' ']
-        for i in range(math.ceil(len(self.deck)/12)):
+        for i in range(min(9, math.ceil(len(self.deck)/12))):
             i #unused
             self.elements['Deck'][j] = '='
             j -= 1
@@ -1058,23 +1351,16 @@ class Match():
         if card == None:
             card = self.deck.draw()
             self.elements['DNum'] = len(self.deck)
-            
-        cardColor = card.getColorCode()
-        cardBigNums = card.getBigNum(self.reverse)
+            self.record('flip', card)
+        else:
+            self.record('play', self.turn, card)
         
         self.currentColor = card.getColor()
         self.currentValue = card.getValue()
         
         self.pile.insert(card)
-        self.elements['oHeader'] = '{}\u2666\u2666\u2666=========\u2666\u2666\u2666\033[0m\t'.format(cardColor)
-        self.elements['oMiddle'] = cardBigNums
-        
-        if len(self.pile) > 1:
-            previousCard = self.pile[1]
-            previousCardColor = previousCard.getColorCode()
-            self.elements['uHeader'] = '{}      \u2666\u2666\u2666=========\u2666\u2666\u2666\033[0m\t\t'.format(previousCardColor)
-            self.elements['uMiddle'] = '{}| |\033[0m'.format(previousCardColor)
-            self.elements['uLower'] = '{}\u2666\u2666\u2666\033[0m'.format(previousCardColor)
+        if not self.simulation:
+            self.buildPileVisual()
             
         if self.currentColor == 'wild':
             self.event = 'wild'
@@ -1092,6 +1378,19 @@ class Match():
                 self.drawAmount = 2
         self.passes = 0
                 
+    def buildPileVisual(self):
+        """Builds the pile visual from the top two cards."""
+        card = self.pile[0]
+        self.elements['oHeader'] = '{}\u2666\u2666\u2666=========\u2666\u2666\u2666\033[0m\t'.format(card.getColorCode())
+        self.elements['oMiddle'] = card.getBigNum(self.reverse)
+        
+        if len(self.pile) > 1:
+            previousCard = self.pile[1]
+            previousCardColor = previousCard.getColorCode()
+            self.elements['uHeader'] = '{}      \u2666\u2666\u2666=========\u2666\u2666\u2666\033[0m\t\t'.format(previousCardColor)
+            self.elements['uMiddle'] = '{}| |\033[0m'.format(previousCardColor)
+            self.elements['uLower'] = '{}\u2666\u2666\u2666\033[0m'.format(previousCardColor)
+                
     def extractCard(self, playerID, index):
         """Extracts a card from a player's hand."""
         card = self.players[playerID].removeCard(index)
@@ -1101,6 +1400,119 @@ class Match():
         self.adjustCardAmount(playerID)
         return card
     
+    def snapshot(self):
+        """Returns the state of the match as compact bytes for restore."""
+        colors = Card.codeColors
+        values = Card.codeValues
+        flags = self.reverse | self.forcedWild << 1 | self.matchComplete << 2 | self.matchAbort << 3
+        parts = [self.snapshotHeader.pack(
+            self.snapshotMagic, self.snapshotVersion, len(self.turnList),
+            self.seatIndex.get(self.turn, 255), self.seatIndex.get(self.winnerID, 255),
+            colors.index(self.currentColor) if self.currentColor in colors else 255,
+            values.index(self.currentValue) if self.currentValue in values else 255,
+            self.snapshotEvents.index(self.event), flags, self.drawAmount, self.passes)]
+        for identity in self.turnList:
+            player = self.players[identity]
+            parts.append(self.snapshotSeat.pack(player.getForceDraws(), player.didDraw(), player.getCardNum()))
+        parts.append(struct.pack('<HH', len(self.deck), len(self.pile)))
+        parts.append(bytes(card.code for card in self.deck))
+        parts.append(bytes(card.code for card in self.pile))
+        for identity in self.turnList:
+            parts.append(bytes(card.code for card in self.players[identity].hand))
+        return b''.join(parts)
+
+    def restore(self, snapshot):
+        """
+        Loads the state saved by snapshot into this match, which must have as many players.
+
+        The whole snapshot is decoded and checked before any of it is applied,
+        so a damaged one raises BadInputError and leaves the match untouched.
+        """
+        header = self.snapshotHeader
+        try:
+            magic, version, numPlayers, turn, winner, color, value, event, flags, drawAmount, passes = header.unpack_from(snapshot)
+        except struct.error:
+            raise BadInputError('Snapshot Is Too Short')
+        if magic != self.snapshotMagic or version != self.snapshotVersion:
+            raise BadInputError('Not A Match Snapshot')
+        if numPlayers != len(self.turnList):
+            raise BadInputError('Snapshot Has {} Players, Match Has {}'.format(numPlayers, len(self.turnList)))
+        offset = header.size
+        seats = []
+        try:
+            for _ in range(numPlayers):
+                seats.append(self.snapshotSeat.unpack_from(snapshot, offset))
+                offset += self.snapshotSeat.size
+            deckSize, pileSize = struct.unpack_from('<HH', snapshot, offset)
+        except struct.error:
+            raise BadInputError('Snapshot Is Too Short')
+        offset += 4
+        if len(snapshot) != offset + deckSize + pileSize + sum(seat[2] for seat in seats):
+            raise BadInputError('Snapshot Is Damaged')
+        # 255 marks a seat, color or value that was unset when the snapshot was taken.
+        if turn >= numPlayers and turn != 255 or winner >= numPlayers and winner != 255:
+            raise BadInputError('Snapshot Has An Unknown Seat')
+        if color >= len(Card.codeColors) and color != 255 or value >= len(Card.codeValues) and value != 255:
+            raise BadInputError('Snapshot Has An Unknown Color Or Value')
+        if event >= len(self.snapshotEvents):
+            raise BadInputError('Snapshot Has An Unknown Event')
+        # Deleting every valid code leaves only the unknown ones.
+        unknown = bytes(snapshot[offset:]).translate(None, Card.validCodes)
+        if unknown:
+            raise BadInputError('Snapshot Has An Unknown Card: {}'.format(unknown[0]))
+
+        fromCode = Card.fromCode
+        deck = Deck(False, self.rng)
+        deck.deck.extend(map(fromCode, snapshot[offset:offset + deckSize]))
+        offset += deckSize
+        pile = Deck(False, self.rng)
+        pile.deck.extend(map(fromCode, snapshot[offset:offset + pileSize]))
+        offset += pileSize
+        hands = []
+        for _, _, handSize in seats:
+            hands.append([fromCode(code) for code in snapshot[offset:offset + handSize]])
+            offset += handSize
+
+        self.deck = deck
+        self.pile = pile
+        for identity, (forceDraws, drew, _), hand in zip(self.turnList, seats, hands):
+            player = self.players[identity]
+            player.takeHand(hand)
+            player.forceDraw = forceDraws
+            player.drew = bool(drew)
+        self.turn = self.turnList[turn] if turn < numPlayers else ''
+        self.winnerID = self.turnList[winner] if winner < numPlayers else ''
+        self.currentColor = Card.codeColors[color] if color < len(Card.codeColors) else ''
+        self.currentValue = Card.codeValues[value] if value < len(Card.codeValues) else ''
+        self.event = self.snapshotEvents[event]
+        self.reverse = bool(flags & 1)
+        self.forcedWild = bool(flags & 2)
+        self.matchComplete = bool(flags & 4)
+        self.matchAbort = bool(flags & 8)
+        self.drawAmount = drawAmount
+        self.passes = passes
+        self.turnComplete = False
+        self.handPosition = 0
+        if self.simulation:
+            return
+
+        for identity in self.turnList:
+            self.adjustCardAmount(identity)
+            self.elements['P{}Turn'.format(identity[4:])] = ''
+        self.buildDeckVisual()
+        if len(self.pile) > 0:
+            self.buildPileVisual()
+        if self.turn:
+            self.elements['P{}Turn'.format(self.turn[4:])] = '\033[93m'
+            self.elements['HName'] = self.handTitles[self.turn]
+            self.buildHandVisual(self.turn)
+        self.screen.invalidate()
+
+    def record(self, event, *args):
+        """Passes a match event to the recorder, if there is one."""
+        if self.recorder is not None:
+            self.recorder.record(self, event, *args)
+    
     def enterBreak(self):
         """Pauses the game until the user presses enter."""
         if not self.simulation:
@@ -1113,6 +1525,7 @@ class Match():
         self.handPosition = 0
         turnType = self.players[self.turn].getType()
         self.players[self.turn].beginTurn()
+        self.record('turn', self.turn)
         
         self.elements['HName'] = self.handTitles[self.turn]
         self.buildHandVisual(self.turn)
@@ -1132,11 +1545,11 @@ class Match():
                     self.elements['Console'] = 'Select a card, (D)raw, (P)ause, or Pas(s).'
                 if self.players[self.turn].getForceDraws() > 0:
                     self.elements['Error'] = 'Draw Card Played! Draw {} cards.'.format(self.players[self.turn].getForceDraws())
-                print(self.drawScreen())
+                self.printScreen()
                 playerInput = str(input("\033[97mSelection: \033[92m"))
                 checked = self.checkInput(playerInput)
                 while not checked['valid']:
-                    print(self.drawScreen())
+                    self.printScreen()
                     playerInput = str(input("\033[97mSelection: \033[92m"))
                     checked = self.checkInput(playerInput)
     
@@ -1165,6 +1578,8 @@ class Match():
                         self.turnComplete = True
                         self.winnerID = 'play1'
                         self.matchAbort = True
+                    elif pauseOutput == 'load':
+                        return
                 elif playerInput == 's':
                     if len(self.deck) > 0:
                         self.elements['Error'] = "Cannot pass until Deck is empty."
@@ -1173,6 +1588,7 @@ class Match():
                     else:
                         self.turnComplete = True
                         self.passes += 1
+                        self.record('pass', self.turn)
                         if self.passes == self.passMax:
                             self.forcedWild = True
                             self.event = 'wild'
@@ -1191,9 +1607,9 @@ class Match():
                         pass
                     
             elif turnType == 'Computer':
-                self.elements['Console'] = '{}\'s Turn'.format(self.players[self.turn].getName())
-                print(self.drawScreen(self.hideComputerHands))
                 if not self.simulation:
+                    self.elements['Console'] = '{}\'s Turn'.format(self.players[self.turn].getName())
+                    self.printScreen(self.hideComputerHands)
                     time.sleep(self.computerSpeed)
                 while (True):
                     if self.displayEffects and not self.simulation:
@@ -1213,11 +1629,12 @@ class Match():
                         if cardIndex == 'd':
                             if len(self.deck) > 0:
                                 self.dealCard(self.turn)
-                                print(self.drawScreen(self.hideComputerHands))
+                                self.printScreen(self.hideComputerHands)
                             else:
                                 self.turnComplete = True
                                 self.players[self.turn].removeForceDraw()
                                 self.passes += 1
+                                self.record('pass', self.turn)
                                 if self.passes == self.passMax:
                                     self.forcedWild = True
                                     self.event = 'wild'
@@ -1229,9 +1646,12 @@ class Match():
         elif self.event == 'wild':
             self.eventWildCard()
             
-        self.elements['P{}Turn'.format(self.turn[-1])] = ''
+        if self.simulation:
+            self.turn = self.getNextTurn()
+            return
+        self.elements['P{}Turn'.format(self.turn[4:])] = ''
         self.turn = self.getNextTurn()
-        self.elements['P{}Turn'.format(self.turn[-1])] = '\033[93m'
+        self.elements['P{}Turn'.format(self.turn[4:])] = '\033[93m'
 
     def drawScreen(self, hide=False, wildSeed=0):
         """Draws the main game screen."""
@@ -1251,12 +1671,7 @@ class Match():
         else:
             colorMod = ['','','','']
 
-        self.clearShell()
-        screenout = ''
-        screenout += '\t\t\033[94m      || ||\033[92m ||\ ||  \033[91m// \\\\\n\033[0m'
-        screenout += '\t\t\033[94m      || ||\033[92m ||\\\|| \033[91m((   ))\n\033[0m'
-        screenout += '\t\t\033[94m      \\\ //\033[92m || \|| \033[91m \\\ //\n\033[0m'
-        screenout += '\033[97m===============================================================\n'
+        screenout = self.screenHeader
         screenout += '\033[93m{}\033[0m\n'.format(self.elements['Console'])
         screenout += '\033[97m===============================================================\n'
         screenout += '\t\t\t\t\t\t'     +        ' \033[97m{}\u2666-----------\u2666\033[0m\n'.format(self.elements['P1Turn'])
@@ -1275,22 +1690,39 @@ class Match():
         screenout += '\033[97m |_'      +     '\033[91m{}\033[0m'.format(self.elements['Deck'][8])          +        '\033[97m_|\t\t         '                                                      +      '\033[97m{}{}'.format(colorMod[2],self.elements['oHeader'])          +       ' \033[97m{}|{}|\033[0m\n'.format(self.elements['P4Turn'],self.elements['P4Name'])
         screenout += '\033[97m\t\t         '    +                                                                                                                                                                   '\033[97m{}{}'.format(colorMod[3],self.elements['oHeader'])         +       ' \033[97m{}|{}|\033[0m\n'.format(self.elements['P4Turn'],self.elements['P4Cards'])
         screenout += '\t\t\t\t\t\t'     +       ' \033[97m{}\u2666-----------\u2666\033[0m\n'.format(self.elements['P4Turn'])
+        # Seats past the fourth are stacked under the first four boxes.
+        for seat in range(5, len(self.players) + 1):
+            seatTurn = self.elements.get('P{}Turn'.format(seat), '')
+            screenout += '\t\t\t\t\t\t'     +       ' \033[97m{}\u2666-----------\u2666\033[0m\n'.format(seatTurn)
+            screenout += '\t\t\t\t\t\t'     +       ' \033[97m{}|{}|\033[0m\n'.format(seatTurn,self.elements['P{}Name'.format(seat)])
+            screenout += '\t\t\t\t\t\t'     +       ' \033[97m{}|{}|\033[0m\n'.format(seatTurn,self.elements['P{}Cards'.format(seat)])
+            screenout += '\t\t\t\t\t\t'     +       ' \033[97m{}\u2666-----------\u2666\033[0m\n'.format(seatTurn)
         screenout += "\033[97m{}".format(self.elements['HName'])        +       "\t\t\t\t {}\n".format(self.elements['HVisual'])
         screenout += '\033[97m===============================================================\n'
         screenout += self.players[currentTurn].getHand(self.handPosition,hide)
         screenout += '\033[91m{}\033[0m'.format(self.elements['Error'])
         return screenout
-    
+
+    def printScreen(self, hide=False, wildSeed=0):
+        """Prints the main game screen unless the match is a simulation."""
+        if not self.simulation:
+            self.screen.paint(self.drawScreen(hide, wildSeed))
+
     def pauseScreen(self):
         """Displays the pause screen."""
+        self.screen.invalidate()
+        message = ''
         while True:
             self.clearShell()
             print('\n\t\t\tPause')
             print('\n\t\t1. Resume')
-            print('\t\t2. Quit')
+            print('\t\t2. Save Game')
+            print('\t\t3. Load Game')
+            print('\t\t4. Quit')
+            print('\n\033[91m{}\033[0m'.format(message))
             
             selection = str(input('\nSelection: ')).upper()
-            while selection not in ['1', '2']:
+            while selection not in ['1', '2', '3', '4']:
                 print('\nSelection Invalid')
                 selection = str(input('\nSelection: ')).upper()
                 
@@ -1298,6 +1730,26 @@ class Match():
                 return ""
                 
             elif selection == '2':
+                path = str(input('\nSave File ({}): '.format(self.saveFile))) or self.saveFile
+                try:
+                    with open(path, 'wb') as saveFile:
+                        saveFile.write(self.snapshot())
+                    message = 'Game Saved to {}'.format(path)
+                except OSError as error:
+                    message = 'Could Not Save: {}'.format(error.strerror)
+
+            elif selection == '3':
+                path = str(input('\nSave File ({}): '.format(self.saveFile))) or self.saveFile
+                try:
+                    with open(path, 'rb') as saveFile:
+                        self.restore(saveFile.read())
+                    return "load"
+                except OSError as error:
+                    message = 'Could Not Load: {}'.format(error.strerror)
+                except BadInputError as error:
+                    message = 'Could Not Load: {}'.format(error)
+
+            elif selection == '4':
                 return "quit"
                 
     
@@ -1315,17 +1767,11 @@ class Match():
             reverse = not self.reverse
         else:
             reverse = self.reverse
-        currentIndex = self.turnList.index(self.turn)
+        currentIndex = self.seatIndex[self.turn]
         if not reverse:
-            if (currentIndex + 1) == len(self.turnList):
-                return self.turnList[0]
-            else:
-                return self.turnList[currentIndex+1]
+            return self.turnList[(currentIndex + 1) % len(self.turnList)]
         else:
-            if currentIndex == 0:
-                return self.turnList[len(self.turnList) - 1]
-            else:
-                return self.turnList[currentIndex-1]
+            return self.turnList[(currentIndex - 1) % len(self.turnList)]
             
     def getPlayer(self, playerID):
         """Returns the player object for a given ID."""
@@ -0,0 +1,340 @@
+"""
+Computer player strategies for the UNO game.
+
+A `ComputerPlayer` from `uno.py` can be given a `Strategy`, which it asks for
+every card and color choice through a read-only `MatchView`. This module holds
+the strategies that are more involved than the built-in heuristic.
+
+`MonteCarloStrategy` evaluates its legal moves by determinization: it deals
+the cards it has not seen (everything outside its own hand and the discard
+pile) at random to the other players, in the amounts they are known to hold,
+and plays the match out headlessly with heuristic computer players. Each deal
+is taken as a `Match.snapshot`, and every candidate move is played out from a
+`Match.restore` of the same snapshot, so the moves are compared on identical
+deals. Deals are sampled until the time budget for the move runs out, and the
+move that won most often is played. Because the rollouts reuse one `Match` in
+its `computerSimulation` mode, their speed is the speed of the tournament
+runner, and the strategy records how many it managed.
+
+Classes:
+    MonteCarloStrategy: Picks moves by sampling hidden hands and rollouts.
+
+Functions:
+    createSettings: Seats a Monte Carlo player against heuristic computers.
+    main: The command-line entry point.
+
+Usage:
+    To pit a Monte Carlo player with 50ms per move against three heuristic
+    computers for 20 matches:
+    $ python uno_ai.py 20 --budget 50
+"""
+import argparse
+import random
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+from uno import Card, ComputerPlayer, Deck, GameSettings, Match, MatchView, Strategy
+from uno_compact import STANDARD_DECK, WILD, decodeCard, decksFor, isWildCode
+from uno_tournament import MAX_TURNS, TournamentResult, playMatch
+
+# Rollouts still running after this many turns are scored as a loss.
+ROLLOUT_TURNS = 300
+
+
+def _unplayedCode(card: Card) -> int:
+    """Returns the code a card had in the deck, undoing any wild color."""
+    code = card.getCode()
+    if isWildCode(code):
+        return WILD * 16 + (code & 15)
+    return code
+
+
+class _FirstMove(Strategy):
+    """Plays one fixed move, then hands every later decision to the heuristic."""
+
+    def __init__(self, move: str):
+        """
+        Initializes the strategy with the move to play first.
+
+        Args:
+            move (str): A hand index as a string, or 'd' to draw.
+        """
+        self.move = move
+
+    def chooseCard(self, view: MatchView) -> Optional[str]:
+        """Returns the fixed move the first time it is asked, then None."""
+        move, self.move = self.move, None
+        return move
+
+
+class MonteCarloStrategy(Strategy):
+    """
+    Chooses cards by playing out sampled deals of the hidden cards.
+
+    Attributes:
+        budgetMs (float): The thinking time allowed per move, in milliseconds.
+        rng: The source of randomness for sampling and rollouts.
+        rollouts (int): The rollouts played over the strategy's lifetime.
+        thinkingTime (float): The seconds spent in rollouts over its lifetime.
+        lastStats (Dict[str, float]): Rollout counts and speed for the most
+            recent move.
+    """
+
+    def __init__(self, budgetMs: float = 100, rng=None):
+        """
+        Initializes a Monte Carlo strategy.
+
+        Args:
+            budgetMs (float): The thinking time allowed per move.
+            rng: A `random.Random` or the `random` module. Defaults to a new
+                `random.Random`.
+        """
+        self.budgetMs = budgetMs
+        self.rng = random.Random() if rng is None else rng
+        self.rollouts = 0
+        self.thinkingTime = 0.0
+        self.lastStats: Dict[str, float] = {}
+        self._settings: Optional[GameSettings] = None
+        self._match: Optional[Match] = None
+
+    def rolloutsPerSecond(self) -> float:
+        """Returns the average rollout speed over the strategy's lifetime."""
+        if self.thinkingTime == 0:
+            return 0.0
+        return self.rollouts / self.thinkingTime
+
+    def chooseCard(self, view: MatchView) -> Optional[str]:
+        """
+        Picks the candidate move with the best rollout win rate.
+
+        Args:
+            view (MatchView): The match as seen from the strategy's seat.
+
+        Returns:
+            Optional[str]: A hand index as a string or 'd' to draw. None is
+            never returned, as there is always at least one candidate.
+        """
+        candidates = self.getCandidates(view)
+        if len(candidates) == 1:
+            self.lastStats = {'rollouts': 0, 'rolloutsPerSecond': 0.0, 'candidates': 1}
+            return candidates[0]
+
+        wins = [0] * len(candidates)
+        unseen = self.getUnseenCodes(view)
+        start = time.perf_counter()
+        deadline = start + self.budgetMs / 1000
+        index = 0
+        while index == 0 or time.perf_counter() < deadline:
+            position = self.deal(view, unseen)
+            for slot, move in enumerate(candidates):
+                wins[slot] += self.rollout(view, move, position)
+            index += len(candidates)
+        elapsed = time.perf_counter() - start
+
+        self.rollouts += index
+        self.thinkingTime += elapsed
+        self.lastStats = {'rollouts': index, 'rolloutsPerSecond': index / elapsed if elapsed else 0.0,
+                          'candidates': len(candidates)}
+        best = max(range(len(candidates)), key=lambda slot: wins[slot])
+        return candidates[best]
+
+    def chooseColor(self, view: MatchView) -> Optional[str]:
+        """Returns the color held most often, or None to let the heuristic pick."""
+        colors = Counter(card.getColor() for card in view.getHand() if not card.isWild())
+        if not colors:
+            return None
+        return colors.most_common(1)[0][0]
+
+    def getCandidates(self, view: MatchView) -> List[str]:
+        """
+        Lists the distinct moves open to the player.
+
+        Identical cards lead to identical games, so only the first of each
+        card is kept. Drawing is only a candidate when nothing can be played:
+        the player is asked again after every draw, so a rollout that draws
+        and then plays on with the heuristic scores much like the card the
+        heuristic plays, and choosing it would keep drawing the player's
+        hand up.
+
+        Args:
+            view (MatchView): The match as seen from the strategy's seat.
+
+        Returns:
+            List[str]: Hand indexes as strings, or just 'd' if none are legal.
+        """
+        hand = view.getHand()
+        candidates = []
+        seen = set()
+        for index in view.getLegalIndexes():
+            code = hand[index].getCode()
+            if code not in seen:
+                seen.add(code)
+                candidates.append(str(index))
+        if not candidates:
+            candidates.append('d')
+        return candidates
+
+    def getUnseenCodes(self, view: MatchView) -> List[int]:
+        """
+        Returns the codes of the cards the player cannot see.
+
+        These are the cards of the full decks minus the player's hand and the
+        discard pile, so they are split between the draw deck and the other
+        players' hands.
+
+        Args:
+            view (MatchView): The match as seen from the strategy's seat.
+
+        Returns:
+            List[int]: The unseen card codes.
+        """
+        remaining = Counter(STANDARD_DECK * view.getNumDecks())
+        for card in view.getHand():
+            remaining[_unplayedCode(card)] -= 1
+        for card in view.getPile():
+            remaining[_unplayedCode(card)] -= 1
+        return list(remaining.elements())
+
+    def getSettings(self, view: MatchView) -> GameSettings:
+        """Returns headless settings seated like the match, reusing them between moves."""
+        turnOrder = view.getTurnOrder()
+        if self._settings is None or tuple(self._settings.players) != turnOrder:
+            gs = GameSettings()
+            for identity in turnOrder:
+                gs.addPlayer(ComputerPlayer(identity))
+            gs.computerSimulation = True
+            gs.displayEffects = False
+            gs.finalizePlayers()
+            self._settings = gs
+            self._match = None
+        self._settings.numDecks = view.getNumDecks()
+        return self._settings
+
+    def getMatch(self, view: MatchView) -> Match:
+        """Returns the headless match the rollouts are played in, reusing it between moves."""
+        gs = self.getSettings(view)
+        if self._match is None:
+            self._match = Match(gs, self.rng)
+        return self._match
+
+    def deal(self, view: MatchView, unseen: List[int]) -> bytes:
+        """
+        Deals the unseen cards at random and snapshots the resulting match.
+
+        Args:
+            view (MatchView): The match as seen from the strategy's seat.
+            unseen (List[int]): The unseen card codes to deal out.
+
+        Returns:
+            bytes: A `Match.snapshot` with the player to move.
+        """
+        codes = list(unseen)
+        self.rng.shuffle(codes)
+        match = self.getMatch(view)
+        playerID = view.getPlayerID()
+        counts = view.getCardCounts()
+
+        dealt = 0
+        for identity in match.turnList:
+            player = match.players[identity]
+            player.removeForceDraw()
+            player.drew = False
+            player.strategy = None
+            if identity == playerID:
+                player.takeHand([decodeCard(card.getCode()) for card in view.getHand()])
+            else:
+                player.takeHand([decodeCard(code) for code in codes[dealt:dealt + counts[identity]]])
+                dealt += counts[identity]
+
+        match.deck = Deck(False, self.rng)
+        for code in codes[dealt:]:
+            match.deck.place(decodeCard(code))
+        match.pile = Deck(False, self.rng)
+        for card in view.getPile():
+            match.pile.place(decodeCard(card.getCode()))
+        match.currentColor = view.getCurrentColor()
+        match.currentValue = view.getCurrentValue()
+        match.reverse = view.isReversed()
+        match.turn = playerID
+        match.winnerID = ''
+        match.event = ''
+        match.drawAmount = 0
+        match.passes = 0
+        match.forcedWild = False
+        match.matchComplete = False
+        match.matchAbort = False
+        return match.snapshot()
+
+    def rollout(self, view: MatchView, move: str, position: bytes) -> int:
+        """
+        Plays a dealt position out to the end after making a move.
+
+        Args:
+            view (MatchView): The match as seen from the strategy's seat.
+            move (str): The move to play first.
+            position (bytes): A snapshot from `deal`.
+
+        Returns:
+            int: 1 if the player won the rollout, otherwise 0.
+        """
+        match = self.getMatch(view)
+        match.restore(position)
+        playerID = view.getPlayerID()
+        match.players[playerID].strategy = _FirstMove(move)
+
+        turns = 0
+        while not match.isComplete() and turns < ROLLOUT_TURNS:
+            match.nextTurn()
+            turns += 1
+        match.players[playerID].strategy = None
+        return 1 if match.isComplete() and match.winnerID == playerID else 0
+
+
+def createSettings(numPlayers: int = 4, budgetMs: float = 100, rng=None) -> GameSettings:
+    """
+    Seats a Monte Carlo player first, followed by heuristic computer players.
+
+    Args:
+        numPlayers (int): The number of players, from 2 to 10.
+        budgetMs (float): The Monte Carlo player's thinking time per move.
+        rng: The random generator for the Monte Carlo player.
+
+    Returns:
+        GameSettings: Finalized headless settings ready for `Match`.
+    """
+    gs = GameSettings()
+    gs.addPlayer(ComputerPlayer('Monte Carlo', MonteCarloStrategy(budgetMs, rng)))
+    for _ in range(numPlayers - 1):
+        gs.addPlayer(ComputerPlayer(gs.getComputerName()))
+    gs.numDecks = decksFor(numPlayers)
+    gs.computerSimulation = True
+    gs.displayEffects = False
+    gs.finalizePlayers()
+    return gs
+
+
+def main() -> None:
+    """Parses the command line and plays the Monte Carlo player against heuristic computers."""
+    parser = argparse.ArgumentParser(description='Evaluate the Monte Carlo UNO player against heuristic computers.')
+    parser.add_argument('matches', type=int, nargs='?', default=20, help='number of matches to play')
+    parser.add_argument('--players', type=int, default=4, help='number of players (2-10)')
+    parser.add_argument('--budget', type=float, default=100, help='thinking time per move in milliseconds')
+    parser.add_argument('--seed', type=int, default=None, help='seed for the matches and the rollouts')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    gs = createSettings(args.players, args.budget, random.Random(rng.random()))
+    strategy = gs.playerStaging[0].strategy
+    result = TournamentResult([player.getName() for player in gs.playerStaging])
+    start = time.perf_counter()
+    for _ in range(args.matches):
+        gs, winner, points, turns = playMatch(gs, MAX_TURNS, rng)
+        result.record(winner, points, turns)
+    result.elapsed = time.perf_counter() - start
+    print(result.summary())
+    print('{:,} rollouts, {:,.0f} rollouts per second'.format(strategy.rollouts, strategy.rolloutsPerSecond()))
+
+
+if __name__ == "__main__":
+    main()
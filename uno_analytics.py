@@ -0,0 +1,436 @@
+"""
+Statistical analysis of large batches of simulated UNO matches.
+
+All-computer `Match` games are played in batches, and the outcome of each
+one is packed into a row of a NumPy structured array: the game length, the
+seat of the winner counted from the player who moved first, the points the
+winner collected from `Card.getPoints`, and the opening hand of every seat
+as counts of each card type. Batches can be written to an outcome file and
+read back one batch at a time, so a run of millions of games is analyzed
+without ever holding more than one batch in memory.
+
+`OutcomeStats` keeps running sums over the batches it is given and reports:
+    - the win probability of each seat, which shows any first-player
+      advantage,
+    - the expected points won from each seat,
+    - the average game length,
+    - the marginal value of each card type: the change in win probability
+      from holding one more of it in the opening hand instead of a number
+      card, fitted by least squares with a term for every seat.
+
+Confidence intervals come from a Poisson bootstrap. Every game is given an
+independent Poisson(1) weight in each bootstrap replicate, which resamples
+the games with replacement without needing to see them all at once, so each
+replicate is just another set of running sums.
+
+Classes:
+    OutcomeCollector: Records the outcome of each match it is attached to.
+    OutcomeStats: Accumulates outcome batches and their bootstrap replicates.
+
+Functions:
+    simulateOutcomes: Plays matches and yields their outcomes in batches.
+    writeOutcomes: Writes outcome batches to a file.
+    readOutcomes: Reads an outcome file back in batches.
+    formatSummary: Formats the results of `OutcomeStats.summary`.
+    main: The command-line entry point.
+
+Usage:
+    To simulate 100,000 four-player matches into a file and analyze it:
+    $ python uno_analytics.py simulate 100000 --output games.uno.bin --seed 1
+    $ python uno_analytics.py analyze games.uno.bin
+
+    To analyze 10,000 matches without keeping them:
+    $ python uno_analytics.py run 10000
+"""
+import argparse
+import random
+import struct
+import time
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from uno_tournament import MAX_TURNS, createSettings, playMatch
+
+MAGIC = b'UNOA'
+VERSION = 1
+_HEADER = struct.Struct('<4sBB')
+
+# Card types counted in opening hands. Number cards are pooled, as every
+# color and digit plays the same way for the computer players.
+CARD_TYPES = ('number', 'X', 'R', '+2', 'W', '+4')
+_TYPE_INDEX = {value: CARD_TYPES.index(value) for value in CARD_TYPES[1:]}
+_TYPE_INDEX.update((str(digit), 0) for digit in range(10))
+
+BATCH_SIZE = 4096
+REPLICATES = 200
+CONFIDENCE = 0.95
+
+
+def outcomeDtype(numPlayers: int) -> np.dtype:
+    """
+    Returns the row layout of one match outcome.
+
+    Args:
+        numPlayers (int): The number of seats.
+
+    Returns:
+        np.dtype: A structured dtype with turns, winner, points and hands.
+    """
+    return np.dtype([
+        ('turns', '<u4'),
+        ('winner', 'i1'),
+        ('points', '<u4'),
+        ('hands', 'u1', (numPlayers, len(CARD_TYPES))),
+    ])
+
+
+class OutcomeCollector:
+    """
+    A `Match` recorder that keeps only what the analysis needs.
+
+    It is attached the same way as `uno_record.GameRecorder`. When the
+    first card is turned it notes the seat order and the opening hands;
+    when the match ends it notes the winner and points.
+
+    Attributes:
+        turnOrder (List[str]): Player IDs in turn order from the first
+            player to move.
+        hands (np.ndarray): Opening card type counts by seat.
+        winner (int): The winner's seat, or -1 if the match was abandoned.
+        points (int): The points the winner collected.
+    """
+
+    def __init__(self, numPlayers: int):
+        """
+        Initializes a collector for matches with a number of seats.
+
+        Args:
+            numPlayers (int): The number of seats.
+        """
+        self.hands = np.zeros((numPlayers, len(CARD_TYPES)), np.uint8)
+        self.turnOrder: List[str] = []
+        self.winner = -1
+        self.points = 0
+        self.handlers = {'begin': self.recordBegin, 'flip': self.recordFlip, 'end': self.recordEnd}
+
+    def record(self, match, event: str, *args) -> None:
+        """Handles one event from `Match.record`."""
+        handler = self.handlers.get(event)
+        if handler is not None:
+            handler(match, *args)
+
+    def recordBegin(self, match) -> None:
+        """Clears the previous match."""
+        self.turnOrder = []
+        self.winner = -1
+        self.points = 0
+
+    def recordFlip(self, match, card) -> None:
+        """Notes the seats and opening hands when the first card is turned."""
+        if self.turnOrder:
+            return
+        first = match.turnList.index(match.turn)
+        self.turnOrder = match.turnList[first:] + match.turnList[:first]
+        self.hands[:] = 0
+        for seat, identity in enumerate(self.turnOrder):
+            for card in match.players[identity].hand:
+                self.hands[seat, _TYPE_INDEX[card.getValue()]] += 1
+
+    def recordEnd(self, match, winnerID: Optional[str], points: int) -> None:
+        """Notes the winner's seat and points."""
+        if winnerID is not None:
+            self.winner = self.turnOrder.index(winnerID)
+            self.points = points
+
+
+def simulateOutcomes(numGames: int, numPlayers: int = 4, rng: Optional[random.Random] = None,
+                     batchSize: int = BATCH_SIZE, maxTurns: int = MAX_TURNS) -> Iterator[np.ndarray]:
+    """
+    Plays headless matches and yields their outcomes in batches.
+
+    Args:
+        numGames (int): How many matches to play.
+        numPlayers (int): The number of computer players, from 2 to 10.
+        rng (Optional[random.Random]): The source of randomness for every
+            match. Defaults to a new `random.Random`.
+        batchSize (int): The most outcomes in one batch.
+        maxTurns (int): The turn limit after which a match is abandoned.
+
+    Yields:
+        np.ndarray: Outcome rows of `outcomeDtype(numPlayers)`.
+    """
+    rng = random.Random() if rng is None else rng
+    gs = createSettings(numPlayers)
+    collector = OutcomeCollector(numPlayers)
+    dtype = outcomeDtype(numPlayers)
+    played = 0
+    while played < numGames:
+        batch = np.zeros(min(batchSize, numGames - played), dtype)
+        for row in batch:
+            gs, _, _, turns = playMatch(gs, maxTurns, rng, collector)
+            row['turns'] = turns
+            row['winner'] = collector.winner
+            row['points'] = collector.points
+            row['hands'] = collector.hands
+        played += len(batch)
+        yield batch
+
+
+def writeOutcomes(stream: BinaryIO, numPlayers: int, batches: Iterable[np.ndarray]) -> int:
+    """
+    Writes outcome batches to a binary stream.
+
+    Args:
+        stream (BinaryIO): The stream to write to.
+        numPlayers (int): The number of seats in every outcome.
+        batches (Iterable[np.ndarray]): The batches to write.
+
+    Returns:
+        int: The number of outcomes written.
+    """
+    stream.write(_HEADER.pack(MAGIC, VERSION, numPlayers))
+    count = 0
+    for batch in batches:
+        stream.write(batch.tobytes())
+        count += len(batch)
+    return count
+
+
+def readOutcomes(stream: BinaryIO, batchSize: int = BATCH_SIZE) -> Iterator[np.ndarray]:
+    """
+    Reads an outcome file back one batch at a time.
+
+    Args:
+        stream (BinaryIO): A stream written by `writeOutcomes`.
+        batchSize (int): The most outcomes in one batch.
+
+    Yields:
+        np.ndarray: Outcome rows of `outcomeDtype` for the file's seats.
+
+    Raises:
+        ValueError: If the stream is not an outcome file or is truncated.
+    """
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError('Outcome file is too short')
+    magic, version, numPlayers = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError('Not an UNO outcome file')
+    if version != VERSION:
+        raise ValueError('Unsupported outcome file version {}'.format(version))
+    dtype = outcomeDtype(numPlayers)
+    while True:
+        data = stream.read(batchSize * dtype.itemsize)
+        if not data:
+            return
+        if len(data) % dtype.itemsize:
+            raise ValueError('Outcome file ends partway through a match')
+        yield np.frombuffer(data, dtype)
+
+
+class OutcomeStats:
+    """
+    Running sums over match outcomes, with Poisson bootstrap replicates.
+
+    Replicate 0 gives every game a weight of one and holds the point
+    estimates; the others give each game a Poisson(1) weight.
+
+    Attributes:
+        numPlayers (int): The number of seats.
+        replicates (int): The number of bootstrap replicates.
+        games (np.ndarray): Total weight of the finished games, by replicate.
+        aborted (int): Abandoned games, which are left out of every statistic.
+        wins (np.ndarray): Weighted wins by replicate and seat.
+        points (np.ndarray): Weighted points won by replicate and seat.
+        turns (np.ndarray): Weighted game lengths by replicate.
+        gram (np.ndarray): The weighted X'X of the card value fit, by
+            replicate.
+        moments (np.ndarray): The weighted X'y of the card value fit, by
+            replicate.
+    """
+
+    def __init__(self, numPlayers: int, replicates: int = REPLICATES, rng: Optional[np.random.Generator] = None):
+        """
+        Initializes empty sums.
+
+        Args:
+            numPlayers (int): The number of seats.
+            replicates (int): The number of bootstrap replicates.
+            rng (Optional[np.random.Generator]): Draws the bootstrap weights.
+                Defaults to a new `np.random.default_rng()`.
+        """
+        self.numPlayers = numPlayers
+        self.replicates = replicates
+        self.rng = np.random.default_rng() if rng is None else rng
+        features = numPlayers + len(CARD_TYPES) - 1
+        total = replicates + 1
+        self.games = np.zeros(total)
+        self.aborted = 0
+        self.wins = np.zeros((total, numPlayers))
+        self.points = np.zeros((total, numPlayers))
+        self.turns = np.zeros(total)
+        self.gram = np.zeros((total, features, features))
+        self.moments = np.zeros((total, features))
+
+    def update(self, batch: np.ndarray) -> None:
+        """
+        Adds a batch of outcomes to the sums.
+
+        Args:
+            batch (np.ndarray): Outcome rows of `outcomeDtype(numPlayers)`.
+        """
+        finished = batch[batch['winner'] >= 0]
+        self.aborted += len(batch) - len(finished)
+        if len(finished) == 0:
+            return
+        numPlayers = self.numPlayers
+        weights = np.empty((self.replicates + 1, len(finished)))
+        weights[0] = 1
+        weights[1:] = self.rng.poisson(1.0, (self.replicates, len(finished)))
+
+        won = np.zeros((len(finished), numPlayers))
+        won[np.arange(len(finished)), finished['winner']] = 1
+        self.games += weights.sum(axis=1)
+        self.wins += weights @ won
+        self.points += weights @ (won * finished['points'][:, None])
+        self.turns += weights @ finished['turns'].astype(float)
+
+        # One row per seat: a term for the seat, then the opening count of
+        # each card type other than numbers, which they are measured against.
+        rows = np.zeros((len(finished), numPlayers, self.gram.shape[1]))
+        rows[:, :, :numPlayers] = np.eye(numPlayers)
+        rows[:, :, numPlayers:] = finished['hands'][:, :, 1:]
+        rows = rows.reshape(-1, self.gram.shape[1])
+        outcomes = won.reshape(-1)
+        rowWeights = np.repeat(weights, numPlayers, axis=1)
+        for replicate in range(self.replicates + 1):
+            weighted = rows.T * rowWeights[replicate]
+            self.gram[replicate] += weighted @ rows
+            self.moments[replicate] += weighted @ outcomes
+
+    def _interval(self, replicates: np.ndarray, confidence: float) -> Dict[str, np.ndarray]:
+        """Returns the estimate and percentile interval from replicate 0 and the rest."""
+        tail = (1 - confidence) / 2 * 100
+        return {
+            'estimate': replicates[0],
+            'low': np.nanpercentile(replicates[1:], tail, axis=0),
+            'high': np.nanpercentile(replicates[1:], 100 - tail, axis=0),
+        }
+
+    def summary(self, confidence: float = CONFIDENCE) -> Dict[str, object]:
+        """
+        Computes the statistics and their confidence intervals.
+
+        Args:
+            confidence (float): The coverage of the intervals.
+
+        Returns:
+            Dict[str, object]: The game counts, and for 'winProbability',
+            'expectedPoints', 'gameLength' and 'cardValue' a dict of
+            'estimate', 'low' and 'high' arrays.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            games = self.games[:, None]
+            values = np.full(self.moments.shape, np.nan)
+            for replicate in range(self.replicates + 1):
+                try:
+                    values[replicate] = np.linalg.solve(self.gram[replicate], self.moments[replicate])
+                except np.linalg.LinAlgError:
+                    pass
+            return {
+                'games': int(self.games[0]),
+                'aborted': self.aborted,
+                'winProbability': self._interval(self.wins / games, confidence),
+                'expectedPoints': self._interval(self.points / games, confidence),
+                'gameLength': self._interval(self.turns / self.games, confidence),
+                'cardValue': self._interval(values[:, self.numPlayers:], confidence),
+            }
+
+
+def formatSummary(summary: Dict[str, object], confidence: float = CONFIDENCE) -> str:
+    """
+    Formats the results of `OutcomeStats.summary` as a table.
+
+    Args:
+        summary (Dict[str, object]): The statistics to format.
+        confidence (float): The coverage the intervals were computed for.
+
+    Returns:
+        str: The formatted results.
+    """
+    header = '{:.0%} confidence intervals from a Poisson bootstrap'.format(confidence)
+    lines = [header, '']
+    lines.append('{:<6} {:>26} {:>32}'.format('Seat', 'Win probability', 'Expected points'))
+    wins = summary['winProbability']
+    points = summary['expectedPoints']
+    for seat in range(len(wins['estimate'])):
+        lines.append('{:<6} {:>8.2%} [{:>6.2%}, {:>6.2%}] {:>14.2f} [{:>6.2f}, {:>6.2f}]'.format(
+            seat + 1, wins['estimate'][seat], wins['low'][seat], wins['high'][seat],
+            points['estimate'][seat], points['low'][seat], points['high'][seat]))
+    lines.append('')
+    lines.append('Marginal win probability of one more card than a number card:')
+    values = summary['cardValue']
+    for index, cardType in enumerate(CARD_TYPES[1:]):
+        lines.append('{:<6} {:>+8.2%} [{:>+7.2%}, {:>+7.2%}]'.format(
+            cardType, values['estimate'][index], values['low'][index], values['high'][index]))
+    lines.append('')
+    length = summary['gameLength']
+    lines.append('{:,} games ({} aborted), {:.1f} [{:.1f}, {:.1f}] turns per game'.format(
+        summary['games'], summary['aborted'], length['estimate'], length['low'], length['high']))
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    """Parses the command line and simulates or analyzes match outcomes."""
+    parser = argparse.ArgumentParser(description='Simulate UNO matches and analyze their outcomes.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    simulate = commands.add_parser('simulate', help='play matches and write their outcomes to a file')
+    simulate.add_argument('games', type=int, help='number of matches to play')
+    simulate.add_argument('--output', required=True, help='outcome file to write')
+
+    analyze = commands.add_parser('analyze', help='analyze an outcome file')
+    analyze.add_argument('path', help='outcome file to read')
+
+    run = commands.add_parser('run', help='play matches and analyze them without writing a file')
+    run.add_argument('games', type=int, help='number of matches to play')
+
+    for command in (simulate, run):
+        command.add_argument('--players', type=int, default=4, help='number of computer players (2-10)')
+        command.add_argument('--max-turns', type=int, default=MAX_TURNS, help='turns before a match is abandoned')
+    for command in (simulate, analyze, run):
+        command.add_argument('--seed', type=int, default=None, help='seed for the matches and the bootstrap')
+    for command in (analyze, run):
+        command.add_argument('--replicates', type=int, default=REPLICATES, help='bootstrap replicates')
+        command.add_argument('--confidence', type=float, default=CONFIDENCE, help='confidence interval coverage')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command == 'simulate':
+        batches = simulateOutcomes(args.games, args.players, random.Random(args.seed), maxTurns=args.max_turns)
+        with open(args.output, 'wb') as stream:
+            count = writeOutcomes(stream, args.players, batches)
+        print('Wrote {:,} outcomes in {:.2f}s'.format(count, time.perf_counter() - start))
+        return
+
+    bootstrap = np.random.default_rng(args.seed)
+    if args.command == 'analyze':
+        with open(args.path, 'rb') as stream:
+            stats = None
+            for batch in readOutcomes(stream):
+                if stats is None:
+                    stats = OutcomeStats(batch['hands'].shape[1], args.replicates, bootstrap)
+                stats.update(batch)
+        if stats is None:
+            parser.error('{} holds no outcomes'.format(args.path))
+    else:
+        stats = OutcomeStats(args.players, args.replicates, bootstrap)
+        for batch in simulateOutcomes(args.games, args.players, random.Random(args.seed), maxTurns=args.max_turns):
+            stats.update(batch)
+    print(formatSummary(stats.summary(args.confidence), args.confidence))
+    print('{:.2f}s elapsed'.format(time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main()
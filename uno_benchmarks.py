@@ -0,0 +1,292 @@
+"""
+Benchmarks for the hot paths of the UNO game.
+
+Each benchmark times single calls of one operation until a time budget is
+spent and reports the throughput along with per-call latency percentiles.
+The results are written as JSON so runs can be kept and compared; passing
+an earlier results file as a baseline makes the run fail when any benchmark
+has become slower than the tolerance allows.
+
+Benchmarks:
+    deck.populate_shuffle: Building and shuffling a full `Deck`.
+    player.getLegalCards[n]: Finding the legal cards in hands of n cards.
+    computer.think: One `ComputerPlayer.think` decision in a dealt match.
+    hand.show: Drawing a full row of ten cards.
+    match.drawScreen: Building the whole match screen without printing it.
+    match.snapshot: Packing a dealt match into `Match.snapshot` bytes.
+    match.restore: Loading a snapshot back into a live match.
+    match.headless: A full simulated `Match` from `begin` to `isComplete`.
+    engine.headless: A full game on the rules engine in `uno_engine.py`.
+    engine.variant[name]: A full engine game under each of the house rules
+        in `uno_engine.VARIANTS`, so the cost of every rule can be read
+        against `engine.variant[standard]`.
+
+Functions:
+    measure: Times an operation and summarizes its latencies.
+    runBenchmarks: Runs the benchmarks and collects their results.
+    compareResults: Lists the benchmarks that regressed against a baseline.
+    main: The command-line entry point.
+
+Usage:
+    To save a baseline, then check a later change against it:
+    $ python uno_benchmarks.py --output baseline.json
+    $ python uno_benchmarks.py --output current.json --baseline baseline.json
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from uno import Deck, Hand, Match, Player
+from uno_engine import VARIANTS, RuleSet, playHeadless
+from uno_tournament import createSettings, playMatch
+
+HAND_SIZES = (7, 20, 60)
+PERCENTILES = (50, 90, 99)
+
+
+def _percentile(samples: List[int], percent: int) -> float:
+    """Returns a percentile of sorted samples by the nearest-rank method."""
+    rank = max(0, min(len(samples) - 1, int(round(percent / 100 * len(samples))) - 1))
+    return samples[rank]
+
+
+def measure(operation: Callable[[], object], minTime: float = 0.5, minCalls: int = 20,
+            setup: Optional[Callable[[], None]] = None) -> Dict[str, float]:
+    """
+    Times single calls of an operation and summarizes them.
+
+    Args:
+        operation (Callable[[], object]): The call to time.
+        minTime (float): The seconds of timed calls to collect.
+        minCalls (int): The fewest calls to time, however slow they are.
+        setup (Optional[Callable[[], None]]): An untimed call made before
+            every timed one, to put back any state the operation changes.
+
+    Returns:
+        Dict[str, float]: The number of calls, operations per second, and
+        the mean and percentile latencies in microseconds.
+    """
+    clock = time.perf_counter_ns
+    samples = []
+    spent = 0
+    budget = minTime * 1e9
+    while spent < budget or len(samples) < minCalls:
+        if setup is not None:
+            setup()
+        start = clock()
+        operation()
+        elapsed = clock() - start
+        samples.append(elapsed)
+        spent += elapsed
+    samples.sort()
+    result = {
+        'calls': len(samples),
+        'ops_per_sec': len(samples) / (spent / 1e9),
+        'mean_us': spent / len(samples) / 1000,
+    }
+    for percent in PERCENTILES:
+        result['p{}_us'.format(percent)] = _percentile(samples, percent) / 1000
+    return result
+
+
+def _dealtMatch(rng: random.Random, simulation: bool) -> Match:
+    """Returns a four-computer match with cards dealt and the first card turned."""
+    gs = createSettings(4)
+    gs.computerSimulation = simulation
+    match = Match(gs, rng)
+    match.simulation = True
+    match.eventDealCards()
+    match.turn = match.turnList[0]
+    match.placeCard()
+    match.event = ''
+    match.drawAmount = 0
+    match.simulation = simulation
+    return match
+
+
+def benchDeck(rng: random.Random, minTime: float) -> Dict[str, float]:
+    """Times building and shuffling a full deck."""
+    return measure(lambda: Deck(True, rng), minTime)
+
+
+def benchLegalCards(rng: random.Random, minTime: float, size: int) -> Dict[str, float]:
+    """Times finding the legal cards in a hand of the given size."""
+    deck = Deck(True, rng)
+    player = Player('Bench')
+    for _ in range(size):
+        player.addCard(deck.draw())
+    top = deck.draw()
+    while top.isWild():
+        top = deck.draw()
+    color = top.getColor()
+    value = top.getValue()
+    return measure(lambda: player.getLegalCards(color, value), minTime)
+
+
+def benchThink(rng: random.Random, minTime: float) -> Dict[str, float]:
+    """Times one computer decision in a freshly dealt match."""
+    match = _dealtMatch(rng, True)
+    player = match.players[match.turn]
+    colors = dict(player.colorsInHand)
+
+    def reset():
+        player.colorsInHand = dict(colors)
+
+    return measure(lambda: player.think(match), minTime, setup=reset)
+
+
+def benchShow(rng: random.Random, minTime: float) -> Dict[str, float]:
+    """Times drawing a full row of ten cards."""
+    deck = Deck(True, rng)
+    hand = Hand()
+    for _ in range(10):
+        hand.addCard(deck.draw())
+    return measure(lambda: hand.show(0), minTime)
+
+
+def benchDrawScreen(rng: random.Random, minTime: float) -> Dict[str, float]:
+    """Times building the match screen with presentation enabled."""
+    match = _dealtMatch(rng, False)
+    return measure(lambda: match.drawScreen(False), minTime)
+
+
+def benchSnapshot(rng: random.Random, minTime: float) -> Dict[str, float]:
+    """Times taking a snapshot of a freshly dealt match."""
+    match = _dealtMatch(rng, True)
+    return measure(match.snapshot, minTime)
+
+
+def benchRestore(rng: random.Random, minTime: float) -> Dict[str, float]:
+    """Times restoring a freshly dealt match from its snapshot."""
+    match = _dealtMatch(rng, True)
+    snapshot = match.snapshot()
+    return measure(lambda: match.restore(snapshot), minTime)
+
+
+def benchMatch(rng: random.Random, minTime: float) -> Dict[str, float]:
+    """Times full headless matches between four computer players."""
+    state = {'gs': createSettings(4)}
+
+    def play():
+        state['gs'] = playMatch(state['gs'], rng=rng)[0]
+
+    return measure(play, minTime)
+
+
+def benchEngine(rng: random.Random, minTime: float) -> Dict[str, float]:
+    """Times full four-player games on the rules engine."""
+    return measure(lambda: playHeadless(4, rng), minTime)
+
+
+def benchVariant(rng: random.Random, minTime: float, rules: RuleSet) -> Dict[str, float]:
+    """Times full four-player engine games under a set of house rules."""
+    return measure(lambda: playHeadless(4, rng, rules=rules), minTime)
+
+
+def _benchmarks() -> Dict[str, Callable[[random.Random, float], Dict[str, float]]]:
+    """Returns every benchmark by name, in the order they run."""
+    benchmarks = {'deck.populate_shuffle': benchDeck}
+    for size in HAND_SIZES:
+        benchmarks['player.getLegalCards[{}]'.format(size)] = (
+            lambda rng, minTime, size=size: benchLegalCards(rng, minTime, size))
+    benchmarks['computer.think'] = benchThink
+    benchmarks['hand.show'] = benchShow
+    benchmarks['match.drawScreen'] = benchDrawScreen
+    benchmarks['match.snapshot'] = benchSnapshot
+    benchmarks['match.restore'] = benchRestore
+    benchmarks['match.headless'] = benchMatch
+    benchmarks['engine.headless'] = benchEngine
+    for name, rules in VARIANTS.items():
+        benchmarks['engine.variant[{}]'.format(name)] = (
+            lambda rng, minTime, rules=rules: benchVariant(rng, minTime, rules))
+    return benchmarks
+
+
+def runBenchmarks(minTime: float = 0.5, seed: int = 0, only: Optional[str] = None) -> Dict[str, object]:
+    """
+    Runs the benchmarks and collects their results.
+
+    Args:
+        minTime (float): The seconds of timed calls per benchmark.
+        seed (int): The seed for the decks and matches being timed.
+        only (Optional[str]): Runs only benchmarks whose name contains it.
+
+    Returns:
+        Dict[str, object]: The environment and the result of each benchmark.
+    """
+    results = {}
+    for name, benchmark in _benchmarks().items():
+        if only is None or only in name:
+            results[name] = benchmark(random.Random(seed), minTime)
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'min_time': minTime,
+        'seed': seed,
+        'results': results,
+    }
+
+
+def compareResults(current: Dict[str, object], baseline: Dict[str, object], tolerance: float) -> List[str]:
+    """
+    Lists the benchmarks that got slower than a baseline allows.
+
+    Args:
+        current (Dict[str, object]): Results from `runBenchmarks`.
+        baseline (Dict[str, object]): Earlier results to compare with.
+        tolerance (float): The fraction of throughput a benchmark may lose.
+
+    Returns:
+        List[str]: A description of each regression.
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        ratio = result['ops_per_sec'] / before['ops_per_sec']
+        if ratio < 1 - tolerance:
+            regressions.append('{}: {:,.1f} -> {:,.1f} ops/sec ({:.0%} slower)'.format(
+                name, before['ops_per_sec'], result['ops_per_sec'], 1 - ratio))
+    return regressions
+
+
+def main() -> None:
+    """Parses the command line, runs the benchmarks and writes the results."""
+    parser = argparse.ArgumentParser(description='Benchmark the UNO hot paths.')
+    parser.add_argument('--output', default=None, help='file to write the JSON results to (default: stdout)')
+    parser.add_argument('--min-time', type=float, default=0.5, help='seconds of timed calls per benchmark')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the decks and matches being timed')
+    parser.add_argument('--only', default=None, help='run only benchmarks whose name contains this')
+    parser.add_argument('--baseline', default=None, help='earlier JSON results to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='fraction of throughput a benchmark may lose')
+    args = parser.parse_args()
+
+    report = runBenchmarks(args.min_time, args.seed, args.only)
+    for name, result in report['results'].items():
+        print('{:<36} {:>12,.1f} ops/sec  p50 {:>10.1f}us  p99 {:>10.1f}us'.format(
+            name, result['ops_per_sec'], result['p50_us'], result['p99_us']), file=sys.stderr)
+
+    if args.output is None:
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline) as baseline:
+            regressions = compareResults(report, json.load(baseline), args.tolerance)
+        for regression in regressions:
+            print('Regression: ' + regression, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
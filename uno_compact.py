@@ -0,0 +1,300 @@
+"""
+A compact integer encoding of UNO cards, decks and hands.
+
+Every card is a small integer `code = color * 16 + value`, where the color and
+value indexes come from `Card.codeColors` and `Card.codeValues` in `uno.py`.
+All 80 possible codes fit in a byte, so decks and hands are stored in
+`array('B')` buffers. Copying or snapshotting them is a single memory copy,
+and comparing two cards is an integer comparison. `Card` objects are only
+created when something needs to be drawn on screen.
+
+Wild cards are encoded with the `wild` color while they are in a deck or a
+hand. Once played, they take the code of the color chosen for them, keeping
+their `W` or `+4` value.
+
+Classes:
+    CompactDeck: A draw pile or discard pile of card codes.
+    CompactHand: A player's hand of card codes with per-code counts.
+
+Functions:
+    cardCode: Returns the code for a color and value.
+    decksFor: Returns how many decks a table of a given size needs.
+    codeColor: Returns the color name of a code.
+    codeValue: Returns the value name of a code.
+    isWildCode: Returns whether a code is a wild or wild draw four card.
+    encodeCards: Converts `Card` objects to a buffer of codes.
+    decodeCard: Builds a `Card` object from a code for rendering.
+    decodeCards: Builds `Card` objects from a buffer of codes.
+"""
+from array import array
+import random
+from typing import Iterable, List
+
+from uno import Card, Deck
+
+COLORS = Card.codeColors
+VALUES = Card.codeValues
+WILD = COLORS.index('wild')
+NUM_CODES = len(COLORS) * 16
+WILD_VALUES = (VALUES.index('W'), VALUES.index('+4'))
+
+
+def cardCode(color: str, value: str) -> int:
+    """Returns the code for a color and value name."""
+    return Card.colorCodeIndex[color] + Card.valueCodeIndex[value]
+
+
+def codeColor(code: int) -> str:
+    """Returns the color name of a card code."""
+    return COLORS[code >> 4]
+
+
+def codeValue(code: int) -> str:
+    """Returns the value name of a card code."""
+    return VALUES[code & 15]
+
+
+def isWildCode(code: int) -> bool:
+    """Returns whether a card code is a wild or wild draw four card."""
+    return (code & 15) in WILD_VALUES
+
+
+def _buildPoints() -> array:
+    """Builds the point value of every code, matching `Card.setPoints`."""
+    points = array('B', bytes(NUM_CODES))
+    for colorIndex in range(len(COLORS)):
+        for valueIndex, value in enumerate(VALUES):
+            if value.isdigit():
+                points[colorIndex * 16 + valueIndex] = int(value)
+            elif value in ('W', '+4'):
+                points[colorIndex * 16 + valueIndex] = 50
+            else:
+                points[colorIndex * 16 + valueIndex] = 20
+    return points
+
+
+def _buildStandardDeck() -> bytes:
+    """Builds the 108 card codes in the order `Deck.populate` creates them."""
+    codes = []
+    for color in Deck.colors:
+        for value in Deck.values:
+            codes.append(cardCode(color, value))
+            if value != '0':
+                codes.append(cardCode(color, value))
+    for _ in range(4):
+        codes.append(cardCode('wild', '+4'))
+        codes.append(cardCode('wild', 'W'))
+    return bytes(codes)
+
+
+POINTS = _buildPoints()
+STANDARD_DECK = _buildStandardDeck()
+
+
+def decksFor(numPlayers: int, handSize: int = 7) -> int:
+    """Returns the decks needed so the opening hands take at most half the cards."""
+    return max(1, -(-numPlayers * handSize * 2 // len(STANDARD_DECK)))
+
+
+def encodeCards(cards: Iterable[Card]) -> array:
+    """Converts `Card` objects to a buffer of card codes."""
+    return array('B', [card.code for card in cards])
+
+
+def decodeCard(code: int) -> Card:
+    """Builds a `Card` object from a code, for rendering."""
+    return Card.fromCode(code)
+
+
+def decodeCards(codes: Iterable[int]) -> List[Card]:
+    """Builds `Card` objects from a buffer of card codes."""
+    return [decodeCard(code) for code in codes]
+
+
+class CompactDeck:
+    """
+    A pile of card codes whose top card is the last element.
+
+    Attributes:
+        cards (array): The card codes, bottom first.
+    """
+
+    __slots__ = ('cards',)
+
+    def __init__(self, cards: Iterable[int] = b''):
+        """
+        Initializes a deck from existing card codes.
+
+        Args:
+            cards (Iterable[int]): The card codes, bottom first.
+        """
+        self.cards = array('B', cards)
+
+    @classmethod
+    def standard(cls, rng=None, numDecks: int = 1) -> 'CompactDeck':
+        """
+        Creates full 108 card decks, shuffled with rng if one is given.
+
+        Args:
+            rng: A `random.Random` or the `random` module, or None to keep
+                the deck in `Deck.populate` order.
+            numDecks (int): How many standard decks to combine.
+
+        Returns:
+            CompactDeck: The new deck.
+        """
+        deck = cls(STANDARD_DECK * numDecks)
+        if rng is not None:
+            deck.shuffle(rng)
+        return deck
+
+    @classmethod
+    def fromDeck(cls, deck: Deck) -> 'CompactDeck':
+        """Encodes a `Deck`, keeping the card that `Deck.draw` returns on top."""
+        return cls(card.code for card in deck)
+
+    def __len__(self) -> int:
+        """Returns the number of cards in the deck."""
+        return len(self.cards)
+
+    def __iter__(self):
+        """Returns an iterator over the codes, bottom first."""
+        return iter(self.cards)
+
+    def top(self, depth: int = 0) -> int:
+        """Returns the code `depth` cards below the top."""
+        return self.cards[-1 - depth]
+
+    def draw(self) -> int:
+        """Removes and returns the top card code."""
+        return self.cards.pop()
+
+    def push(self, code: int) -> None:
+        """Places a card code on top of the deck."""
+        self.cards.append(code)
+
+    def shuffle(self, rng=random) -> None:
+        """Shuffles the deck in place."""
+        rng.shuffle(self.cards)
+
+    def toBytes(self) -> bytes:
+        """Returns the card codes as bytes, bottom first."""
+        return self.cards.tobytes()
+
+    @classmethod
+    def fromBytes(cls, data: bytes) -> 'CompactDeck':
+        """Creates a deck from bytes written by `toBytes`."""
+        return cls(data)
+
+    def materialize(self) -> List[Card]:
+        """Returns `Card` objects for the deck, bottom first."""
+        return decodeCards(self.cards)
+
+
+class CompactHand:
+    """
+    A hand of card codes with a per-code count table for O(1) lookups.
+
+    Attributes:
+        cards (array): The card codes, in the order they were added.
+        counts (array): How many cards of each code are in the hand.
+    """
+
+    __slots__ = ('cards', 'counts')
+
+    def __init__(self, cards: Iterable[int] = b''):
+        """
+        Initializes a hand from existing card codes.
+
+        Args:
+            cards (Iterable[int]): The card codes to start with.
+        """
+        self.cards = array('B')
+        self.counts = array('B', bytes(NUM_CODES))
+        for code in cards:
+            self.add(code)
+
+    @classmethod
+    def fromHand(cls, hand: Iterable[Card]) -> 'CompactHand':
+        """Encodes a `Hand` or any iterable of `Card` objects."""
+        return cls(card.code for card in hand)
+
+    def __len__(self) -> int:
+        """Returns the number of cards in the hand."""
+        return len(self.cards)
+
+    def __iter__(self):
+        """Returns an iterator over the codes in the hand."""
+        return iter(self.cards)
+
+    def add(self, code: int) -> None:
+        """Adds a card code to the hand."""
+        self.cards.append(code)
+        self.counts[code] += 1
+
+    def remove(self, code: int) -> None:
+        """Removes one card with the given code, raising ValueError if absent."""
+        if self.counts[code] == 0:
+            raise ValueError("Card Cannot Be Found")
+        self.counts[code] -= 1
+        self.cards.remove(code)
+
+    def count(self, code: int) -> int:
+        """Returns how many cards with the given code are in the hand."""
+        return self.counts[code]
+
+    def countColor(self, colorIndex: int) -> int:
+        """Returns how many cards of a color index are in the hand."""
+        start = colorIndex * 16
+        return sum(self.counts[start:start + 16])
+
+    def legalCodes(self, colorIndex: int, valueIndex: int) -> List[int]:
+        """
+        Returns the distinct codes that may be played on a color and value.
+
+        Cards matching the color or the value are legal, plain wilds are
+        always legal, and wild draw fours only when nothing else matches.
+
+        Args:
+            colorIndex (int): The index of the current color in `COLORS`.
+            valueIndex (int): The index of the current value in `VALUES`.
+
+        Returns:
+            List[int]: The legal codes, each listed once.
+        """
+        counts = self.counts
+        legal = []
+        start = colorIndex * 16
+        for code in range(start, start + 13):
+            if counts[code]:
+                legal.append(code)
+        if valueIndex < 13:
+            for otherColor in range(WILD):
+                code = otherColor * 16 + valueIndex
+                if otherColor != colorIndex and counts[code]:
+                    legal.append(code)
+        matched = len(legal)
+        wildCode = WILD * 16 + WILD_VALUES[0]
+        if counts[wildCode]:
+            legal.append(wildCode)
+        drawFourCode = WILD * 16 + WILD_VALUES[1]
+        if counts[drawFourCode] and matched == 0:
+            legal.append(drawFourCode)
+        return legal
+
+    def points(self) -> int:
+        """Returns the total point value of the hand."""
+        return sum(POINTS[code] for code in self.cards)
+
+    def toBytes(self) -> bytes:
+        """Returns the card codes as bytes."""
+        return self.cards.tobytes()
+
+    @classmethod
+    def fromBytes(cls, data: bytes) -> 'CompactHand':
+        """Creates a hand from bytes written by `toBytes`."""
+        return cls(data)
+
+    def materialize(self) -> List[Card]:
+        """Returns `Card` objects for the hand, for rendering."""
+        return decodeCards(self.cards)
@@ -0,0 +1,813 @@
+"""
+A rendering-free rules engine for the UNO game.
+
+`Match` in `uno.py` plays the game and draws it at the same time, so every
+card that moves also rebuilds padded strings for the screen. This module
+holds the same rules with none of the presentation: the whole game lives in
+a `GameState` of card codes from `uno_compact`, and `UnoEngine.step` applies
+one action at a time to it. Simulations that only need outcomes can run
+entirely on the engine.
+
+Actions are small integers:
+    0-79: Play the card with that code from the current player's hand.
+    DRAW: Draw a card. Allowed while the deck has cards.
+    PASS: End the turn. Allowed when the deck is empty and nothing is
+        playable.
+    CHOOSE_COLOR + color index: Name the color of a wild card just played.
+    JUMP_IN + seat: Play the card on top of the pile out of turn from that
+        seat's hand, with the jump-in rule.
+    SWAP_HANDS + seat: Swap hands with that seat after playing a seven,
+        with the seven-zero rule.
+
+The rules follow `Match`: a player who is hit by a draw card draws it at the
+start of their turn and may then play, a reverse with two players acts as a
+skip, wild draw fours are only playable when no other card matches, and when
+every player passes in a row a color is chosen at random.
+
+House rules are switched on with a `RuleSet`. The engine reads it once and
+builds tables of the methods that carry out card effects, legal plays and
+draws, so each action dispatches through a lookup instead of testing every
+rule in turn. `VARIANTS` names the rule sets that change one rule each.
+
+Classes:
+    RuleSet: The house rules a game is played with.
+    GameState: The compact state of a game in progress.
+    UnoEngine: Deals a game and applies actions to its state.
+
+Functions:
+    colorAction: Returns the action that names a color index.
+    jumpInAction: Returns the action that jumps in from a seat.
+    swapAction: Returns the action that swaps hands with a seat.
+    heuristicAction: Picks an action the way `ComputerPlayer.think` does.
+    playHeadless: Plays a whole game with the heuristic for every seat.
+    main: The command-line entry point.
+
+Usage:
+    To time 10,000 four-player engine games:
+    $ python uno_engine.py 10000 --players 4
+
+    To play with stacking and jump-ins:
+    $ python uno_engine.py 10000 --rules stacking,jump-in
+
+    Tables of more than seven players get a second deck by default:
+    $ python uno_engine.py 2000 --players 10
+"""
+import argparse
+import random
+import time
+from array import array
+from typing import Iterable, List, Optional, Tuple
+
+from uno_compact import NUM_CODES, VALUES, WILD, WILD_VALUES, CompactDeck, CompactHand, decksFor
+
+DRAW = NUM_CODES
+PASS = NUM_CODES + 1
+CHOOSE_COLOR = NUM_CODES + 2
+JUMP_IN = CHOOSE_COLOR + WILD
+
+HAND_SIZE = 7
+MAX_TURNS = 5000
+MAX_PLAYERS = 16
+
+SWAP_HANDS = JUMP_IN + MAX_PLAYERS
+
+ZERO = VALUES.index('0')
+SEVEN = VALUES.index('7')
+SKIP = VALUES.index('X')
+REVERSE = VALUES.index('R')
+DRAW_TWO = VALUES.index('+2')
+DRAW_FOUR = WILD_VALUES[1]
+WILD_CARD = WILD * 16 + WILD_VALUES[0]
+WILD_DRAW_FOUR = WILD * 16 + DRAW_FOUR
+
+# The order `ComputerPlayer.colorsInHand` breaks ties in: red, blue, green,
+# yellow, wild.
+_TIE_ORDER = (0, 3, 2, 1, WILD)
+
+
+def colorAction(colorIndex: int) -> int:
+    """Returns the action that names a color index for a wild card."""
+    return CHOOSE_COLOR + colorIndex
+
+
+def jumpInAction(seat: int) -> int:
+    """Returns the action that jumps in with the top card from a seat."""
+    return JUMP_IN + seat
+
+
+def swapAction(seat: int) -> int:
+    """Returns the action that swaps hands with a seat after a seven."""
+    return SWAP_HANDS + seat
+
+
+class RuleSet:
+    """
+    The house rules a game is played with, each one a flag.
+
+    Attributes:
+        zeroChange (bool): Zeros may be played on any card.
+        stacking (bool): A player hit by a draw two may pass it on by playing
+            a draw two or a wild draw four, and one hit by a wild draw four
+            by playing another. The player after them draws the total.
+        jumpIn (bool): A player holding the same card as the top of the pile
+            may play it out of turn, and play carries on from them.
+        sevenZero (bool): Playing a seven swaps hands with a chosen player,
+            and playing a zero passes every hand on in the direction of play.
+        drawUntilPlayable (bool): Players may only draw when they cannot
+            play, and then keep drawing until they can.
+    """
+
+    # The command-line name of each rule, by attribute.
+    NAMES = {
+        'zeroChange': 'zero-change',
+        'stacking': 'stacking',
+        'jumpIn': 'jump-in',
+        'sevenZero': 'seven-zero',
+        'drawUntilPlayable': 'draw-until-playable',
+    }
+
+    def __init__(self, zeroChange: bool = False, stacking: bool = False, jumpIn: bool = False,
+                 sevenZero: bool = False, drawUntilPlayable: bool = False):
+        """
+        Initializes a rule set.
+
+        Args:
+            zeroChange (bool): Whether zeros may be played on any card.
+            stacking (bool): Whether draw cards may be stacked.
+            jumpIn (bool): Whether identical cards may be played out of turn.
+            sevenZero (bool): Whether sevens swap and zeros rotate hands.
+            drawUntilPlayable (bool): Whether drawing goes on until a card
+                can be played.
+        """
+        self.zeroChange = zeroChange
+        self.stacking = stacking
+        self.jumpIn = jumpIn
+        self.sevenZero = sevenZero
+        self.drawUntilPlayable = drawUntilPlayable
+
+    @classmethod
+    def fromNames(cls, names: Iterable[str]) -> 'RuleSet':
+        """
+        Builds a rule set with the named rules switched on.
+
+        Args:
+            names (Iterable[str]): Command-line rule names, such as 'jump-in'.
+
+        Returns:
+            RuleSet: The rule set.
+
+        Raises:
+            ValueError: If a name is not a known rule.
+        """
+        attributes = {name: attribute for attribute, name in cls.NAMES.items()}
+        rules = cls()
+        for name in names:
+            if name not in attributes:
+                raise ValueError('Unknown rule: {}'.format(name))
+            setattr(rules, attributes[name], True)
+        return rules
+
+    def getName(self) -> str:
+        """Returns the names of the rules switched on, or 'standard' for none."""
+        names = [name for attribute, name in self.NAMES.items() if getattr(self, attribute)]
+        return '+'.join(names) if names else 'standard'
+
+
+# The standard rules, then each house rule on its own.
+VARIANTS = {'standard': RuleSet()}
+for _attribute, _name in RuleSet.NAMES.items():
+    VARIANTS[_name] = RuleSet(**{_attribute: True})
+
+
+class GameState:
+    """
+    The full state of a game, stored as card codes and small integers.
+
+    Attributes:
+        numPlayers (int): The number of seats.
+        hands (List[CompactHand]): Each seat's hand.
+        deck (CompactDeck): The draw pile, top card last.
+        pile (CompactDeck): The discard pile, top card last.
+        turn (int): The seat whose turn it is.
+        direction (int): 1 for seat order, -1 when reversed.
+        color (int): The color index that must be matched.
+        value (int): The value index that must be matched.
+        drawAmount (int): Cards the next player must draw.
+        skipNext (bool): Whether the next player loses their turn.
+        passes (int): Consecutive passes since the last card was played.
+        forceDraws (array): Cards each seat still has to draw.
+        drew (array): Whether each seat drew by choice since the color last
+            changed, as `ComputerPlayer.think` looks at it.
+        choosingColor (bool): Whether the current seat must name a color.
+        choosingSwap (bool): Whether the current seat must pick a hand to
+            swap with after playing a seven.
+        opening (bool): Whether the color being chosen is for the card that
+            started the pile, which does not end the turn.
+        winner (int): The winning seat, or -1 while the game is running.
+        turns (int): The number of turns started, skipped ones included.
+    """
+
+    __slots__ = ('numPlayers', 'hands', 'deck', 'pile', 'turn', 'direction', 'color', 'value',
+                 'drawAmount', 'skipNext', 'passes', 'forceDraws', 'drew', 'choosingColor',
+                 'choosingSwap', 'opening', 'winner', 'turns')
+
+    def __init__(self, numPlayers: int):
+        """
+        Initializes an empty state for a number of seats.
+
+        Args:
+            numPlayers (int): The number of seats.
+        """
+        self.numPlayers = numPlayers
+        self.hands = [CompactHand() for _ in range(numPlayers)]
+        self.deck = CompactDeck()
+        self.pile = CompactDeck()
+        self.turn = 0
+        self.direction = 1
+        self.color = WILD
+        self.value = 0
+        self.drawAmount = 0
+        self.skipNext = False
+        self.passes = 0
+        self.forceDraws = array('H', bytes(2 * numPlayers))
+        self.drew = array('B', bytes(numPlayers))
+        self.choosingColor = False
+        self.choosingSwap = False
+        self.opening = False
+        self.winner = -1
+        self.turns = 0
+
+    def copy(self) -> 'GameState':
+        """Returns an independent copy of the state."""
+        other = GameState.__new__(GameState)
+        for name in self.__slots__:
+            setattr(other, name, getattr(self, name))
+        other.hands = [CompactHand.fromBytes(hand.toBytes()) for hand in self.hands]
+        other.deck = CompactDeck(self.deck.cards)
+        other.pile = CompactDeck(self.pile.cards)
+        other.forceDraws = array('H', self.forceDraws)
+        other.drew = array('B', self.drew)
+        return other
+
+    def isComplete(self) -> bool:
+        """Returns whether a seat has emptied its hand."""
+        return self.winner >= 0
+
+    def nextSeat(self, seat: Optional[int] = None, direction: Optional[int] = None) -> int:
+        """Returns the seat after the given one, in the current direction by default."""
+        if seat is None:
+            seat = self.turn
+        if direction is None:
+            direction = self.direction
+        return (seat + direction) % self.numPlayers
+
+    def points(self) -> int:
+        """Returns the points the winner collects from the other hands."""
+        return sum(hand.points() for seat, hand in enumerate(self.hands) if seat != self.winner)
+
+
+class UnoEngine:
+    """
+    Deals games and applies actions to their state.
+
+    Attributes:
+        numPlayers (int): The number of seats.
+        numDecks (int): How many standard decks are shuffled together.
+        rules (RuleSet): The house rules in play.
+        zeroChange (bool): Whether zeros may be played on any card, as the
+            zero change option of `GameSettings` allows.
+        freeDraw (bool): Whether a seat may draw while it could play.
+        rng: The source of randomness for shuffles and forced colors.
+        state (GameState): The game being played.
+    """
+
+    def __init__(self, numPlayers: int = 4, rng=None, zeroChange: bool = False, numDecks: Optional[int] = None,
+                 rules: Optional[RuleSet] = None):
+        """
+        Initializes an engine and deals a game.
+
+        Args:
+            numPlayers (int): The number of seats, from 2 to `MAX_PLAYERS`.
+            rng: A `random.Random` or the `random` module.
+            zeroChange (bool): Whether the zero change option is on. Only
+                used when no rules are given.
+            numDecks (Optional[int]): How many decks to shuffle together.
+                Defaults to enough for the table, from `decksFor`.
+            rules (Optional[RuleSet]): The house rules. Defaults to the
+                standard rules with the zero change option as given.
+        """
+        if not 2 <= numPlayers <= MAX_PLAYERS:
+            raise ValueError('A game needs between 2 and {} players'.format(MAX_PLAYERS))
+        if numDecks is None:
+            numDecks = decksFor(numPlayers, HAND_SIZE)
+        if numDecks < 1:
+            raise ValueError('A game needs at least 1 deck')
+        self.numPlayers = numPlayers
+        self.numDecks = numDecks
+        self.rules = RuleSet(zeroChange=zeroChange) if rules is None else rules
+        self.zeroChange = self.rules.zeroChange
+        self.freeDraw = not self.rules.drawUntilPlayable
+        self.rng = random if rng is None else rng
+        self._buildTables()
+        self.state = GameState(numPlayers)
+        self.reset()
+
+    def _buildTables(self) -> None:
+        """Picks the methods that carry out each rule, so actions never test the rules themselves."""
+        rules = self.rules
+
+        # What placing a card does to the next seat, by value.
+        self._effects = [None] * 16
+        self._effects[SKIP] = self._skip
+        self._effects[REVERSE] = self._reverse if self.numPlayers > 2 else self._skip
+        self._effects[DRAW_TWO] = self._drawTwo
+        self._effects[DRAW_FOUR] = self._drawFour
+
+        # What happens after a card is played from a hand, by value.
+        self._afterPlay = [self._endTurn] * 16
+        for value in WILD_VALUES:
+            self._afterPlay[value] = self._askColor
+        if rules.sevenZero:
+            self._afterPlay[SEVEN] = self._askSwap
+            self._afterPlay[ZERO] = self._rotateHands
+
+        # Plays and draws without a draw penalty pending.
+        self._matchPlays = self._zeroChangePlays if rules.zeroChange else self._standardPlays
+        self._chosenDraw = self._drawUntilPlayable if rules.drawUntilPlayable else self._drawCard
+
+        self._plays = self._matchPlays
+        self._draw = self._chosenDraw
+        self._penalty = self._drawPenalty
+        self._jumpIns = self._findJumpIns if rules.jumpIn else self._noJumpIns
+        if rules.stacking:
+            # The cards that pass a draw penalty on, by the value that caused it.
+            self._stackCodes = {
+                DRAW_TWO: tuple(colorIndex * 16 + DRAW_TWO for colorIndex in range(WILD)) + (WILD_DRAW_FOUR,),
+                DRAW_FOUR: (WILD_DRAW_FOUR,),
+            }
+            self._plays = self._stackingPlays
+            self._draw = self._stackingDraw
+            self._penalty = self._offerStack
+
+    def reset(self) -> GameState:
+        """
+        Shuffles the full decks, deals every seat and turns the first card.
+
+        Returns:
+            GameState: The new state, waiting on the first seat to act.
+        """
+        state = GameState(self.numPlayers)
+        self.state = state
+        state.deck = CompactDeck.standard(self.rng, self.numDecks)
+        for seat in range(self.numPlayers):
+            for _ in range(HAND_SIZE):
+                self._dealCard(seat, False)
+        state.turn = self.rng.randrange(self.numPlayers)
+        self._placeCard(state.deck.draw())
+        if state.color == WILD:
+            state.choosingColor = True
+            state.opening = True
+        else:
+            self._startTurn()
+        return state
+
+    def legalPlays(self, state: Optional[GameState] = None) -> List[int]:
+        """
+        Returns the card codes the current seat may play.
+
+        Args:
+            state (Optional[GameState]): The state to look at. Defaults to
+                the engine's own.
+
+        Returns:
+            List[int]: The distinct playable codes.
+        """
+        return self._plays(self.state if state is None else state)
+
+    def legalJumpIns(self, state: Optional[GameState] = None) -> List[int]:
+        """
+        Returns the jump-in actions open to seats other than the current one.
+
+        Args:
+            state (Optional[GameState]): The state to look at. Defaults to
+                the engine's own.
+
+        Returns:
+            List[int]: The jump-in actions; always empty without the jump-in
+            rule.
+        """
+        return self._jumpIns(self.state if state is None else state)
+
+    def legalActions(self, state: Optional[GameState] = None) -> List[int]:
+        """
+        Returns every action the current seat may take.
+
+        Args:
+            state (Optional[GameState]): The state to look at. Defaults to
+                the engine's own.
+
+        Returns:
+            List[int]: The legal actions; empty once the game is over.
+        """
+        state = self.state if state is None else state
+        if state.winner >= 0:
+            return []
+        if state.choosingColor:
+            return [colorAction(colorIndex) for colorIndex in range(WILD)]
+        if state.choosingSwap:
+            return [swapAction(seat) for seat in range(state.numPlayers) if seat != state.turn]
+        actions = self._plays(state)
+        if len(state.deck) > 0 and (self.freeDraw or state.drawAmount or not actions):
+            actions.append(DRAW)
+        elif not actions:
+            actions.append(PASS)
+        return actions
+
+    def step(self, action: int) -> GameState:
+        """
+        Applies one action for the current seat, or a jump-in for another.
+
+        Args:
+            action (int): A card code, DRAW, PASS, or a color, jump-in or
+                swap action.
+
+        Returns:
+            GameState: The updated state.
+
+        Raises:
+            ValueError: If the action is not legal in the current state.
+        """
+        state = self.state
+        if state.winner >= 0:
+            raise ValueError('The game is already over')
+        if state.choosingColor:
+            if not CHOOSE_COLOR <= action < CHOOSE_COLOR + WILD:
+                raise ValueError('A color must be chosen')
+            self._chooseColor(action - CHOOSE_COLOR)
+        elif state.choosingSwap:
+            seat = action - SWAP_HANDS
+            if not 0 <= seat < state.numPlayers or seat == state.turn:
+                raise ValueError('A hand to swap with must be chosen')
+            self._swapHands(seat)
+        elif action == DRAW:
+            if len(state.deck) == 0:
+                raise ValueError('Cannot draw from an empty deck')
+            if not (self.freeDraw or state.drawAmount) and self._plays(state):
+                raise ValueError('Cannot draw while able to play')
+            self._draw()
+        elif action == PASS:
+            if len(state.deck) > 0 or self._plays(state):
+                raise ValueError('Cannot pass while able to draw or play')
+            self._pass()
+        elif 0 <= action < NUM_CODES and action in self._plays(state):
+            self._play(action)
+        elif JUMP_IN <= action < SWAP_HANDS and action in self._jumpIns(state):
+            state.turn = action - JUMP_IN
+            self._play(state.pile.top())
+        else:
+            raise ValueError('Illegal action: {}'.format(action))
+        return state
+
+    def _standardPlays(self, state: GameState) -> List[int]:
+        """Returns the codes matching the top card's color or value."""
+        return state.hands[state.turn].legalCodes(state.color, state.value)
+
+    def _zeroChangePlays(self, state: GameState) -> List[int]:
+        """Returns the standard plays plus every zero in the hand."""
+        hand = state.hands[state.turn]
+        legal = hand.legalCodes(state.color, state.value)
+        for colorIndex in range(WILD):
+            code = colorIndex * 16 + ZERO
+            if hand.count(code) and code not in legal:
+                legal.append(code)
+        return legal
+
+    def _stackingPlays(self, state: GameState) -> List[int]:
+        """Returns the cards that pass on a pending draw penalty, or the usual plays without one."""
+        if state.drawAmount:
+            hand = state.hands[state.turn]
+            return [code for code in self._stackCodes[state.value] if hand.count(code)]
+        return self._matchPlays(state)
+
+    def _noJumpIns(self, state: GameState) -> List[int]:
+        """Returns no jump-ins, for games without the jump-in rule."""
+        return []
+
+    def _findJumpIns(self, state: GameState) -> List[int]:
+        """Returns a jump-in for every other seat holding the card on top of the pile."""
+        if state.choosingColor or state.choosingSwap or state.value in WILD_VALUES:
+            return []
+        top = state.pile.top()
+        return [jumpInAction(seat) for seat in range(state.numPlayers)
+                if seat != state.turn and state.hands[seat].count(top)]
+
+    def _dealCard(self, seat: int, chosen: bool) -> None:
+        """Moves the top card of the deck to a hand, reshuffling the pile if the deck empties."""
+        state = self.state
+        state.hands[seat].add(state.deck.draw())
+        if chosen:
+            state.drew[seat] = 1
+        if len(state.deck) == 0 and len(state.pile) > 1:
+            top = state.pile.draw()
+            for code in state.pile:
+                if (code & 15) in WILD_VALUES:
+                    code = WILD * 16 + (code & 15)
+                state.deck.push(code)
+            state.pile = CompactDeck((top,))
+            state.deck.shuffle(self.rng)
+
+    def _drawCard(self) -> None:
+        """Draws one card for the current seat."""
+        self._dealCard(self.state.turn, True)
+
+    def _drawUntilPlayable(self) -> None:
+        """Draws for the current seat until it can play or the deck runs out."""
+        state = self.state
+        self._dealCard(state.turn, True)
+        while len(state.deck) > 0 and not self._matchPlays(state):
+            self._dealCard(state.turn, True)
+
+    def _stackingDraw(self) -> None:
+        """Takes a pending draw penalty, or draws as usual when there is none."""
+        if self.state.drawAmount:
+            self._drawPenalty(self.state.turn)
+        else:
+            self._chosenDraw()
+
+    def _placeCard(self, code: int) -> None:
+        """Puts a card on the pile and records the effect it has on the next seat."""
+        state = self.state
+        state.pile.push(code)
+        state.color = code >> 4
+        state.value = code & 15
+        state.passes = 0
+        effect = self._effects[code & 15]
+        if effect is not None:
+            effect()
+
+    def _skip(self) -> None:
+        """Skips the next seat."""
+        self.state.skipNext = True
+
+    def _reverse(self) -> None:
+        """Reverses the direction of play."""
+        self.state.direction = -self.state.direction
+
+    def _drawTwo(self) -> None:
+        """Adds two cards to the next seat's penalty."""
+        self.state.drawAmount += 2
+
+    def _drawFour(self) -> None:
+        """Adds four cards to the next seat's penalty."""
+        self.state.drawAmount += 4
+
+    def _play(self, code: int) -> None:
+        """Plays a card from the current seat's hand."""
+        state = self.state
+        if code >> 4 != state.color:
+            for seat in range(state.numPlayers):
+                state.drew[seat] = 0
+        state.hands[state.turn].remove(code)
+        self._placeCard(code)
+        if len(state.hands[state.turn]) == 0:
+            state.winner = state.turn
+        else:
+            self._afterPlay[code & 15]()
+
+    def _askColor(self) -> None:
+        """Waits on the current seat to name the color of its wild card."""
+        self.state.choosingColor = True
+
+    def _chooseColor(self, colorIndex: int) -> None:
+        """Gives the wild card on top of the pile a color."""
+        state = self.state
+        state.pile.cards[-1] = colorIndex * 16 + state.value
+        state.color = colorIndex
+        state.choosingColor = False
+        if state.opening:
+            state.opening = False
+            self._startTurn()
+        else:
+            self._endTurn()
+
+    def _askSwap(self) -> None:
+        """Waits on the current seat to pick a hand to swap with."""
+        self.state.choosingSwap = True
+
+    def _swapHands(self, seat: int) -> None:
+        """Swaps the current seat's hand with another seat's and ends the turn."""
+        state = self.state
+        hands = state.hands
+        hands[state.turn], hands[seat] = hands[seat], hands[state.turn]
+        state.choosingSwap = False
+        self._endTurn()
+
+    def _rotateHands(self) -> None:
+        """Passes every hand on to the next seat in the direction of play and ends the turn."""
+        state = self.state
+        hands = state.hands
+        if state.direction == 1:
+            state.hands = hands[-1:] + hands[:-1]
+        else:
+            state.hands = hands[1:] + hands[:1]
+        self._endTurn()
+
+    def _pass(self) -> None:
+        """Ends a turn without playing, forcing a random color if everyone has passed."""
+        state = self.state
+        state.forceDraws[state.turn] = 0
+        state.passes += 1
+        if state.passes == state.numPlayers:
+            state.color = self.rng.randrange(WILD)
+            state.passes = 0
+        self._endTurn()
+
+    def _endTurn(self) -> None:
+        """Moves play on to the next seat."""
+        state = self.state
+        state.turn = state.nextSeat()
+        self._startTurn()
+
+    def _startTurn(self) -> None:
+        """Begins the current seat's turn, applying skips and forced draws."""
+        state = self.state
+        state.turns += 1
+        state.drew[state.turn] = 0
+        while state.skipNext:
+            state.skipNext = False
+            state.turn = state.nextSeat()
+            state.turns += 1
+            state.drew[state.turn] = 0
+        if state.drawAmount > 0:
+            self._penalty(state.turn)
+
+    def _offerStack(self, seat: int) -> None:
+        """Leaves a draw penalty pending if the seat can pass it on, and deals it otherwise."""
+        state = self.state
+        hand = state.hands[seat]
+        for code in self._stackCodes[state.value]:
+            if hand.count(code):
+                return
+        self._drawPenalty(seat)
+
+    def _drawPenalty(self, seat: int) -> None:
+        """Deals a seat the cards it has been made to draw."""
+        state = self.state
+        state.forceDraws[seat] += state.drawAmount
+        state.drawAmount = 0
+        while state.forceDraws[seat] > 0 and len(state.deck) > 0:
+            state.forceDraws[seat] -= 1
+            self._dealCard(seat, False)
+        state.forceDraws[seat] = 0
+
+
+def _bestColor(hand: CompactHand, colors) -> int:
+    """Returns the color index of `colors` held most often, first in tie order."""
+    best = None
+    bestCount = 0
+    for colorIndex in _TIE_ORDER:
+        if colorIndex in colors:
+            count = hand.countColor(colorIndex)
+            if count > bestCount:
+                best = colorIndex
+                bestCount = count
+    return best
+
+
+def heuristicAction(engine: UnoEngine, rng=None) -> int:
+    """
+    Picks an action for the current seat like `ComputerPlayer.think` does.
+
+    The player plays skips and reverses against a lone opponent, reverses
+    back on a player who just drew, switches color on a matching value when
+    that leaves it with more cards of the new color, and otherwise plays a
+    random card of the current color. Wild colors go to the color it holds
+    most. Under the house rules, any seat that can jump in does, draw
+    penalties are passed on whenever possible, and sevens swap with the
+    smallest hand.
+
+    Args:
+        engine (UnoEngine): The engine whose current seat is to act.
+        rng: The source of randomness. Defaults to the engine's.
+
+    Returns:
+        int: A legal action.
+    """
+    rng = engine.rng if rng is None else rng
+    state = engine.state
+    jumpIns = engine.legalJumpIns(state)
+    if jumpIns:
+        return jumpIns[0]
+    hand = state.hands[state.turn]
+    if state.choosingSwap:
+        others = [seat for seat in range(state.numPlayers) if seat != state.turn]
+        return swapAction(min(others, key=lambda seat: len(state.hands[seat])))
+    if state.choosingColor:
+        counts = [hand.countColor(colorIndex) for colorIndex in _TIE_ORDER]
+        best = _TIE_ORDER[counts.index(max(counts))]
+        if best == WILD:
+            best = rng.randrange(WILD)
+        return colorAction(best)
+
+    legal = engine.legalPlays(state)
+    matched = [code for code in legal if code >> 4 != WILD and not (engine.zeroChange and code & 15 == 0)]
+    if not legal:
+        return DRAW if len(state.deck) > 0 else PASS
+    if not matched:
+        zeros = [code for code in legal if code >> 4 != WILD]
+        if zeros:
+            return zeros[0] if len(zeros) == 1 else _bestColor(hand, [code >> 4 for code in zeros]) * 16
+        return WILD_DRAW_FOUR if WILD_DRAW_FOUR in legal else WILD_CARD
+
+    color = state.color
+    valueChange = [code for code in matched if code >> 4 != color]
+    choice = None
+    values = [code & 15 for code in matched]
+    canSkip = SKIP in values
+    canReverse = REVERSE in values
+    if state.numPlayers == 2:
+        canSkip = canSkip or canReverse
+        canReverse = False
+        if canSkip:
+            choice = next(code for code in matched if code & 15 in (SKIP, REVERSE))
+    previous = state.nextSeat(direction=-state.direction)
+    if canReverse and state.drew[previous] and color * 16 + REVERSE in matched:
+        choice = color * 16 + REVERSE
+    if valueChange:
+        best = _bestColor(hand, [code >> 4 for code in valueChange])
+        if hand.countColor(best) > hand.countColor(color) or len(valueChange) == len(matched):
+            choice = best * 16 + state.value
+    if choice is None:
+        choice = rng.choice([code for code in matched if code >> 4 == color])
+    return choice
+
+
+def playHeadless(numPlayers: int = 4, rng=None, maxTurns: int = MAX_TURNS, zeroChange: bool = False,
+                 numDecks: Optional[int] = None, rules: Optional[RuleSet] = None) -> Tuple[Optional[int], int, int]:
+    """
+    Plays one game with the heuristic choosing for every seat.
+
+    Args:
+        numPlayers (int): The number of seats.
+        rng: A `random.Random` or the `random` module.
+        maxTurns (int): The turn limit after which the game is abandoned.
+        zeroChange (bool): Whether the zero change option is on.
+        numDecks (Optional[int]): How many decks to shuffle together.
+            Defaults to enough for the table.
+        rules (Optional[RuleSet]): The house rules, replacing zeroChange.
+
+    Returns:
+        Tuple[Optional[int], int, int]: The winning seat (or None if the
+        game was abandoned), the points won, and the number of turns.
+    """
+    engine = UnoEngine(numPlayers, rng, zeroChange, numDecks, rules)
+    state = engine.state
+    while state.winner < 0:
+        if state.turns >= maxTurns:
+            return None, 0, state.turns
+        engine.step(heuristicAction(engine))
+    return state.winner, state.points(), state.turns
+
+
+def main() -> None:
+    """Parses the command line and times a batch of engine games."""
+    parser = argparse.ArgumentParser(description='Play headless UNO games on the rules engine.')
+    parser.add_argument('games', type=int, nargs='?', default=10000, help='number of games to play')
+    parser.add_argument('--players', type=int, default=4, help='number of players')
+    parser.add_argument('--seed', type=int, default=None, help='seed for the games')
+    parser.add_argument('--zero-change', action='store_true', help='allow zeros on any card')
+    parser.add_argument('--decks', type=int, default=None, help='decks to shuffle together (default: enough for the table)')
+    parser.add_argument('--rules', default='', help='comma-separated house rules: ' + ', '.join(RuleSet.NAMES.values()))
+    args = parser.parse_args()
+
+    names = [name for name in args.rules.split(',') if name]
+    if args.zero_change:
+        names.append(RuleSet.NAMES['zeroChange'])
+    try:
+        rules = RuleSet.fromNames(names)
+    except ValueError as error:
+        parser.error(str(error))
+
+    rng = random.Random(args.seed)
+    wins = [0] * args.players
+    aborted = 0
+    turns = 0
+    start = time.perf_counter()
+    for _ in range(args.games):
+        winner, points, length = playHeadless(args.players, rng, numDecks=args.decks, rules=rules)
+        turns += length
+        if winner is None:
+            aborted += 1
+        else:
+            wins[winner] += 1
+    elapsed = time.perf_counter() - start
+
+    print('Rules: {}'.format(rules.getName()))
+    for seat, count in enumerate(wins):
+        print('Seat {:<3} {:>8} wins {:>7.2f}%'.format(seat + 1, count, count / args.games * 100))
+    print('{} games ({} aborted), {:.1f} turns per game'.format(args.games, aborted, turns / args.games))
+    print('{:.2f}s elapsed, {:,.0f} games per minute'.format(elapsed, args.games / elapsed * 60))
+
+
+if __name__ == "__main__":
+    main()
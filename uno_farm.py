@@ -0,0 +1,148 @@
+"""
+A multi-process simulation farm for headless UNO matches.
+
+This module spreads all-computer `Match` games across a process pool. Every
+match draws all of its randomness from its own `random.Random` seeded from
+the farm's base seed and the match number, so any single match can be played
+again bit-for-bit from its seed. Each worker plays a contiguous block of
+seeds and sends back one `TournamentResult`, which keeps the traffic between
+processes tiny and lets throughput grow with the number of cores.
+
+Functions:
+    matchSeed: Returns the seed used for a given match of a farm run.
+    playSeededMatch: Plays one match from its seed with fresh players.
+    runFarm: Plays many seeded matches across a process pool.
+    main: The command-line entry point.
+
+Usage:
+    To play 100,000 matches on every core, then replay match 1234 and save
+    its record for `uno_record.py`:
+    $ python uno_farm.py 100000 --seed 7
+    $ python uno_farm.py --replay 7001234 --record match.unor
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import time
+from typing import Optional, Tuple
+
+from uno_record import GameRecorder
+from uno_tournament import MAX_TURNS, TournamentResult, createSettings, playMatch
+
+# Match seeds are spaced this far apart per base seed so runs never overlap.
+SEED_STRIDE = 1000000
+
+
+def matchSeed(baseSeed: int, index: int) -> int:
+    """
+    Returns the seed of one match in a farm run.
+
+    Args:
+        baseSeed (int): The seed of the whole run.
+        index (int): The match number within the run.
+
+    Returns:
+        int: The seed to pass to `playSeededMatch`.
+    """
+    return baseSeed * SEED_STRIDE + index
+
+
+def playSeededMatch(seed: int, numPlayers: int = 4, maxTurns: int = MAX_TURNS,
+                    recorder=None) -> Tuple[Optional[str], int, int]:
+    """
+    Plays one headless match with new players and a private random generator.
+
+    Args:
+        seed (int): The seed for the match's `random.Random`.
+        numPlayers (int): The number of computer players, from 2 to 10.
+        maxTurns (int): The turn limit after which the match is abandoned.
+        recorder: An optional `uno_record.GameRecorder` to log the match to.
+
+    Returns:
+        Tuple[Optional[str], int, int]: The winner's name (or None if the
+        match was abandoned), the points won, and the number of turns.
+    """
+    gs = createSettings(numPlayers)
+    _, winner, points, turns = playMatch(gs, maxTurns, random.Random(seed), recorder)
+    return winner, points, turns
+
+
+def _playBlock(job: Tuple[int, int, int, int, int]) -> TournamentResult:
+    """Plays a block of consecutive match seeds inside a worker process."""
+    baseSeed, start, count, numPlayers, maxTurns = job
+    gs = createSettings(numPlayers)
+    result = TournamentResult([player.getName() for player in gs.playerStaging])
+    for index in range(start, start + count):
+        result.record(*playSeededMatch(matchSeed(baseSeed, index), numPlayers, maxTurns))
+    return result
+
+
+def runFarm(numMatches: int, processes: Optional[int] = None, baseSeed: int = 0,
+            numPlayers: int = 4, maxTurns: int = MAX_TURNS, blockSize: Optional[int] = None) -> TournamentResult:
+    """
+    Plays many seeded matches across a process pool and merges the results.
+
+    Args:
+        numMatches (int): How many matches to play.
+        processes (Optional[int]): The number of worker processes. Defaults
+            to the number of CPUs.
+        baseSeed (int): The seed of the whole run; see `matchSeed`.
+        numPlayers (int): The number of computer players, from 2 to 10.
+        maxTurns (int): The turn limit after which a match is abandoned.
+        blockSize (Optional[int]): Matches per job sent to a worker. Defaults
+            to a size that gives each worker a few jobs to balance the load.
+
+    Returns:
+        TournamentResult: The merged wins, points and timings.
+    """
+    if numMatches > SEED_STRIDE:
+        raise ValueError('A farm run is limited to {} matches per base seed'.format(SEED_STRIDE))
+    processes = processes or os.cpu_count() or 1
+    if blockSize is None:
+        blockSize = max(1, min(1000, numMatches // (processes * 4) or 1))
+    jobs = [(baseSeed, start, min(blockSize, numMatches - start), numPlayers, maxTurns)
+            for start in range(0, numMatches, blockSize)]
+
+    names = [player.getName() for player in createSettings(numPlayers).playerStaging]
+    result = TournamentResult(names)
+    start = time.perf_counter()
+    if processes == 1:
+        for job in jobs:
+            result.merge(_playBlock(job))
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            for partial in pool.imap_unordered(_playBlock, jobs):
+                result.merge(partial)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def main() -> None:
+    """Parses the command line and runs or replays farm matches."""
+    parser = argparse.ArgumentParser(description='Play seeded headless UNO matches across a process pool.')
+    parser.add_argument('matches', type=int, nargs='?', default=10000, help='number of matches to play')
+    parser.add_argument('--processes', type=int, default=None, help='worker processes (default: all CPUs)')
+    parser.add_argument('--seed', type=int, default=0, help='base seed of the run')
+    parser.add_argument('--players', type=int, default=4, help='number of computer players (2-10)')
+    parser.add_argument('--max-turns', type=int, default=MAX_TURNS, help='turns before a match is abandoned')
+    parser.add_argument('--replay', type=int, default=None, metavar='SEED', help='replay the single match with this seed')
+    parser.add_argument('--record', default=None, metavar='PATH', help='append the replayed match to a game record')
+    args = parser.parse_args()
+
+    if args.replay is not None:
+        recorder = None if args.record is None else GameRecorder.open(args.record)
+        try:
+            winner, points, turns = playSeededMatch(args.replay, args.players, args.max_turns, recorder)
+        finally:
+            if recorder is not None:
+                recorder.close()
+        print('Match {}: {} won {} points in {} turns'.format(args.replay, winner or 'Nobody', points, turns))
+        return
+
+    result = runFarm(args.matches, args.processes, args.seed, args.players, args.max_turns)
+    print(result.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,500 @@
+"""
+A compact game-record format for UNO matches, with streaming replay.
+
+A `GameRecorder` passed to `Match` appends every event of the match to a
+binary log as it happens: the starting deck order, each card dealt, flipped
+or played, each wild color, each pass and each reshuffle of the discard pile
+with its new order. Nothing in the log depends on the random generator, so
+a record replays exactly even when the match was played with the global
+`random` module.
+
+A record starts with a header and is followed by one event per entry, each
+an opcode byte and a few payload bytes. Cards are stored as their codes from
+`uno_compact`. Several matches can be appended to the same file.
+
+    Header:     b'UNOR', version, player count, then per player a name
+                length, the UTF-8 name and a type byte (0 human, 1
+                computer), then the deck size (2 bytes) and its card codes,
+                bottom first.
+    TURN:       seat                    A turn begins.
+    DEAL:       seat, code              A card is dealt or drawn.
+    FLIP:       code                    The first card is turned onto the pile.
+    PLAY:       seat, code              A card is played from a hand.
+    COLOR:      seat, color             A wild card is given a color.
+    PASS:       seat                    A player passes.
+    RESHUFFLE:  count (2 bytes), codes  The pile became the deck, bottom first.
+    END:        seat, points (4 bytes)  The match ended; seat 255 if aborted.
+
+`readRecord` streams events from a file without loading it, and `Replay`
+applies them to a headless `Match`. Fast-forwarding to a turn only moves
+cards; the screen is built once, at the turn being looked at.
+
+Classes:
+    GameRecorder: Writes the events of a match to a binary stream.
+    Replay: Rebuilds a recorded match turn by turn.
+
+Functions:
+    readRecord: Streams the events of every match in a record.
+    main: The command-line entry point.
+
+Usage:
+    To record the match played from farm seed 7001234 and replay it from
+    turn 40:
+    $ python uno_record.py record game.unor --seed 7001234
+    $ python uno_record.py replay game.unor --turn 40
+"""
+import argparse
+import random
+import struct
+import time
+from collections import deque
+from typing import BinaryIO, Dict, Iterator, List, Optional
+
+from uno import Card, ComputerPlayer, Deck, GameSettings, Match
+from uno_compact import decodeCard
+from uno_tournament import MAX_TURNS, createSettings, playMatch
+
+MAGIC = b'UNOR'
+VERSION = 1
+
+TURN = 1
+DEAL = 2
+FLIP = 3
+PLAY = 4
+COLOR = 5
+PASS = 6
+RESHUFFLE = 7
+END = 8
+
+NO_SEAT = 255
+
+# Payload formats of the fixed-size events.
+_FORMATS = {
+    TURN: struct.Struct('<B'),
+    DEAL: struct.Struct('<BB'),
+    FLIP: struct.Struct('<B'),
+    PLAY: struct.Struct('<BB'),
+    COLOR: struct.Struct('<BB'),
+    PASS: struct.Struct('<B'),
+    END: struct.Struct('<BI'),
+}
+_NAMES = {TURN: 'turn', DEAL: 'deal', FLIP: 'flip', PLAY: 'play', COLOR: 'color', PASS: 'pass', END: 'end'}
+_COUNT = struct.Struct('<H')
+
+
+class GameRecorder:
+    """
+    Appends the events of matches to a binary stream.
+
+    Attributes:
+        stream (BinaryIO): The stream being written.
+        seats (Dict[str, int]): The seat number of each player ID in the
+            match being recorded.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        """
+        Initializes a recorder.
+
+        Args:
+            stream (BinaryIO): A stream opened for binary writing.
+        """
+        self.stream = stream
+        self.seats: Dict[str, int] = {}
+        self.handlers = {
+            'begin': self.writeHeader,
+            'turn': self.writeTurn,
+            'deal': self.writeDeal,
+            'flip': self.writeFlip,
+            'play': self.writePlay,
+            'color': self.writeColor,
+            'pass': self.writePass,
+            'reshuffle': self.writeReshuffle,
+            'end': self.writeEnd,
+        }
+
+    @classmethod
+    def open(cls, path: str) -> 'GameRecorder':
+        """Returns a recorder appending to the file at path."""
+        return cls(open(path, 'ab'))
+
+    def close(self) -> None:
+        """Closes the stream."""
+        self.stream.close()
+
+    def record(self, match: Match, event: str, *args) -> None:
+        """
+        Writes one event reported by a match.
+
+        Args:
+            match (Match): The match the event happened in.
+            event (str): The event name passed to `Match.record`.
+            *args: The event's details.
+        """
+        self.handlers[event](match, *args)
+
+    def writeEvent(self, opcode: int, *values: int) -> None:
+        """Writes a fixed-size event."""
+        self.stream.write(bytes((opcode,)) + _FORMATS[opcode].pack(*values))
+
+    def writeCards(self, cards) -> None:
+        """Writes a count followed by card codes."""
+        self.stream.write(_COUNT.pack(len(cards)) + bytes(card.getCode() for card in cards))
+
+    def writeHeader(self, match: Match) -> None:
+        """Writes the players and the starting deck order."""
+        self.seats = {identity: seat for seat, identity in enumerate(match.turnList)}
+        header = bytearray(MAGIC)
+        header += bytes((VERSION, len(match.turnList)))
+        for identity in match.turnList:
+            player = match.players[identity]
+            name = player.getName().encode('utf-8')
+            header += bytes((len(name),)) + name
+            header += bytes((1 if player.getType() == 'Computer' else 0,))
+        self.stream.write(bytes(header))
+        self.writeCards(list(match.deck))
+
+    def writeTurn(self, match: Match, playerID: str) -> None:
+        """Writes the start of a turn."""
+        self.writeEvent(TURN, self.seats[playerID])
+
+    def writeDeal(self, match: Match, playerID: str, card: Card) -> None:
+        """Writes a card moving from the deck to a hand."""
+        self.writeEvent(DEAL, self.seats[playerID], card.getCode())
+
+    def writeFlip(self, match: Match, card: Card) -> None:
+        """Writes the first card turned onto the pile."""
+        self.writeEvent(FLIP, card.getCode())
+
+    def writePlay(self, match: Match, playerID: str, card: Card) -> None:
+        """Writes a card played from a hand."""
+        self.writeEvent(PLAY, self.seats[playerID], card.getCode())
+
+    def writeColor(self, match: Match, playerID: str, color: str) -> None:
+        """Writes the color given to a wild card."""
+        self.writeEvent(COLOR, self.seats[playerID], Card.codeColors.index(color))
+
+    def writePass(self, match: Match, playerID: str) -> None:
+        """Writes a pass."""
+        self.writeEvent(PASS, self.seats[playerID])
+
+    def writeReshuffle(self, match: Match) -> None:
+        """Writes the new deck order after the pile is shuffled back in."""
+        self.stream.write(bytes((RESHUFFLE,)))
+        self.writeCards(list(match.deck))
+
+    def writeEnd(self, match: Match, winnerID: Optional[str], points: int) -> None:
+        """Writes the end of the match and flushes the stream."""
+        self.writeEvent(END, NO_SEAT if winnerID is None else self.seats[winnerID], points)
+        self.stream.flush()
+
+
+def _readExact(stream: BinaryIO, size: int) -> bytes:
+    """Reads exactly size bytes, raising ValueError on a truncated record."""
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError('Record is truncated')
+    return data
+
+
+def _readCodes(stream: BinaryIO) -> bytes:
+    """Reads a count followed by card codes."""
+    count, = _COUNT.unpack(_readExact(stream, _COUNT.size))
+    return _readExact(stream, count)
+
+
+def readRecord(stream: BinaryIO) -> Iterator[tuple]:
+    """
+    Streams the events of every match in a record.
+
+    Each event is a tuple whose first item is its name:
+        ('begin', names, computers, deck) with the player names, whether
+        each is a computer, and the deck's card codes, bottom first.
+        ('turn', seat), ('deal', seat, code), ('flip', code),
+        ('play', seat, code), ('color', seat, colorIndex), ('pass', seat),
+        ('reshuffle', codes) and ('end', seat, points), where seat is None
+        if the match was aborted.
+
+    Args:
+        stream (BinaryIO): A stream opened for binary reading.
+
+    Yields:
+        tuple: The next event.
+
+    Raises:
+        ValueError: If the stream is not a valid record.
+    """
+    while True:
+        opcode = stream.read(1)
+        if not opcode:
+            return
+        opcode = opcode[0]
+        if opcode == MAGIC[0]:
+            if _readExact(stream, len(MAGIC) - 1) != MAGIC[1:]:
+                raise ValueError('Not an UNO record')
+            version, numPlayers = _readExact(stream, 2)
+            if version != VERSION:
+                raise ValueError('Unsupported record version {}'.format(version))
+            names = []
+            computers = []
+            for _ in range(numPlayers):
+                length = _readExact(stream, 1)[0]
+                names.append(_readExact(stream, length).decode('utf-8'))
+                computers.append(_readExact(stream, 1)[0] == 1)
+            yield ('begin', names, computers, _readCodes(stream))
+        elif opcode == RESHUFFLE:
+            yield ('reshuffle', _readCodes(stream))
+        elif opcode in _FORMATS:
+            values = _FORMATS[opcode].unpack(_readExact(stream, _FORMATS[opcode].size))
+            if opcode == END and values[0] == NO_SEAT:
+                values = (None, values[1])
+            yield (_NAMES[opcode],) + values
+        else:
+            raise ValueError('Unknown event {}'.format(opcode))
+
+
+class Replay:
+    """
+    Rebuilds one recorded match on a headless `Match`.
+
+    Events move cards between the deck, hands and pile directly, so nothing
+    is drawn until `render` is called.
+
+    Attributes:
+        match (Match): The match being rebuilt.
+        turn (int): The number of turns begun so far.
+        finished (bool): Whether the match's end has been reached.
+    """
+
+    def __init__(self, events: Iterator[tuple], game: int = 0):
+        """
+        Initializes a replay from a stream of events.
+
+        Args:
+            events (Iterator[tuple]): Events from `readRecord`.
+            game (int): Which match of the record to replay, from 0.
+
+        Raises:
+            ValueError: If the record has fewer matches.
+        """
+        self.events = events
+        self.turn = 0
+        self.finished = False
+        header = None
+        count = -1
+        for event in events:
+            if event[0] == 'begin':
+                count += 1
+                if count == game:
+                    header = event
+                    break
+        if header is None:
+            raise ValueError('Record has no match {}'.format(game))
+
+        _, names, computers, deck = header
+        gs = GameSettings()
+        for name in names:
+            gs.addPlayer(ComputerPlayer(name))
+        gs.computerSimulation = True
+        gs.displayEffects = False
+        gs.finalizePlayers()
+        self.match = Match(gs)
+        self.match.deck = Deck(False)
+        for code in deck:
+            self.match.deck.place(decodeCard(code))
+        self.match.pile = Deck(False)
+        self.handlers = {
+            'turn': self.applyTurn,
+            'deal': self.applyDeal,
+            'flip': self.applyFlip,
+            'play': self.applyPlay,
+            'color': self.applyColor,
+            'pass': self.applyPass,
+            'reshuffle': self.applyReshuffle,
+            'end': self.applyEnd,
+        }
+
+    def seat(self, seat: int) -> str:
+        """Returns the player ID sitting at a seat."""
+        return self.match.turnList[seat]
+
+    def drawCard(self, code: int) -> Card:
+        """Draws the top card of the deck, checking it against the record."""
+        card = self.match.deck.draw()
+        if card.getCode() != code:
+            raise ValueError('Record expected card {} on top of the deck, found {}'.format(code, card.getCode()))
+        return card
+
+    def applyTurn(self, seat: int) -> None:
+        """Begins a player's turn."""
+        self.match.turn = self.seat(seat)
+        self.turn += 1
+
+    def applyDeal(self, seat: int, code: int) -> None:
+        """Moves the top card of the deck to a hand."""
+        playerID = self.seat(seat)
+        self.match.players[playerID].addCard(self.drawCard(code))
+        self.match.adjustCardAmount(playerID)
+
+    def applyFlip(self, code: int) -> None:
+        """Turns the first card onto the pile."""
+        self.match.placeCard(self.drawCard(code))
+        self.settle()
+
+    def applyPlay(self, seat: int, code: int) -> None:
+        """Plays a card from a hand."""
+        playerID = self.seat(seat)
+        for index, card in enumerate(self.match.players[playerID].hand):
+            if card.getCode() == code:
+                break
+        else:
+            raise ValueError('Record expected card {} in the hand of seat {}'.format(code, seat))
+        self.match.turn = playerID
+        self.match.placeCard(self.match.extractCard(playerID, index))
+        self.settle()
+
+    def settle(self) -> None:
+        """Applies a placed card's lasting effect; draws and skips come from the record."""
+        if self.match.event == 'reverse':
+            self.match.reverse = not self.match.reverse
+        self.match.event = ''
+        self.match.drawAmount = 0
+
+    def applyColor(self, seat: int, colorIndex: int) -> None:
+        """Gives the wild card on the pile a color."""
+        color = Card.codeColors[colorIndex]
+        self.match.pile[0].changeColor(color)
+        self.match.currentColor = color
+        if not self.match.simulation:
+            self.match.buildPileVisual()
+
+    def applyPass(self, seat: int) -> None:
+        """Records a pass."""
+        self.match.passes += 1
+
+    def applyReshuffle(self, codes: bytes) -> None:
+        """Turns the pile into the deck in the recorded order."""
+        match = self.match
+        top = match.pile.deck.popleft()
+        cards: Dict[int, List[Card]] = {}
+        for card in match.pile.deck:
+            if card.isWild():
+                card.changeColor('wild')
+            cards.setdefault(card.getCode(), []).append(card)
+        match.deck.deck = deque(cards[code].pop() for code in codes)
+        match.pile.deck = deque((top,))
+
+    def applyEnd(self, seat: Optional[int], points: int) -> None:
+        """Finishes the match."""
+        self.finished = True
+        self.match.matchComplete = True
+        if seat is None:
+            self.match.matchAbort = True
+        else:
+            self.match.winnerID = self.seat(seat)
+
+    def advance(self) -> bool:
+        """
+        Applies events up to and including the start of the next turn.
+
+        Returns:
+            bool: False once the end of the match has been applied.
+        """
+        if self.finished:
+            return False
+        for event in self.events:
+            self.handlers[event[0]](*event[1:])
+            if event[0] in ('turn', 'end'):
+                return True
+        raise ValueError('Record ends before the match does')
+
+    def fastForward(self, turn: int) -> None:
+        """Applies events until the given turn has begun or the match ends."""
+        while self.turn < turn and self.advance():
+            pass
+
+    def render(self, hide: bool = False) -> None:
+        """Builds the whole screen for the current turn and paints it."""
+        match = self.match
+        match.simulation = False
+        match.buildDeckVisual()
+        if len(match.pile) > 0:
+            match.buildPileVisual()
+        for identity in match.turnList:
+            match.elements['P{}Turn'.format(identity[4:])] = ''
+            match.adjustCardAmount(identity)
+        if match.turn:
+            match.elements['P{}Turn'.format(match.turn[4:])] = '\033[93m'
+            match.elements['HName'] = match.handTitles[match.turn]
+            match.handPosition = 0
+            match.buildHandVisual(match.turn)
+        if self.finished:
+            if match.matchAbort:
+                match.elements['Console'] = 'Replay: Match Aborted After Turn {}'.format(self.turn)
+            else:
+                match.elements['Console'] = 'Replay: {} Wins on Turn {}'.format(match.players[match.winnerID].getName(), self.turn)
+        else:
+            match.elements['Console'] = "Replay: Turn {}, {}'s Turn".format(self.turn, match.players[match.turn].getName())
+        match.printScreen(hide)
+
+
+def recordSeededMatch(path: str, seed: int, numPlayers: int = 4, maxTurns: int = MAX_TURNS) -> None:
+    """
+    Plays a farm match from its seed and appends its record to a file.
+
+    Args:
+        path (str): The record file.
+        seed (int): The match seed, as used by `uno_farm`.
+        numPlayers (int): The number of computer players.
+        maxTurns (int): The turn limit after which the match is abandoned.
+    """
+    recorder = GameRecorder.open(path)
+    try:
+        playMatch(createSettings(numPlayers), maxTurns, random.Random(seed), recorder)
+    finally:
+        recorder.close()
+
+
+def main() -> None:
+    """Parses the command line and records, lists or replays matches."""
+    parser = argparse.ArgumentParser(description='Record and replay UNO matches.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    record = commands.add_parser('record', help='append the record of a seeded headless match')
+    record.add_argument('path')
+    record.add_argument('--seed', type=int, required=True, help='match seed, as printed by uno_farm')
+    record.add_argument('--players', type=int, default=4, help='number of computer players (2-10)')
+    record.add_argument('--max-turns', type=int, default=MAX_TURNS, help='turns before a match is abandoned')
+    dump = commands.add_parser('dump', help='print the events of a record')
+    dump.add_argument('path')
+    replay = commands.add_parser('replay', help='replay a recorded match')
+    replay.add_argument('path')
+    replay.add_argument('--game', type=int, default=0, help='which match in the record to replay')
+    replay.add_argument('--turn', type=int, default=1, help='turn to fast-forward to')
+    replay.add_argument('--delay', type=float, default=None, help='seconds between turns instead of waiting for Enter')
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        recordSeededMatch(args.path, args.seed, args.players, args.max_turns)
+    elif args.command == 'dump':
+        with open(args.path, 'rb') as stream:
+            for event in readRecord(stream):
+                if event[0] in ('begin', 'reshuffle'):
+                    print(event[0], *(list(item) if isinstance(item, bytes) else item for item in event[1:]))
+                else:
+                    print(*event)
+    else:
+        with open(args.path, 'rb') as stream:
+            replay = Replay(readRecord(stream), args.game)
+            replay.fastForward(args.turn)
+            replay.render()
+            while not replay.finished:
+                if args.delay is None:
+                    input()
+                else:
+                    time.sleep(args.delay)
+                replay.advance()
+                replay.render()
+
+
+if __name__ == "__main__":
+    main()
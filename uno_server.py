@@ -0,0 +1,373 @@
+"""
+Network play for the UNO game over local sockets.
+
+`UnoServer` hosts one game on the rules engine from `uno_engine.py` and
+accepts up to four terminal clients over TCP on localhost or over a Unix
+socket. Seats without a client are played by the engine's heuristic
+computer player. The server runs on asyncio, so computer turns, slow clients
+and new connections never hold each other up.
+
+Client and server exchange one JSON object per line. Clients send:
+    {"type": "join", "name": "Ada"}
+    {"type": "action", "action": 37}    An action from `uno_engine`.
+
+The server sends:
+    {"type": "welcome", "seat": 0, "players": [...], "computers": [...]}
+    {"type": "state", "changes": {...}} The fields of the client's view
+                                        that changed since its last state.
+    {"type": "error", "message": "..."}
+    {"type": "end", "winner": 0, "points": 120}
+
+A client's view holds the public state of the game (turn, color, value,
+direction, top card, deck size, hand sizes, winner) together with its own
+hand and, on its turn, its legal actions. Only the fields that changed are
+sent after each action, so most updates are a handful of bytes.
+
+Classes:
+    UnoServer: Hosts a game and its connections.
+    UnoClient: A terminal client for a hosted game.
+
+Functions:
+    main: The command-line entry point.
+
+Usage:
+    To host a game for two people, with computers in the other two seats,
+    and join it from two terminals:
+    $ python uno_server.py serve --humans 2 --players 4
+    $ python uno_server.py join --name Ada
+    $ python uno_server.py join --name Grace
+"""
+import argparse
+import asyncio
+import json
+import random
+from typing import Dict, List, Optional
+
+from uno import Card
+from uno_compact import COLORS, VALUES, decodeCard
+from uno_engine import DRAW, PASS, UnoEngine, colorAction, heuristicAction
+
+HOST = '127.0.0.1'
+PORT = 8765
+MAX_CLIENTS = 4
+
+
+def _encode(message: dict) -> bytes:
+    """Encodes a message as one line of JSON."""
+    return (json.dumps(message, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+class UnoServer:
+    """
+    Hosts one game for local clients.
+
+    Attributes:
+        numPlayers (int): The number of seats.
+        humans (int): The number of clients to wait for before dealing.
+        computerDelay (float): Seconds a computer pauses before acting.
+        engine (UnoEngine): The game being played.
+        names (List[str]): The name at each seat.
+        writers (Dict[int, asyncio.StreamWriter]): The connection of each
+            seat held by a client.
+        views (Dict[int, dict]): The last view sent to each client.
+    """
+
+    def __init__(self, numPlayers: int = 4, humans: int = 1, computerDelay: float = 0.5, rng=None):
+        """
+        Initializes a server.
+
+        Args:
+            numPlayers (int): The number of seats, from 2 to 10.
+            humans (int): How many clients must join before the deal.
+            computerDelay (float): Seconds a computer pauses before acting.
+            rng: A `random.Random` for the game. Defaults to a new one.
+        """
+        if not 1 <= humans <= min(numPlayers, MAX_CLIENTS):
+            raise ValueError('A game needs between 1 and {} clients'.format(min(numPlayers, MAX_CLIENTS)))
+        self.numPlayers = numPlayers
+        self.humans = humans
+        self.computerDelay = computerDelay
+        self.rng = random.Random() if rng is None else rng
+        self.engine: Optional[UnoEngine] = None
+        self.names = ['Computer {}'.format(seat + 1) for seat in range(numPlayers)]
+        self.writers: Dict[int, asyncio.StreamWriter] = {}
+        self.views: Dict[int, dict] = {}
+        self.actions: Dict[int, asyncio.Queue] = {seat: asyncio.Queue() for seat in range(numPlayers)}
+        self.connections = set()
+        self.ready = asyncio.Event()
+        self.finished = asyncio.Event()
+
+    async def serveTcp(self, host: str = HOST, port: int = PORT) -> None:
+        """Accepts clients over TCP and plays the game to its end."""
+        server = await asyncio.start_server(self.handleClient, host, port)
+        async with server:
+            await self.play()
+
+    async def serveUnix(self, path: str) -> None:
+        """Accepts clients over a Unix socket and plays the game to its end."""
+        server = await asyncio.start_unix_server(self.handleClient, path)
+        async with server:
+            await self.play()
+
+    async def handleClient(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Seats a connecting client and passes its actions to the game."""
+        seat = None
+        self.connections.add(asyncio.current_task())
+        try:
+            message = json.loads(await reader.readline() or 'null')
+            if not isinstance(message, dict) or message.get('type') != 'join':
+                writer.write(_encode({'type': 'error', 'message': 'Expected a join message'}))
+                return
+            if self.ready.is_set() or len(self.writers) >= self.humans:
+                writer.write(_encode({'type': 'error', 'message': 'The game is full'}))
+                return
+            seat = len(self.writers)
+            self.names[seat] = str(message.get('name') or 'Player {}'.format(seat + 1))[:11]
+            self.writers[seat] = writer
+            if len(self.writers) == self.humans:
+                self.ready.set()
+
+            async for line in reader:
+                try:
+                    message = json.loads(line)
+                    action = int(message['action'])
+                except (ValueError, KeyError, TypeError):
+                    await self.send(seat, {'type': 'error', 'message': 'Expected an action message'})
+                    continue
+                if self.engine is None or self.engine.state.turn != seat:
+                    await self.send(seat, {'type': 'error', 'message': 'It is not your turn'})
+                    continue
+                self.actions[seat].put_nowait(action)
+        finally:
+            if seat is not None and self.writers.get(seat) is writer:
+                del self.writers[seat]
+                self.views.pop(seat, None)
+                self.actions[seat].put_nowait(None)
+            writer.close()
+
+    async def send(self, seat: int, message: dict) -> None:
+        """Sends a message to the client at a seat, if it is still connected."""
+        writer = self.writers.get(seat)
+        if writer is None:
+            return
+        try:
+            writer.write(_encode(message))
+            await writer.drain()
+        except ConnectionError:
+            self.writers.pop(seat, None)
+
+    def buildView(self, seat: int) -> dict:
+        """Returns everything the client at a seat may see."""
+        state = self.engine.state
+        view = {
+            'turn': state.turn,
+            'color': COLORS[state.color],
+            'value': VALUES[state.value],
+            'direction': state.direction,
+            'top': state.pile.top() if len(state.pile) else None,
+            'deck': len(state.deck),
+            'hands': [len(hand) for hand in state.hands],
+            'choosingColor': state.choosingColor,
+            'winner': state.winner if state.winner >= 0 else None,
+            'hand': list(state.hands[seat]),
+        }
+        view['legal'] = self.engine.legalActions() if state.turn == seat and state.winner < 0 else []
+        return view
+
+    async def broadcast(self) -> None:
+        """Sends every client the parts of its view that changed."""
+        for seat in list(self.writers):
+            view = self.buildView(seat)
+            previous = self.views.get(seat, {})
+            changes = {key: value for key, value in view.items() if previous.get(key) != value}
+            self.views[seat] = view
+            if changes:
+                await self.send(seat, {'type': 'state', 'changes': changes})
+
+    async def nextAction(self, seat: int) -> int:
+        """Waits for the action of the player at a seat."""
+        if seat not in self.writers:
+            await asyncio.sleep(self.computerDelay)
+            return heuristicAction(self.engine)
+        action = await self.actions[seat].get()
+        if action is None:
+            return heuristicAction(self.engine)
+        return action
+
+    async def play(self) -> None:
+        """Waits for the clients, deals, and runs the game to its end."""
+        await self.ready.wait()
+        self.engine = UnoEngine(self.numPlayers, self.rng)
+        computers = [seat not in self.writers for seat in range(self.numPlayers)]
+        for seat in list(self.writers):
+            await self.send(seat, {'type': 'welcome', 'seat': seat, 'players': self.names, 'computers': computers})
+        await self.broadcast()
+
+        state = self.engine.state
+        while not state.isComplete():
+            seat = state.turn
+            action = await self.nextAction(seat)
+            try:
+                self.engine.step(action)
+            except ValueError as error:
+                await self.send(seat, {'type': 'error', 'message': str(error)})
+                continue
+            await self.broadcast()
+
+        for seat in list(self.writers):
+            await self.send(seat, {'type': 'end', 'winner': state.winner, 'points': state.points()})
+            self.writers[seat].close()
+        if self.connections:
+            await asyncio.wait(self.connections, timeout=1)
+        self.finished.set()
+
+
+class UnoClient:
+    """
+    A terminal client that shows a hosted game and sends the player's moves.
+
+    Attributes:
+        name (str): The name to join with.
+        auto (bool): Whether to play the first legal action automatically.
+        seat (Optional[int]): The client's seat, once welcomed.
+        players (List[str]): The names at every seat.
+        view (dict): The client's view, rebuilt from the state changes.
+    """
+
+    colorKeys = {'r': 'red', 'y': 'yellow', 'g': 'green', 'b': 'blue'}
+
+    def __init__(self, name: str, auto: bool = False):
+        """
+        Initializes a client.
+
+        Args:
+            name (str): The name to join with.
+            auto (bool): Whether to play without asking, for testing.
+        """
+        self.name = name
+        self.auto = auto
+        self.seat: Optional[int] = None
+        self.players: List[str] = []
+        self.view: dict = {}
+
+    async def connectTcp(self, host: str = HOST, port: int = PORT) -> Optional[int]:
+        """Joins a game over TCP and plays it; returns the winning seat."""
+        reader, writer = await asyncio.open_connection(host, port)
+        return await self.run(reader, writer)
+
+    async def connectUnix(self, path: str) -> Optional[int]:
+        """Joins a game over a Unix socket and plays it; returns the winning seat."""
+        reader, writer = await asyncio.open_unix_connection(path)
+        return await self.run(reader, writer)
+
+    async def run(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Optional[int]:
+        """Plays a game over an open connection."""
+        writer.write(_encode({'type': 'join', 'name': self.name}))
+        await writer.drain()
+        winner = None
+        async for line in reader:
+            message = json.loads(line)
+            if message['type'] == 'welcome':
+                self.seat = message['seat']
+                self.players = message['players']
+            elif message['type'] == 'error':
+                print('\033[91m{}\033[0m'.format(message['message']))
+            elif message['type'] == 'end':
+                winner = message['winner']
+                print('{} wins {} points!'.format(self.players[winner], message['points']))
+                break
+            elif message['type'] == 'state':
+                self.view.update(message['changes'])
+                if not self.auto:
+                    print(self.render())
+                if self.view['legal']:
+                    action = await self.chooseAction()
+                    writer.write(_encode({'type': 'action', 'action': action}))
+                    await writer.drain()
+        writer.close()
+        return winner
+
+    def render(self) -> str:
+        """Returns the client's view as text."""
+        view = self.view
+        lines = []
+        for seat, name in enumerate(self.players):
+            marker = '>' if seat == view['turn'] else ' '
+            lines.append('{} {:<12} {:>3} cards'.format(marker, name, view['hands'][seat]))
+        if view['top'] is not None:
+            lines.append('Pile: {}  Color: {}  Deck: {} cards'.format(
+                decodeCard(view['top']), view['color'], view['deck']))
+        cards = [decodeCard(code) for code in view['hand']]
+        rows = [card.getRows() for card in cards]
+        for rowNum in range(4):
+            lines.append(' '.join(row[rowNum] for row in rows))
+        lines.append(' '.join('({:>2})'.format(index) for index in range(len(cards))))
+        return '\n'.join(lines)
+
+    async def chooseAction(self) -> int:
+        """Asks the player for one of the legal actions."""
+        legal = self.view['legal']
+        if self.auto:
+            return legal[0]
+        loop = asyncio.get_running_loop()
+        while True:
+            if self.view['choosingColor']:
+                prompt = 'Wild Card! Specify a Color: (B)lue, (R)ed, (G)reen, (Y)ellow: '
+            else:
+                prompt = 'Select a card, (D)raw, or Pas(s): '
+            entry = (await loop.run_in_executor(None, input, prompt)).strip().lower()
+            action = self.parseEntry(entry)
+            if action in legal:
+                return action
+            print('\033[91m{} is not a valid selection.\033[0m'.format(entry))
+
+    def parseEntry(self, entry: str) -> Optional[int]:
+        """Converts a typed entry into an action, or None."""
+        if self.view['choosingColor']:
+            color = self.colorKeys.get(entry[:1])
+            return None if color is None else colorAction(Card.codeColors.index(color))
+        if entry == 'd':
+            return DRAW
+        if entry == 's':
+            return PASS
+        if entry.isnumeric() and int(entry) < len(self.view['hand']):
+            return self.view['hand'][int(entry)]
+        return None
+
+
+def main() -> None:
+    """Parses the command line and hosts or joins a game."""
+    parser = argparse.ArgumentParser(description='Play UNO over local sockets.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help='host a game')
+    serve.add_argument('--players', type=int, default=4, help='number of seats (2-10)')
+    serve.add_argument('--humans', type=int, default=1, help='clients to wait for before dealing')
+    serve.add_argument('--delay', type=float, default=0.5, help='seconds a computer pauses before acting')
+    serve.add_argument('--seed', type=int, default=None, help='seed for the game')
+    join = commands.add_parser('join', help='join a hosted game')
+    join.add_argument('--name', default='Player', help='name to play under')
+    join.add_argument('--auto', action='store_true', help='play the first legal move without asking')
+    for command in (serve, join):
+        command.add_argument('--host', default=HOST, help='address to use on localhost')
+        command.add_argument('--port', type=int, default=PORT, help='TCP port')
+        command.add_argument('--unix', default=None, metavar='PATH', help='use a Unix socket instead of TCP')
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        async def host():
+            server = UnoServer(args.players, args.humans, args.delay, random.Random(args.seed))
+            if args.unix:
+                await server.serveUnix(args.unix)
+            else:
+                await server.serveTcp(args.host, args.port)
+        asyncio.run(host())
+    else:
+        client = UnoClient(args.name, args.auto)
+        if args.unix:
+            asyncio.run(client.connectUnix(args.unix))
+        else:
+            asyncio.run(client.connectTcp(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+A headless tournament runner for the UNO game.
+
+This module plays many all-computer UNO matches back-to-back using the
+`Match` class from `uno.py` in its `computerSimulation` mode, so no screens
+are drawn and no prompts wait for Enter. At the end it reports how often
+each `ComputerPlayer` won and how many points it collected.
+
+Classes:
+    TournamentResult: Accumulates wins, points and match lengths per player.
+
+Functions:
+    createSettings: Builds a `GameSettings` object seated with computers.
+    playMatch: Plays a single headless match to completion.
+    runTournament: Plays a number of matches and returns the results.
+    main: The command-line entry point.
+
+Usage:
+    To run 10,000 four-player matches from the command line:
+    $ python uno_tournament.py 10000 --players 4
+"""
+import argparse
+import random
+import time
+from typing import Dict, List, Optional
+
+from uno import ComputerPlayer, GameSettings, Match
+from uno_compact import decksFor
+
+# Matches longer than this are abandoned so a stalemate cannot hang a run.
+MAX_TURNS = 5000
+
+
+class TournamentResult:
+    """
+    Accumulates the outcome of many matches.
+
+    Attributes:
+        names (List[str]): The player names, in seating order.
+        wins (Dict[str, int]): Matches won by each player.
+        points (Dict[str, int]): Points collected by each player.
+        matches (int): The number of matches played.
+        aborted (int): Matches abandoned after `MAX_TURNS` turns.
+        turns (int): The total number of turns across all matches.
+        elapsed (float): Wall-clock seconds spent playing.
+    """
+
+    def __init__(self, names: List[str]):
+        """
+        Initializes an empty result for the given players.
+
+        Args:
+            names (List[str]): The player names, in seating order.
+        """
+        self.names = list(names)
+        self.wins: Dict[str, int] = {name: 0 for name in self.names}
+        self.points: Dict[str, int] = {name: 0 for name in self.names}
+        self.matches = 0
+        self.aborted = 0
+        self.turns = 0
+        self.elapsed = 0.0
+
+    def record(self, winner: Optional[str], points: int, turns: int) -> None:
+        """
+        Records the outcome of a single match.
+
+        Args:
+            winner (Optional[str]): The winner's name, or None if aborted.
+            points (int): The points the winner collected.
+            turns (int): The number of turns the match lasted.
+        """
+        self.matches += 1
+        self.turns += turns
+        if winner is None:
+            self.aborted += 1
+        else:
+            self.wins[winner] += 1
+            self.points[winner] += points
+
+    def merge(self, other: 'TournamentResult') -> None:
+        """
+        Adds the counts from another result for the same players.
+
+        Args:
+            other (TournamentResult): The result to fold into this one.
+        """
+        if other.names != self.names:
+            raise ValueError('Cannot merge results for different players')
+        for name in self.names:
+            self.wins[name] += other.wins[name]
+            self.points[name] += other.points[name]
+        self.matches += other.matches
+        self.aborted += other.aborted
+        self.turns += other.turns
+
+    def winRate(self, name: str) -> float:
+        """Returns the fraction of matches won by a player."""
+        if self.matches == 0:
+            return 0.0
+        return self.wins[name] / self.matches
+
+    def matchesPerMinute(self) -> float:
+        """Returns the playing speed of the tournament."""
+        if self.elapsed == 0:
+            return 0.0
+        return self.matches / self.elapsed * 60
+
+    def summary(self) -> str:
+        """Returns a printable table of the results."""
+        lines = ['{:<12} {:>8} {:>8} {:>12} {:>10}'.format('Player', 'Wins', 'Win %', 'Points', 'Pts/Match')]
+        for name in self.names:
+            perMatch = self.points[name] / self.matches if self.matches else 0.0
+            lines.append('{:<12} {:>8} {:>7.2f}% {:>12} {:>10.2f}'.format(
+                name, self.wins[name], self.winRate(name) * 100, self.points[name], perMatch))
+        averageTurns = self.turns / self.matches if self.matches else 0.0
+        lines.append('')
+        lines.append('{} matches ({} aborted), {:.1f} turns per match'.format(self.matches, self.aborted, averageTurns))
+        lines.append('{:.2f}s elapsed, {:,.0f} matches per minute'.format(self.elapsed, self.matchesPerMinute()))
+        return '\n'.join(lines)
+
+
+def createSettings(numPlayers: int = 4, numDecks: Optional[int] = None) -> GameSettings:
+    """
+    Builds game settings with computer players and simulation enabled.
+
+    Args:
+        numPlayers (int): The number of computer players, from 2 to 10.
+        numDecks (Optional[int]): How many decks to shuffle together.
+            Defaults to enough for the table, from `uno_compact.decksFor`.
+
+    Returns:
+        GameSettings: Settings ready to be passed to `Match`.
+    """
+    if not 2 <= numPlayers <= len(GameSettings.playerIdentities):
+        raise ValueError('A tournament needs between 2 and {} players'.format(len(GameSettings.playerIdentities)))
+    gs = GameSettings()
+    for _ in range(numPlayers):
+        gs.addPlayer(ComputerPlayer(gs.getComputerName()))
+    gs.numDecks = decksFor(numPlayers) if numDecks is None else numDecks
+    gs.computerSimulation = True
+    gs.displayEffects = False
+    gs.finalizePlayers()
+    return gs
+
+
+def playMatch(gs: GameSettings, maxTurns: int = MAX_TURNS, rng: Optional[random.Random] = None, recorder=None):
+    """
+    Plays one headless match to completion.
+
+    Args:
+        gs (GameSettings): Finalized settings with computer players.
+        maxTurns (int): The turn limit after which the match is abandoned.
+        rng (Optional[random.Random]): The source of randomness for the
+            match. Defaults to the global `random` module.
+        recorder: An optional `uno_record.GameRecorder` to log the match to.
+
+    Returns:
+        tuple: The updated settings, the winner's name (or None if the match
+        was abandoned), the points won, and the number of turns played.
+    """
+    match = Match(gs, rng, recorder)
+    match.begin()
+    turns = 0
+    while not match.isComplete():
+        if turns >= maxTurns:
+            match.matchAbort = True
+            break
+        match.nextTurn()
+        turns += 1
+
+    winner = None
+    points = 0
+    if not match.matchAbort:
+        player = match.getPlayer(match.winnerID)
+        before = player.getPoints()
+        winner = player.getName()
+    gs = match.end(gs)
+    if winner is not None:
+        points = player.getPoints() - before
+    gs.finalizePlayers()
+    return gs, winner, points, turns
+
+
+def runTournament(numMatches: int, numPlayers: int = 4, maxTurns: int = MAX_TURNS,
+                  numDecks: Optional[int] = None) -> TournamentResult:
+    """
+    Plays a number of headless matches between the same computer players.
+
+    Args:
+        numMatches (int): How many matches to play.
+        numPlayers (int): The number of computer players, from 2 to 10.
+        maxTurns (int): The turn limit after which a match is abandoned.
+        numDecks (Optional[int]): How many decks to shuffle together.
+
+    Returns:
+        TournamentResult: The accumulated wins, points and timings.
+    """
+    gs = createSettings(numPlayers, numDecks)
+    result = TournamentResult([player.getName() for player in gs.playerStaging])
+    start = time.perf_counter()
+    for _ in range(numMatches):
+        gs, winner, points, turns = playMatch(gs, maxTurns)
+        result.record(winner, points, turns)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def main() -> None:
+    """Parses the command line, runs the tournament and prints the results."""
+    parser = argparse.ArgumentParser(description='Run a headless all-computer UNO tournament.')
+    parser.add_argument('matches', type=int, nargs='?', default=1000, help='number of matches to play')
+    parser.add_argument('--players', type=int, default=4, help='number of computer players (2-10)')
+    parser.add_argument('--max-turns', type=int, default=MAX_TURNS, help='turns before a match is abandoned')
+    parser.add_argument('--decks', type=int, default=None, help='decks to shuffle together (default: enough for the table)')
+    args = parser.parse_args()
+
+    result = runTournament(args.matches, args.players, args.max_turns, args.decks)
+    print(result.summary())
+
+
+if __name__ == "__main__":
+    main()